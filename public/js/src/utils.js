@@ -42,6 +42,8 @@ export function sanitizeUrl(url) {
     cleaned = cleaned.replace(/^file:/i, '');
     cleaned = cleaned.replace(/[`"'\\]/g, '');
     if (/^https?:\/\//i.test(cleaned)) return cleaned;
+    // Same-origin paths (e.g. locally cached images under /images/haberler/), not protocol-relative //host
+    if (/^\/(?![\/\\])/.test(cleaned)) return cleaned;
     return '#';
 }
 
@@ -0,0 +1,112 @@
+"""
+Makale çıkarım benchmark'ı: eski BeautifulSoup (html.parser) yolu ile
+extract.py'deki tek ayrıştırmalı lxml motorunu fixture sayfaları üzerinde karşılaştırır
+(kayıtlı set varsa o, yoksa sentetik set; bkz. fixture_sets.py).
+
+Kullanım: python scraper/benchmarks/bench_extract.py [--repeat 20] [--fixtures auto]
+"""
+import argparse
+import os
+import sys
+import time
+
+from bs4 import BeautifulSoup
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+import fixture_sets  # noqa: E402
+from extract import parse_article_html  # noqa: E402
+
+# Sentetik fixture dosya adındaki site -> sahte makale URL'si (site'e özel dallar için)
+SITE_URLS = {
+    "livemint": "https://www.livemint.com/technology/example-story-111.html",
+}
+
+LEGACY_SELECTORS = [
+    'article p', '.entry-content p', '.article-body p', '.post-content p', 'main p',
+    '[itemprop="articleBody"] p', '#content p', '.c-article-content p', '.content p'
+]
+
+
+def legacy_extract(content, url):
+    """Eski get_article_full_content + get_article_details ayrıştırma adımlarının kopyası."""
+    sp = BeautifulSoup(content, 'html.parser')
+    og_img = sp.find('meta', property='og:image')
+    img = og_img['content'] if og_img and og_img.get('content') else None
+    paras = []
+    if "livemint.com" in url:
+        # Eski kod aynı sayfayı ikinci kez indirip yeniden ayrıştırıyordu
+        soup = BeautifulSoup(content.decode('utf-8'), "html.parser")
+        for p in soup.find_all('p'):
+            t = p.get_text().strip()
+            if t:
+                paras.append(t)
+    else:
+        for sel in LEGACY_SELECTORS:
+            found = sp.select(sel)
+            if found:
+                for p in found:
+                    t = p.get_text().strip()
+                    if len(t) > 40:
+                        paras.append(t)
+                if len(paras) > 2:
+                    break
+    description = None
+    if paras:
+        description = " ".join(paras[:2])
+    if not img or not description:
+        # get_article_details: sayfayı tekrar çekip ayrıştırır
+        soup = BeautifulSoup(content, 'html.parser')
+        og_desc = soup.find('meta', property='og:description')
+        if og_desc and og_desc.get('content'):
+            description = og_desc['content'].strip()
+    return img, paras, description
+
+
+def load_fixtures(fixtures_dir):
+    # Kayıtlı sette routes.json her makalenin gerçek URL'sini tutar
+    real_urls = {route['file']: route['url'] for route in fixture_sets.load_routes(fixtures_dir)['routes']
+                 if "*" not in route['url']}
+    articles_dir = os.path.join(fixtures_dir, "articles")
+    fixtures = []
+    for name in sorted(os.listdir(articles_dir)):
+        if not name.endswith(".html"):
+            continue
+        site = name.split("_")[0]
+        url = real_urls.get(f"articles/{name}") or SITE_URLS.get(site, f"https://www.{site}.com/2026/01/01/example-story/")
+        with open(os.path.join(articles_dir, name), "rb") as f:
+            fixtures.append((name, url, f.read()))
+    return fixtures
+
+
+def timed(func, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func()
+    return (time.perf_counter() - start) / repeat, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    fixture_sets.add_argument(parser)
+    args = parser.parse_args()
+
+    fixtures_dir = fixture_sets.resolve(args.fixtures)
+    fixture_sets.announce(fixtures_dir)
+    fixtures = load_fixtures(fixtures_dir)
+    print(f"{'sayfa':<28} {'eski (ms)':>10} {'lxml (ms)':>10} {'hızlanma':>9}  paragraflar")
+    total_old = total_new = 0.0
+    for name, url, content in fixtures:
+        old_time, (old_img, old_paras, _) = timed(lambda: legacy_extract(content, url), args.repeat)
+        new_time, new = timed(lambda: parse_article_html(content, url), args.repeat)
+        same = "aynı" if (old_img, old_paras) == (new['image'], new['paragraphs']) else "FARKLI"
+        total_old += old_time
+        total_new += new_time
+        print(f"{name:<28} {old_time * 1000:>10.2f} {new_time * 1000:>10.2f} {old_time / new_time:>8.1f}x  {len(new['paragraphs'])} ({same})")
+    print(f"{'TOPLAM':<28} {total_old * 1000:>10.2f} {total_new * 1000:>10.2f} {total_old / total_new:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""
+Feed ayrıştırma benchmark'ı: fixture RSS/Atom feed'lerinde feedparser ile
+feeds.iter_feed_items (lxml iterparse, akış halinde) karşılaştırılır.
+
+Her feed için ilk --limit öğenin başlık/bağlantı/görsel/özet alanları iki
+yöntemle de çıkarılır; süre, tracemalloc ile tepe bellek ve bağlantıların
+aynı olup olmadığı raporlanır. Feed'ler kayıtlı setten (yoksa sentetik setten,
+bkz. fixture_sets.py) okunur. Tek feed'ler küçük olduğundan, öğeleri --scale kez
+çoğaltılmış büyük bir gamespot feed'i de ölçülür; erken durmanın (limit ve
+bilinen haberler) etkisi burada görünür.
+
+Kullanım: python scraper/benchmarks/bench_feeds.py [--repeat 20] [--limit 30] [--scale 100] [--fixtures auto] [--json sonuc.json]
+"""
+import argparse
+import glob
+import json
+import os
+import re
+import sys
+import time
+import tracemalloc
+
+import feedparser
+from bs4 import BeautifulSoup
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+import fixture_sets  # noqa: E402
+from feeds import iter_feed_items  # noqa: E402
+
+
+def parse_feedparser(content, limit):
+    """Eski yol: tüm feed ayrıştırılır, ilk limit öğenin alanları çıkarılır."""
+    feed = feedparser.parse(content)
+    items = []
+    for entry in feed.entries[:limit]:
+        summary = entry.get('summary') or entry.get('description') or ""
+        image = None
+        if entry.get('media_content'):
+            image = entry.media_content[0].get('url')
+        elif entry.get('media_thumbnail'):
+            image = entry.media_thumbnail[0].get('url')
+        items.append({
+            'title': entry.get('title'),
+            'url': entry.get('link'),
+            'image': image,
+            'summary': BeautifulSoup(summary, 'html.parser').get_text(separator=' ', strip=True),
+        })
+    return items
+
+
+def parse_streaming(content, limit, stop_at=None):
+    return list(iter_feed_items(content, limit=limit, stop_at=stop_at))
+
+
+def scale_feed(content, times):
+    """Feed'in öğelerini times kez tekrarlar (bağlantılar benzersiz kalır)."""
+    text = content.decode("utf-8")
+    items = re.findall(r"<item\b.*?</item>", text, flags=re.DOTALL)
+    if not items:
+        return content
+    body = "".join(
+        re.sub(r"(<link>[^<]*)</link>", rf"\1?n={i}</link>", item)
+        for i in range(times) for item in items
+    )
+    start = text.index(items[0])
+    end = text.rindex(items[-1]) + len(items[-1])
+    return (text[:start] + body + text[end:]).encode("utf-8")
+
+
+def measure(func, repeat):
+    """Dönüş: (sonuç, çalıştırma başına ms, tepe KiB)"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func()
+    elapsed = (time.perf_counter() - start) / repeat
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, elapsed * 1000, peak / 1024
+
+
+def bench_feed(name, content, repeat, limit, known=None):
+    old, old_ms, old_peak = measure(lambda: parse_feedparser(content, limit), repeat)
+    new, new_ms, new_peak = measure(lambda: parse_streaming(content, limit), repeat)
+    row = {
+        'name': name, 'kib': len(content) / 1024, 'items': len(new),
+        'feedparser_ms': old_ms, 'stream_ms': new_ms, 'feedparser_peak_kib': old_peak, 'stream_peak_kib': new_peak,
+        'same_urls': [i['url'] for i in old] == [i['url'] for i in new],
+    }
+    if known is not None:
+        # Önceki taramada ilk öğelerin hepsi kaydedilmişse: bilinen haberlerde erken durma
+        _, row['stream_known_ms'], _ = measure(lambda: parse_streaming(content, limit, known.__contains__), repeat)
+    return row
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--limit", type=int, default=30)
+    parser.add_argument("--scale", type=int, default=100, help="büyük feed için öğe çoğaltma katsayısı")
+    fixture_sets.add_argument(parser)
+    parser.add_argument("--json", help="sonuçları bu dosyaya JSON olarak yazar (regresyon takibi için)")
+    args = parser.parse_args()
+
+    fixtures_dir = fixture_sets.resolve(args.fixtures)
+    label = fixture_sets.announce(fixtures_dir)
+    rows = []
+    for path in sorted(glob.glob(os.path.join(fixtures_dir, "feeds", "*.xml"))):
+        with open(path, "rb") as f:
+            content = f.read()
+        name = os.path.splitext(os.path.basename(path))[0]
+        known = {item['url'] for item in iter_feed_items(content)}
+        rows.append(bench_feed(name, content, args.repeat, args.limit, known))
+        if args.scale > 1 and name == "gamespot":
+            big = scale_feed(content, args.scale)
+            rows.append(bench_feed(f"{name} x{args.scale}", big, max(1, args.repeat // 10), args.limit))
+
+    print(f"{'feed':<20} {'KiB':>7} {'öğe':>4} {'feedparser (ms)':>16} {'akış (ms)':>10} {'bilinen (ms)':>13} "
+          f"{'fp tepe (KiB)':>14} {'akış tepe (KiB)':>16} {'url':>4}")
+    for row in rows:
+        known_ms = f"{row['stream_known_ms']:.2f}" if 'stream_known_ms' in row else "-"
+        print(f"{row['name']:<20} {row['kib']:>7.0f} {row['items']:>4} {row['feedparser_ms']:>16.2f} {row['stream_ms']:>10.2f} "
+              f"{known_ms:>13} {row['feedparser_peak_kib']:>14.0f} {row['stream_peak_kib']:>16.0f} "
+              f"{'aynı' if row['same_urls'] else 'FARKLI':>4}")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({'repeat': args.repeat, 'limit': args.limit, 'fixtures': label, 'python': sys.version.split()[0],
+                       'results': rows}, f, ensure_ascii=False, indent=2)
+    if not all(row['same_urls'] for row in rows):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+fix_encoding benchmark'ı: eski uygulama (her metinde 14 ardışık str.replace)
+ile mojibake.py (hızlı ön kontrol, yalnızca bozuk metinde str.replace zinciri),
+kayıtlı makale gövdeleri üzerinde karşılaştırılır.
+
+Her gövde üç biçimde ölçülür: temiz ASCII/İngilizce metin, temiz Türkçe metin
+ve UTF-8 -> Windows-1252 bozulması uygulanmış metin. Kazanç temiz metinlerdedir;
+bozuk metinde iki yol aynı işi yapar (~1x). Daha önce denenen tek geçişli
+derlenmiş desen bozuk metinde ~0.8x (daha yavaş) ölçüldüğü için kullanılmıyor.
+
+Kullanım: python scraper/benchmarks/bench_fix_encoding.py [--repeat 200]
+"""
+import argparse
+import os
+import sys
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+from extract import parse_article_html  # noqa: E402
+from mojibake import REPLACEMENTS, fix_encoding  # noqa: E402
+from bench_extract import load_fixtures  # noqa: E402
+
+TURKISH_SAMPLE = (
+    "Yapay zekâ şirketleri, yeni düzenlemelerin ardından güvenlik testlerini "
+    "sıkılaştırdı; uzmanlar “şeffaflık” çağrısında bulunuyor — ayrıntılar haberde… "
+)
+
+
+def legacy_fix_encoding(text):
+    """Eski scraper.py / cleanup_json.py uygulamasının kopyası."""
+    if not text:
+        return text
+    for old, new in REPLACEMENTS.items():
+        text = text.replace(old, new)
+    return text
+
+
+def garble(text):
+    """UTF-8 metni Windows-1252 olarak okunmuş gibi bozar."""
+    return text.encode("utf-8").decode("cp1252", errors="replace")
+
+
+def load_bodies():
+    bodies = []
+    for name, url, content in load_fixtures():
+        paragraphs = parse_article_html(content, url)['paragraphs']
+        bodies.append((name, "\n\n".join(paragraphs)))
+    return bodies
+
+
+def timed(func, texts, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for text in texts:
+            func(text)
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    bodies = [body for _, body in load_bodies()]
+    turkish = [TURKISH_SAMPLE * 20 + body for body in bodies]
+    variants = [
+        ("temiz (ASCII)", bodies),
+        ("temiz (Türkçe)", turkish),
+        ("bozuk (cp1252)", [garble(text) for text in turkish]),
+    ]
+
+    print(f"{'metin':<16} {'eski (µs)':>10} {'yeni (µs)':>10} {'hızlanma':>9}  çıktı")
+    for label, texts in variants:
+        same = all(legacy_fix_encoding(t) == fix_encoding(t) for t in texts)
+        old = timed(legacy_fix_encoding, texts, args.repeat) / len(texts)
+        new = timed(fix_encoding, texts, args.repeat) / len(texts)
+        print(f"{label:<16} {old * 1e6:>10.1f} {new * 1e6:>10.1f} {old / new:>8.1f}x  {'aynı' if same else 'FARKLI'}")
+
+
+if __name__ == "__main__":
+    main()
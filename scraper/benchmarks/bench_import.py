@@ -0,0 +1,85 @@
+"""
+Başlangıç süresi benchmark'ı: scraper modülünü ve WSGI girişini temiz bir
+alt süreçte içe aktarır, süre dağılımını ve hangi ağır bağımlılıkların
+yüklendiğini raporlar.
+
+Ağır bağımlılıkların (genai, bs4, feedparser, lxml, requests) içe aktarmada
+yüklenmemesi beklenir; biri yüklenirse regresyon olarak işaretlenir ve komut
+sıfırdan farklı kodla çıkar. --baseline ile aynı ölçüm bu modüller önceden
+yüklenerek tekrarlanır (eski, tepede içe aktaran davranışın yaklaşık maliyeti).
+
+Kullanım: python scraper/benchmarks/bench_import.py [--repeat 10] [--baseline]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+SCRAPER_DIR = os.path.dirname(BENCH_DIR)
+
+HEAVY_MODULES = ("google.generativeai", "bs4", "feedparser", "lxml.etree", "lxml.html", "requests", "mysql.connector")
+
+# Alt süreçte çalışan ölçüm: (isteğe bağlı ön yükleme +) içe aktarma + WSGI sağlık kontrolü yanıtı
+PROBE = """
+import json, sys, time
+sys.path.insert(0, {scraper_dir!r})
+preload = {preload!r}
+start = time.perf_counter()
+for name in preload:
+    try:
+        __import__(name)
+    except ImportError:
+        pass
+import scraper
+imported = time.perf_counter()
+scraper.application({{}}, lambda status, headers: None)
+done = time.perf_counter()
+print(json.dumps({{
+    'import_ms': (imported - start) * 1000,
+    'wsgi_ms': (done - imported) * 1000,
+    'heavy': [m for m in {heavy!r} if m in sys.modules and m not in preload],
+}}))
+"""
+
+
+def probe(preload=()):
+    """Temiz bir yorumlayıcıda tek ölçüm; süreç başlatma dahil toplam süre de döner."""
+    code = PROBE.format(scraper_dir=SCRAPER_DIR, preload=list(preload), heavy=list(HEAVY_MODULES))
+    start = time.perf_counter()
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, cwd=SCRAPER_DIR)
+    result = json.loads(out.stdout.strip().splitlines()[-1])
+    result['process_ms'] = (time.perf_counter() - start) * 1000
+    return result
+
+
+def summarize(label, runs):
+    imports = [r['import_ms'] for r in runs]
+    processes = [r['process_ms'] for r in runs]
+    print(f"{label:<10} import: medyan {statistics.median(imports):8.1f} ms, en iyi {min(imports):8.1f} ms | "
+          f"süreç: medyan {statistics.median(processes):8.1f} ms | wsgi: {statistics.median(r['wsgi_ms'] for r in runs):.3f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--baseline", action="store_true", help="ağır modüller önceden yüklenmiş karşılaştırma ölçümü")
+    args = parser.parse_args()
+
+    runs = [probe() for _ in range(args.repeat)]
+    summarize("lazy", runs)
+    if args.baseline:
+        summarize("eager", [probe(HEAVY_MODULES) for _ in range(args.repeat)])
+
+    heavy = sorted({m for r in runs for m in r['heavy']})
+    if heavy:
+        print(f"UYARI: içe aktarmada yüklenen ağır modüller: {', '.join(heavy)}")
+        sys.exit(1)
+    print("İçe aktarmada ağır modül yüklenmedi.")
+
+
+if __name__ == "__main__":
+    main()
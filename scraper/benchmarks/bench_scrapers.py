@@ -0,0 +1,235 @@
+"""
+Çevrimdışı scraper benchmark'ı: sources.json'daki her kaynağın scrape fonksiyonu
+ve makale çıkarıcısı, kayıtlı liste sayfaları / feed'ler / makale HTML'leri
+üzerinde çalıştırılır.
+
+İstekler yerel bir HTTP sunucusuna yönlendirilir (<set>/routes.json), ağ
+erişimi gerekmez. Her kaynak için çalışma süresi, HTTP dışında kalan ayrıştırma
+süresi, tracemalloc ile tepe bellek ve saniyedeki öğe sayısı raporlanır.
+Kayıtlı sette öğe döndürmeyen kaynak, seçicilerinin gerçek sayfayla artık
+eşleşmediğini gösterir; bu durumda çıkış kodu 1'dir (bkz. fixture_sets.py).
+
+Kullanım: python scraper/benchmarks/bench_scrapers.py [--repeat 5] [--source wired] [--fixtures auto] [--json sonuc.json]
+"""
+import argparse
+import fnmatch
+import json
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import quote, unquote
+
+from requests.adapters import HTTPAdapter
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+import fixture_sets  # noqa: E402
+import http_client  # noqa: E402
+import scraper  # noqa: E402
+from extract import parse_article_html  # noqa: E402
+from strategy_cache import ExtractionStrategyCache  # noqa: E402
+from url_index import SeenUrlIndex  # noqa: E402
+
+CONTENT_TYPES = {".html": "text/html; charset=utf-8", ".xml": "application/xml; charset=utf-8"}
+
+
+class FixtureServer:
+    """Gelen isteğin orijinal URL'sini routes.json'a göre bir fixture dosyasıyla yanıtlayan yerel sunucu."""
+
+    def __init__(self, routes, fixtures_dir):
+        self.routes = routes
+        self.fixtures_dir = fixtures_dir
+        self._bodies = {}
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                found = server.lookup(unquote(self.path[1:]))
+                if found is None:
+                    self.send_response(404)
+                    self.end_headers()
+                    return
+                body, content_type = found
+                self.send_response(200)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.httpd.daemon_threads = True
+        self.port = self.httpd.server_address[1]
+
+    def lookup(self, url):
+        for route in self.routes:
+            if fnmatch.fnmatchcase(url, route['url']):
+                path = route['file']
+                if path not in self._bodies:
+                    with open(os.path.join(self.fixtures_dir, path), "rb") as f:
+                        self._bodies[path] = f.read()
+                return self._bodies[path], CONTENT_TYPES.get(os.path.splitext(path)[1], "application/octet-stream")
+        return None
+
+    def start(self):
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+class LocalAdapter(HTTPAdapter):
+    """Tüm http/https isteklerini yerel fixture sunucusuna yönlendirir, HTTP'de geçen süreyi toplar."""
+
+    def __init__(self, port):
+        super().__init__()
+        self.port = port
+        self.http_time = 0.0
+        self.requests = 0
+
+    def send(self, request, **kwargs):
+        request.url = f"http://127.0.0.1:{self.port}/{quote(request.url, safe='')}"
+        start = time.perf_counter()
+        try:
+            return super().send(request, **kwargs)
+        finally:
+            self.http_time += time.perf_counter() - start
+            self.requests += 1
+
+
+def isolate_caches(tmp_dir):
+    """
+    Önbellekler ve beklemeler ölçümü bozmasın: sayfa ve feed önbelleği kapalı,
+    strateji kaydı ve görülen URL indeksi geçici dizinde (bilinen haberlerde feed
+    erken durmasın), makale istekleri arası bekleme yok.
+    """
+    scraper.ARTICLE_FETCH_DELAY = None
+    http_client.page_cache = None
+    http_client.timeout_resolver = None
+    scraper.feed_cache.enabled = False
+    scraper.strategy_cache = ExtractionStrategyCache(os.path.join(tmp_dir, "strategies.json"))
+    scraper.seen_urls = SeenUrlIndex(os.path.join(tmp_dir, "seen_urls.txt"), os.path.join(tmp_dir, "haberler.json"))
+    scraper.sqlite_store = None
+
+
+def measure(func, adapter, repeat):
+    """
+    func'ı repeat kez (tracemalloc kapalı) süre için, bir kez de bellek için çalıştırır.
+    Dönüş: (sonuç, toplam_sn, http_dışı_sn, tepe_bayt, istek_sayısı) — süreler çalıştırma başına
+    """
+    adapter.http_time, adapter.requests = 0.0, 0
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func()
+    total = (time.perf_counter() - start) / repeat
+    parse = total - adapter.http_time / repeat
+    requests_per_run = adapter.requests // repeat
+
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, total, parse, peak, requests_per_run
+
+
+def bench_sources(routes, adapter, repeat, only=None):
+    rows = []
+    for key, url in routes['sources'].items():
+        if only and key not in only:
+            continue
+        scrape = scraper.source_registry.scraper_for(url)
+        if scrape is None:
+            continue
+        items, total, parse, peak, reqs = measure(lambda: scrape(url), adapter, repeat)
+        rows.append({
+            'name': f"scrape:{key}", 'items': len(items or []), 'requests': reqs,
+            'total_ms': total * 1000, 'parse_ms': parse * 1000, 'peak_kib': peak / 1024,
+            'items_per_sec': len(items or []) / total if total else 0.0
+        })
+    return rows
+
+
+def bench_extractors(routes, fixtures_dir, adapter, repeat, only=None):
+    rows = []
+    seen = set()
+    for route in routes['routes']:
+        if not route['file'].startswith("articles/"):
+            continue
+        key = os.path.basename(route['file']).split("_")[0]
+        if (only and key not in only) or key in seen:
+            continue
+        # Kayıtlı sette kaynak başına birden çok makale olabilir; ilki ölçülür
+        seen.add(key)
+        url = route['url'].replace("*", "2026/01/01/example-story/")
+        _, total, parse, peak, reqs = measure(lambda: scraper.get_article_full_content(url), adapter, repeat)
+        rows.append({
+            'name': f"extract:{key}", 'items': 1, 'requests': reqs,
+            'total_ms': total * 1000, 'parse_ms': parse * 1000, 'peak_kib': peak / 1024,
+            'items_per_sec': 1 / total if total else 0.0
+        })
+        # Ağ katmanı olmadan yalnızca ayrıştırma
+        with open(os.path.join(fixtures_dir, route['file']), "rb") as f:
+            content = f.read()
+        _, total, _, peak, _ = measure(lambda: parse_article_html(content, url), adapter, repeat)
+        rows.append({
+            'name': f"parse:{key}", 'items': 1, 'requests': 0,
+            'total_ms': total * 1000, 'parse_ms': total * 1000, 'peak_kib': peak / 1024,
+            'items_per_sec': 1 / total if total else 0.0
+        })
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--source", action="append", help="yalnızca bu kaynak(lar) (ör. wired)")
+    fixture_sets.add_argument(parser)
+    parser.add_argument("--json", help="sonuçları bu dosyaya JSON olarak yazar (regresyon takibi için)")
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.WARNING)
+    fixtures_dir = fixture_sets.resolve(args.fixtures)
+    label = fixture_sets.announce(fixtures_dir)
+    routes = fixture_sets.load_routes(fixtures_dir)
+    server = FixtureServer(routes['routes'], fixtures_dir)
+    server.start()
+    adapter = LocalAdapter(server.port)
+    session = http_client.get_session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        isolate_caches(tmp_dir)
+        try:
+            rows = bench_sources(routes, adapter, args.repeat, args.source)
+            rows += bench_extractors(routes, fixtures_dir, adapter, args.repeat, args.source)
+        finally:
+            server.stop()
+
+    print(f"{'ölçüm':<22} {'öğe':>4} {'istek':>5} {'toplam (ms)':>12} {'ayrıştırma (ms)':>16} {'tepe (KiB)':>11} {'öğe/sn':>9}")
+    for row in rows:
+        print(f"{row['name']:<22} {row['items']:>4} {row['requests']:>5} {row['total_ms']:>12.2f} "
+              f"{row['parse_ms']:>16.2f} {row['peak_kib']:>11.0f} {row['items_per_sec']:>9.1f}")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({'repeat': args.repeat, 'fixtures': label, 'python': sys.version.split()[0], 'results': rows},
+                      f, ensure_ascii=False, indent=2)
+    empty = [row['name'] for row in rows if row['name'].startswith("scrape:") and not row['items']]
+    if empty:
+        print(f"UYARI: öğe döndürmeyen kaynaklar: {', '.join(empty)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
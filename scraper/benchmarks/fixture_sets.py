@@ -0,0 +1,64 @@
+"""
+Benchmark fixture setleri.
+
+fixtures/          sentetik sayfalar: rastgele kelimelerle üretilmiş, yalnızca
+                   scraper'ların beklediği iskeleti taşır. Ayrıştırıcıları
+                   birbiriyle kıyaslamaya yarar; üretimdeki XPath/seçicilerin
+                   gerçek sayfalarda çalıştığını göstermez.
+fixtures/recorded/ record_fixtures.py ile kaynak sitelerden kaydedilmiş gerçek
+                   liste sayfaları, feed'ler ve makaleler (aynı routes.json düzeni).
+
+Benchmark'lar --fixtures ile set seçer: "auto" (varsayılan) kayıtlı set varsa
+onu, yoksa sentetik seti kullanır; "synthetic", "recorded" ya da bir dizin yolu
+da verilebilir.
+"""
+import json
+import os
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+SYNTHETIC_DIR = os.path.join(BENCH_DIR, "fixtures")
+RECORDED_DIR = os.path.join(SYNTHETIC_DIR, "recorded")
+
+
+def load_routes(fixtures_dir):
+    with open(os.path.join(fixtures_dir, "routes.json"), "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def resolve(choice):
+    """--fixtures değerini dizine çevirir."""
+    recorded = os.path.exists(os.path.join(RECORDED_DIR, "routes.json"))
+    if choice == "auto":
+        return RECORDED_DIR if recorded else SYNTHETIC_DIR
+    if choice == "synthetic":
+        return SYNTHETIC_DIR
+    if choice == "recorded":
+        if not recorded:
+            raise SystemExit("Kayıtlı fixture seti yok; önce: python scraper/benchmarks/record_fixtures.py")
+        return RECORDED_DIR
+    return os.path.abspath(choice)
+
+
+def describe(fixtures_dir):
+    """Raporlarda kullanılan set etiketi: 'kayıtlı (<tarih>)' ya da 'sentetik'."""
+    try:
+        recorded_at = load_routes(fixtures_dir).get('recorded_at')
+    except OSError:
+        recorded_at = None
+    if recorded_at:
+        return f"kayıtlı ({recorded_at})"
+    return "sentetik"
+
+
+def add_argument(parser):
+    parser.add_argument("--fixtures", default="auto",
+                        help="fixture seti: auto (varsayılan), synthetic, recorded ya da dizin yolu")
+
+
+def announce(fixtures_dir):
+    label = describe(fixtures_dir)
+    print(f"fixture seti: {label} — {os.path.relpath(fixtures_dir, BENCH_DIR)}")
+    if label == "sentetik":
+        print("UYARI: sentetik sayfalar üretim seçicilerini doğrulamaz; gerçek ölçüm için "
+              "record_fixtures.py ile kayıtlı set oluşturun.")
+    return label
@@ -0,0 +1,157 @@
+"""
+Gerçek fixture kaydı: her kaynağın scrape fonksiyonu canlı sitelere karşı bir kez
+çalıştırılır ve yaptığı her istek (liste sayfası ya da feed, ardından makale
+sayfaları) fixtures/recorded/ altına, bench_scrapers.py'nin okuduğu routes.json
+düzeniyle yazılır. Böylece benchmark'lar üretimdeki seçicilerin gerçekten
+eşleştiği sayfalar üzerinde ölçülür (bkz. fixture_sets.py).
+
+Kaynak URL'leri sentetik setin routes.json'ındaki "sources" eşlemesinden alınır.
+Makale istekleri arasındaki nezaket beklemesi korunur; ağ erişimi gerekir.
+--articles ile sınırlanırsa kaydedilmeyen makaleler benchmark'ta 404 döner ve
+kaynağın öğe sayısı buna göre düşer.
+
+Kullanım: python scraper/benchmarks/record_fixtures.py [--source theverge] [--articles 5] [--out dizin]
+"""
+import argparse
+import json
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+
+from requests.adapters import HTTPAdapter
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+import fixture_sets  # noqa: E402
+import http_client  # noqa: E402
+import scraper  # noqa: E402
+from strategy_cache import ExtractionStrategyCache  # noqa: E402
+from url_index import SeenUrlIndex  # noqa: E402
+
+REDIRECT_CODES = (301, 302, 303, 307, 308)
+
+
+def is_feed(response):
+    content_type = response.headers.get("Content-Type", "")
+    if "xml" in content_type or "rss" in content_type:
+        return True
+    return response.content.lstrip()[:100].startswith((b"<?xml", b"<rss", b"<feed"))
+
+
+class RecordingAdapter(HTTPAdapter):
+    """
+    Gerçek isteği yapar, 200 yanıtlarını kaynak adına göre fixture dosyası olarak saklar.
+    Kaynağın ilk sayfası liste/feed, sonrakiler makaledir; makaleler paralel
+    çekilebildiğinden sayaç kilitle, yönlendirme zinciri iş parçacığı başına tutulur.
+    """
+
+    def __init__(self, out_dir, max_articles=None):
+        super().__init__()
+        self.out_dir = out_dir
+        self.max_articles = max_articles
+        self.routes = []
+        self.source = None
+        self.pages = 0
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def start_source(self, key):
+        self.source = key
+        self.pages = 0
+
+    def send(self, request, **kwargs):
+        response = super().send(request, **kwargs)
+        redirected_from = getattr(self._local, "redirected_from", [])
+        if response.status_code in REDIRECT_CODES:
+            # Yönlendirilen URL de son sayfaya eşlenir; yerel sunucu yönlendirme yapmaz
+            self._local.redirected_from = redirected_from + [request.url]
+            return response
+        self._local.redirected_from = []
+        if response.status_code != 200 or self.source is None:
+            return response
+        with self._lock:
+            if self.pages == 0:
+                file = f"feeds/{self.source}.xml" if is_feed(response) else f"listings/{self.source}.html"
+            elif self.max_articles is None or self.pages <= self.max_articles:
+                file = f"articles/{self.source}_{self.pages}.html"
+            else:
+                return response
+            self.pages += 1
+            self.routes.extend({'url': url, 'file': file} for url in redirected_from + [request.url])
+        path = os.path.join(self.out_dir, file)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(response.content)
+        return response
+
+
+def isolate_state(tmp_dir):
+    """Önbellekler kapalı (her istek ağa gitsin), strateji ve görülen URL kaydı geçici dizinde."""
+    http_client.page_cache = None
+    scraper.feed_cache.enabled = False
+    scraper.strategy_cache = ExtractionStrategyCache(os.path.join(tmp_dir, "strategies.json"))
+    scraper.seen_urls = SeenUrlIndex(os.path.join(tmp_dir, "seen_urls.txt"), os.path.join(tmp_dir, "haberler.json"))
+    scraper.sqlite_store = None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--source", action="append", help="yalnızca bu kaynak(lar) (ör. theverge)")
+    parser.add_argument("--articles", type=int, help="kaynak başına saklanacak en fazla makale sayfası (varsayılan: hepsi)")
+    parser.add_argument("--out", default=fixture_sets.RECORDED_DIR, help="kayıt dizini (varsayılan fixtures/recorded)")
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.WARNING)
+    sources = fixture_sets.load_routes(fixture_sets.SYNTHETIC_DIR)['sources']
+    if args.source:
+        sources = {key: url for key, url in sources.items() if key in args.source}
+
+    # Yarım kalan kayıt eski seti bozmasın: önce geçici dizine yazılır
+    out_dir = os.path.abspath(args.out)
+    staging = tempfile.mkdtemp(prefix="recorded-", dir=os.path.dirname(out_dir))
+    adapter = RecordingAdapter(staging, args.articles)
+    session = http_client.get_session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    recorded = {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        isolate_state(tmp_dir)
+        for key, url in sources.items():
+            scrape = scraper.source_registry.scraper_for(url)
+            if scrape is None:
+                continue
+            adapter.start_source(key)
+            try:
+                items = scrape(url) or []
+            except Exception as e:
+                print(f"{key:<14} HATA: {e}")
+                continue
+            if adapter.pages == 0:
+                print(f"{key:<14} HATA: sayfa kaydedilemedi")
+                continue
+            recorded[key] = url
+            print(f"{key:<14} {len(items):>3} öğe, {adapter.pages} sayfa kaydedildi")
+
+    if not recorded:
+        shutil.rmtree(staging)
+        sys.exit("Hiçbir kaynak kaydedilemedi (ağ erişimi var mı?)")
+    with open(os.path.join(staging, "routes.json"), "w", encoding="utf-8") as f:
+        json.dump({
+            'recorded_at': time.strftime("%Y-%m-%d"),
+            'sources': recorded,
+            'routes': adapter.routes,
+        }, f, ensure_ascii=False, indent=4)
+    if os.path.exists(out_dir):
+        shutil.rmtree(out_dir)
+    os.replace(staging, out_dir)
+    print(f"{len(recorded)} kaynak, {len(adapter.routes)} istek -> {out_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,72 +1,146 @@
+"""
+haberler.json bakım komutu: bozuk karakterleri düzeltir, bilinen kaynakların
+isim ve logolarını sources.json'a göre günceller.
+
+Arşiv akış halinde okunur, kayıtlar süreç havuzunda işlenir ve yalnızca en az
+bir kayıt değiştiyse geçici dosya + atomik rename ile yazılır; site okumaya
+devam ederken çalıştırılabilir.
+
+Kullanım: python scraper/cleanup_json.py [haberler.json] [--workers N] [--dry-run]
+"""
+import argparse
 import json
 import os
+import time
+from multiprocessing import Pool
+
+from sources import load_source_registry
+from mojibake import fix_encoding
+from storage import iter_json_array, JsonArrayWriter, archive_lock
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_PATH = "/home/webhosting/public_html/data/haberler.json"
+TEXT_FIELDS = ('baslik', 'kisa_baslik', 'ozet', 'icerik')
+INDENT = 4
+
+source_registry = None
+
+
+def _init_worker():
+    global source_registry
+    source_registry = load_source_registry(os.path.join(BASE_DIR, "sources.json"))
+
+
+def clean_record(item):
+    """
+    Tek kaydı temizler.
+    Dönüş: (kayıt, değişti_mi)
+    """
+    changed = False
+    for field in TEXT_FIELDS:
+        value = item.get(field, '')
+        fixed = fix_encoding(value)
+        if fixed != value or field not in item:
+            item[field] = fixed
+            changed = True
+
+    # Also ensure logo AND NAME are updated for known sources
+    link = item.get('kaynak', {}).get('link', '')
+    source = source_registry.match(link)
+    if source is not None:
+        if item['kaynak'].get('logo') != source.logo or item['kaynak'].get('isim') != source.name:
+            item['kaynak']['logo'] = source.logo
+            item['kaynak']['isim'] = source.name
+            changed = True
+    return item, changed
+
+
+def clean_record_text(text):
+    """
+    Süreç havuzu için: ham JSON kaydını ayrıştırır, temizler ve girintili JSON
+    metni olarak döner. Pahalı (girintili) serileştirme de işçi süreçte yapılır.
+    Dönüş: (json_metni, değişti_mi)
+    """
+    item, changed = clean_record(json.loads(text))
+    return json.dumps(item, ensure_ascii=False, indent=INDENT), changed
+
+
+def _file_state(path):
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
+
+
+def cleanup(path, workers=None, chunk_size=256, dry_run=False):
+    """
+    Arşivi temizler.
+    Dönüş: (toplam_kayıt, değişen_kayıt, yazıldı_mı)
+    """
+    state = _file_state(path)
+    writer = None if dry_run else JsonArrayWriter(path, indent=INDENT)
+    total = changed = 0
+    pool = None
+    start = time.perf_counter()
+    workers = workers or os.cpu_count() or 1
+    try:
+        # Tek çekirdekte süreçler arası kopyalama kazançtan pahalı, kayıtlar yerinde işlenir
+        if workers <= 1:
+            _init_worker()
+            results = map(clean_record_text, iter_json_array(path, raw=True))
+        else:
+            pool = Pool(workers, initializer=_init_worker)
+            results = pool.imap(clean_record_text, iter_json_array(path, raw=True), chunksize=chunk_size)
+        for text, item_changed in results:
+            total += 1
+            changed += item_changed
+            if writer is not None:
+                writer.write_text(text)
+            if total % 10000 == 0:
+                print(f"{total} kayıt işlendi ({total / (time.perf_counter() - start):.0f} kayıt/sn)")
+        if pool is not None:
+            pool.close()
+            pool.join()
+    except BaseException:
+        if pool is not None:
+            pool.terminate()
+        if writer is not None:
+            writer.discard()
+        raise
+
+    elapsed = time.perf_counter() - start
+    print(f"{total} kayıt, {changed} değişiklik, {elapsed:.2f} sn ({total / max(elapsed, 1e-9):.0f} kayıt/sn)")
+    if writer is None:
+        return total, changed, False
+    if not changed:
+        writer.discard()
+        return total, changed, False
+
+    # Scraper'ın günlük sıkıştırmasıyla aynı kilit; arada dosya değiştiyse yazılmaz
+    with archive_lock(path):
+        if _file_state(path) != state:
+            writer.discard()
+            print("Haberler.json işlem sırasında değişti, yazılmadı. Komutu tekrar çalıştırın.")
+            return total, changed, False
+        writer.commit()
+    return total, changed, True
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("path", nargs="?", default=DEFAULT_PATH)
+    parser.add_argument("--workers", type=int, default=None, help="süreç sayısı (varsayılan: CPU sayısı)")
+    parser.add_argument("--chunk-size", type=int, default=256, help="süreçlere tek seferde gönderilen kayıt sayısı")
+    parser.add_argument("--dry-run", action="store_true", help="değişiklikleri sayar, dosyaya yazmaz")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.path):
+        print("Haberler.json bulunamadı.")
+        return
+    _, changed, written = cleanup(args.path, args.workers, args.chunk_size, args.dry_run)
+    if written:
+        print("Haberler.json başarıyla temizlendi, logolar ve isimler güncellendi.")
+    elif not changed:
+        print("Değişiklik yok, dosya yazılmadı.")
+
 
-def fix_encoding(text):
-    if not isinstance(text, str): return text
-    replacements = {
-        "â€¢": "•",
-        "â€“": "–",
-        "â€”": "—",
-        "â€™": "'",
-        "â€œ": '"',
-        "â€?": '"',
-        "Â": "",
-        "â€¦": "...",
-        "Ä±": "ı",
-        "ÄŸ": "ğ",
-        "Ã¼": "ü",
-        "ÅŸ": "ş",
-        "Ã¶": "ö",
-        "Ã§": "ç"
-    }
-    for old, new in replacements.items():
-        text = text.replace(old, new)
-    return text
-
-file_path = r"c:\Users\musta\Desktop\TrHaber\data\haberler.json"
-
-if os.path.exists(file_path):
-    with open(file_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
-    
-    for item in data:
-        item['baslik'] = fix_encoding(item.get('baslik', ''))
-        item['kisa_baslik'] = fix_encoding(item.get('kisa_baslik', ''))
-        item['ozet'] = fix_encoding(item.get('ozet', ''))
-        item['icerik'] = fix_encoding(item.get('icerik', ''))
-        
-        # Also ensure logo AND NAME are updated for known sources
-        link = item.get('kaynak', {}).get('link', '')
-        if "nytimes.com" in link: 
-            item['kaynak']['logo'] = "https://www.nytimes.com/favicon.ico"
-            item['kaynak']['isim'] = "The New York Times"
-        elif "theverge.com" in link: 
-            item['kaynak']['logo'] = "https://www.theverge.com/favicon.ico"
-            item['kaynak']['isim'] = "The Verge"
-        elif "techcrunch.com" in link: 
-            item['kaynak']['logo'] = "https://techcrunch.com/wp-content/uploads/2015/02/tc-logo-200x200.png"
-            item['kaynak']['isim'] = "TechCrunch"
-        elif "wired.com" in link: 
-            item['kaynak']['logo'] = "https://www.wired.com/favicon.ico"
-            item['kaynak']['isim'] = "Wired"
-        elif "gizmodo.com" in link: 
-            item['kaynak']['logo'] = "https://gizmodo.com/favicon.ico"
-            item['kaynak']['isim'] = "Gizmodo"
-        elif "arstechnica.com" in link: 
-            item['kaynak']['logo'] = "https://arstechnica.com/favicon.ico"
-            item['kaynak']['isim'] = "Ars Technica"
-        elif "pcgamer.com" in link: 
-            item['kaynak']['logo'] = "https://www.pcgamer.com/favicon.ico"
-            item['kaynak']['isim'] = "PC Gamer"
-        elif "gamespot.com" in link: 
-            item['kaynak']['logo'] = "https://www.gamespot.com/favicon.ico"
-            item['kaynak']['isim'] = "GameSpot"
-        elif "cnet.com" in link: 
-            item['kaynak']['logo'] = "https://www.cnet.com/favicon.ico"
-            item['kaynak']['isim'] = "CNET"
-
-    with open(file_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=4)
-    print("Haberler.json başarıyla temizlendi, logolar ve isimler güncellendi.")
-else:
-    print("Haberler.json bulunamadı.")
+if __name__ == "__main__":
+    main()
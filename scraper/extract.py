@@ -0,0 +1,136 @@
+import time
+from urllib.parse import urlsplit
+
+from lxml import etree, html as lxml_html
+
+import metrics
+from http_client import fetch_page
+
+
+def _has_class(name):
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# Makale paragrafı seçicileri, denenme sırasıyla (CSS karşılığı, önceden derlenmiş XPath)
+PARAGRAPH_SELECTORS = [
+    ('article p', etree.XPath('//article//p')),
+    ('.entry-content p', etree.XPath(f'//*[{_has_class("entry-content")}]//p')),
+    ('.article-body p', etree.XPath(f'//*[{_has_class("article-body")}]//p')),
+    ('.post-content p', etree.XPath(f'//*[{_has_class("post-content")}]//p')),
+    ('main p', etree.XPath('//main//p')),
+    ('[itemprop="articleBody"] p', etree.XPath('//*[@itemprop="articleBody"]//p')),
+    ('#content p', etree.XPath('//*[@id="content"]//p')),
+    ('.c-article-content p', etree.XPath(f'//*[{_has_class("c-article-content")}]//p')),
+    ('.content p', etree.XPath(f'//*[{_has_class("content")}]//p')),
+]
+
+ALL_PARAGRAPHS = etree.XPath('//p')
+OG_IMAGE = etree.XPath('//meta[@property="og:image"]/@content')
+OG_DESCRIPTION = etree.XPath('//meta[@property="og:description"]/@content')
+META_DESCRIPTION = etree.XPath('//meta[@name="description"]/@content')
+# 'article p, .entry-content p, .article-body p, .post-content p, main p' (belge sırasıyla)
+DESCRIPTION_PARAGRAPHS = etree.XPath(
+    f'//article//p | //*[{_has_class("entry-content")}]//p | //*[{_has_class("article-body")}]//p'
+    f' | //*[{_has_class("post-content")}]//p | //main//p'
+)
+LIVEMINT_CONTAINER = etree.XPath(
+    f'//div[{_has_class("taboola-readmore")}]//div[{_has_class("storyPage_storyContent__3xuFc")}]'
+)
+LIVEMINT_CONTAINER_FALLBACK = etree.XPath(f'//div[{_has_class("storyPage_storyContent__3xuFc")}]')
+LIVEMINT_PARAGRAPHS = etree.XPath(f'.//div[{_has_class("storyParagraph")}]//p')
+
+DESCRIPTION_MAX_LENGTH = 400
+
+
+def shorten(text, limit=DESCRIPTION_MAX_LENGTH):
+    """Metni kelime sınırında kısaltır."""
+    if text and len(text) > limit:
+        return text[:limit].rsplit(' ', 1)[0] + "..."
+    return text
+
+
+def _text(el):
+    return el.text_content().strip()
+
+
+def parse_document(content):
+    """HTML baytlarını lxml ile bir kez ayrıştırır; boş/bozuk belgede None döner."""
+    if not content or not content.strip():
+        return None
+    try:
+        return lxml_html.document_fromstring(content)
+    except (etree.ParserError, ValueError):
+        return None
+
+
+def extract_paragraphs(doc, url, selectors=None):
+    """
+    Belgeden makale paragraflarını çıkarır.
+    Livemint için tüm dolu <p> etiketleri, diğer siteler için seçiciler sırayla
+    denenir ve 2'den fazla uzun paragraf toplanınca durulur.
+    Dönüş: (paragraphs, kazanan_seçici_adı)
+    """
+    if "livemint.com" in url:
+        return [t for t in (_text(p) for p in ALL_PARAGRAPHS(doc)) if t], None
+    paras = []
+    for name, xpath in (selectors or PARAGRAPH_SELECTORS):
+        found = xpath(doc)
+        if found:
+            for p in found:
+                t = _text(p)
+                if len(t) > 40:
+                    paras.append(t)
+            if len(paras) > 2:
+                return paras, name
+    return paras, None
+
+
+def extract_description(doc, url, paragraphs):
+    """Paragraflar, Livemint gövdesi, og:description ve ilk paragraflar sırasıyla kısa açıklama üretir."""
+    if paragraphs:
+        return shorten(" ".join(paragraphs[:2]).strip())
+    if "livemint.com" in url:
+        containers = LIVEMINT_CONTAINER(doc) or LIVEMINT_CONTAINER_FALLBACK(doc)
+        if containers:
+            texts = [t for t in (_text(p) for p in LIVEMINT_PARAGRAPHS(containers[0])) if t]
+            if texts:
+                return shorten(" ".join(texts))
+    meta = OG_DESCRIPTION(doc) or META_DESCRIPTION(doc)
+    if meta and meta[0].strip():
+        return meta[0].strip()
+    texts = [t for t in (_text(p) for p in DESCRIPTION_PARAGRAPHS(doc)) if t]
+    if texts:
+        return shorten(" ".join(texts[:2]))
+    return None
+
+
+def parse_article_html(content, url, selectors=None):
+    """
+    Makale HTML'ini tek seferde ayrıştırıp görsel, paragraflar ve açıklamayı birlikte döner.
+    Dönüş: {'image': str|None, 'paragraphs': [str], 'description': str|None, 'selector': str|None}
+    """
+    result = {'image': None, 'paragraphs': [], 'description': None, 'selector': None}
+    doc = parse_document(content)
+    if doc is None:
+        return result
+    images = OG_IMAGE(doc)
+    result['image'] = images[0] if images and images[0] else None
+    result['paragraphs'], result['selector'] = extract_paragraphs(doc, url, selectors)
+    result['description'] = extract_description(doc, url, result['paragraphs'])
+    return result
+
+
+def extract_article(url, selectors=None, delay=None):
+    """
+    Sayfayı bir kez çeker (sayfa önbelleği üzerinden) ve bir kez ayrıştırır.
+    delay, önbellekte olmayan sayfa için ağ isteğinden önceki bekleme aralığıdır.
+    403 yanıtında None döner, diğer HTTP hatalarında requests istisnası fırlatır.
+    """
+    resp = fetch_page(url, delay=delay)
+    if resp.status_code == 403:
+        return None
+    resp.raise_for_status()
+    start = time.perf_counter()
+    result = parse_article_html(resp.content, url, selectors)
+    metrics.observe("scraper_parse_seconds", time.perf_counter() - start, host=urlsplit(url).netloc.lower())
+    return result
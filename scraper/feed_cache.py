@@ -0,0 +1,158 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+
+from http_client import http_get
+from storage import write_json_atomic
+
+
+class FeedCache:
+    """
+    RSS/Atom feed'leri için koşullu GET önbelleği.
+
+    Her feed URL'si için ETag, Last-Modified ve gövde özeti (sha256) saklanır.
+    fetch() sunucu 304 dönerse veya gövde değişmemişse None döner; böylece
+    feed ayrıştırılmadan atlanabilir. Yeni doğrulayıcılar commit_parsed()
+    çağrılana kadar kalıcı hale gelmez, işlenemeyen feed bir sonraki döngüde
+    tekrar gelir.
+
+    Döngüde scraper ayrıştırdığı feed'i mark_parsed() ile işaretler; döngü
+    sonunda commit_parsed() yalnızca haberlerinin hepsi işlenmiş feed'lerin
+    doğrulayıcılarını kaydeder. Haberi kaydedilemeyen feed 304 ile gizlenmez.
+    """
+
+    def __init__(self, path, enabled=True):
+        self.path = path
+        self.enabled = enabled
+        self._entries = None
+        self._pending = {}
+        self._parsed = set()
+        self._lock = threading.Lock()
+        self.not_modified = 0
+        self.unchanged = 0
+        self.changed = 0
+
+    def _load(self):
+        if self._entries is not None:
+            return
+        self._entries = {}
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    self._entries = json.load(f)
+            except (OSError, ValueError) as e:
+                logging.info(f"Feed önbelleği okunamadı, sıfırdan başlanıyor: {e}")
+
+    def fetch(self, url, headers=None, timeout=None):
+        """
+        Feed'i koşullu istekle çeker.
+        Dönüş: değişmişse requests.Response, değişmemişse None
+        """
+        if not self.enabled:
+            return http_get(url, headers=headers, timeout=timeout)
+
+        with self._lock:
+            self._load()
+            entry = dict(self._entries.get(url, {}))
+        request_headers = dict(headers or {})
+        if entry.get('etag'):
+            request_headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            request_headers['If-Modified-Since'] = entry['last_modified']
+
+        response = http_get(url, headers=request_headers, timeout=timeout)
+        if response.status_code == 304:
+            with self._lock:
+                self.not_modified += 1
+            return None
+        if response.status_code != 200:
+            return response
+
+        body_hash = hashlib.sha256(response.content).hexdigest()
+        if body_hash == entry.get('body_hash'):
+            with self._lock:
+                self.unchanged += 1
+            return None
+
+        with self._lock:
+            self.changed += 1
+            self._pending[url] = {
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+                'body_hash': body_hash
+            }
+        return response
+
+    def mark_parsed(self, url):
+        """fetch() ile alınan feed ayrıştırıldı; doğrulayıcıları commit_parsed() kaydeder."""
+        if not self.enabled:
+            return
+        with self._lock:
+            if url in self._pending:
+                self._parsed.add(url)
+
+    def commit_parsed(self, skip=()):
+        """
+        Ayrıştırılmış feed'lerin (skip dışındakiler) doğrulayıcılarını kaydeder,
+        diğer bekleyenleri bırakır; bunlar sonraki döngüde tekrar işlenir.
+        Dönüş: kaydedilen feed sayısı
+        """
+        if not self.enabled:
+            return 0
+        with self._lock:
+            committed = 0
+            for url in self._parsed:
+                if url in skip:
+                    continue
+                self._load()
+                self._entries[url] = self._pending[url]
+                committed += 1
+            self._pending.clear()
+            self._parsed.clear()
+            if committed:
+                self._save()
+        return committed
+
+    def _save(self):
+        try:
+            write_json_atomic(self.path, self._entries, indent=2)
+        except OSError as e:
+            logging.error(f"Feed önbelleği yazılamadı: {e}")
+
+    def stats(self):
+        with self._lock:
+            return {
+                "not_modified": self.not_modified,
+                "unchanged": self.unchanged,
+                "changed": self.changed
+            }
+
+
+class FeedProgress:
+    """
+    Bir döngüde her kaynaktan çıkıp işlenmesi beklenen haberler.
+
+    dedup'tan geçen haber add() ile kaydedilir; kasıtlı olarak atlanan haber
+    (ör. yakın kopya) settle() ile düşülür. Döngü sonunda unfinished(is_done)
+    haberlerinden biri hâlâ kaydedilmemiş (getirme, model veya kayıt hatası)
+    kaynakları döner.
+    """
+
+    def __init__(self):
+        self._items = {}
+        self._lock = threading.Lock()
+
+    def add(self, source, url):
+        with self._lock:
+            self._items.setdefault(source, set()).add(url)
+
+    def settle(self, source, url):
+        with self._lock:
+            self._items.get(source, set()).discard(url)
+
+    def unfinished(self, is_done):
+        with self._lock:
+            items = {source: list(urls) for source, urls in self._items.items()}
+        return {source for source, urls in items.items() if not all(is_done(url) for url in urls)}
@@ -0,0 +1,157 @@
+import io
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+from lxml import etree, html as lxml_html
+
+ATOM_NS = "http://www.w3.org/2005/Atom"
+MEDIA_NS = "http://search.yahoo.com/mrss/"
+
+# RSS 0.9x/2.0 (isim alanı yok), RSS 1.0 (RDF) ve Atom öğe etiketleri
+ITEM_TAGS = ("item", "{http://purl.org/rss/1.0/}item", f"{{{ATOM_NS}}}entry")
+
+_DATE_FIELDS = ("pubDate", "date", "published", "updated", "issued", "modified")
+_SUMMARY_FIELDS = ("description", "summary", "encoded", "content")
+
+
+def html_to_text(value):
+    """HTML parçasının metni; metin düğümleri tek boşlukla birleştirilir."""
+    if not value:
+        return ""
+    if "<" not in value and "&" not in value:
+        return " ".join(value.split())
+    try:
+        fragment = lxml_html.fragment_fromstring(value, create_parent="div")
+    except (etree.ParserError, ValueError):
+        return " ".join(value.split())
+    return " ".join(part for part in (s.strip() for s in fragment.itertext()) if part)
+
+
+def _first_image_in_html(value):
+    if not value or "<img" not in value:
+        return None
+    try:
+        fragment = lxml_html.fragment_fromstring(value, create_parent="div")
+    except (etree.ParserError, ValueError):
+        return None
+    for src in fragment.xpath(".//img/@src"):
+        if src.startswith(("http://", "https://")):
+            return src
+    return None
+
+
+def normalize_date(value):
+    """RFC 822 (RSS) veya ISO 8601 (Atom) tarihini UTC 'YYYY-MM-DDTHH:MM:SSZ' biçimine çevirir."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        try:
+            parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _is_image(el):
+    medium = el.get("medium")
+    mime = el.get("type") or ""
+    return medium == "image" or mime.startswith("image/") or (not medium and not mime)
+
+
+def _parse_item(item):
+    """Tek <item>/<entry> öğesini normalize sözlüğe çevirir."""
+    fields = {}
+    link = None
+    image = None
+    guid = None
+    for child in item.iterchildren(tag=etree.Element):
+        qname = etree.QName(child)
+        name, ns = qname.localname, qname.namespace
+        if ns == MEDIA_NS:
+            if image is None and name in ("content", "thumbnail") and child.get("url") and _is_image(child):
+                image = child.get("url")
+            elif image is None and name == "group":
+                for media in child:
+                    if media.get("url") and _is_image(media):
+                        image = media.get("url")
+                        break
+            continue
+        if name == "link":
+            href = child.get("href")
+            if href is None:
+                link = link or (child.text or "").strip() or None
+            elif child.get("rel") in (None, "alternate") and link is None:
+                link = href.strip()
+            elif child.get("rel") == "enclosure" and image is None and (child.get("type") or "").startswith("image/"):
+                image = href
+            continue
+        if name == "enclosure":
+            if image is None and (child.get("type") or "").startswith("image/") and child.get("url"):
+                image = child.get("url")
+            continue
+        if name == "guid":
+            if child.get("isPermaLink") != "false":
+                guid = (child.text or "").strip()
+            continue
+        if name not in fields:
+            fields[name] = child.text or ""
+
+    if link is None and guid and guid.startswith(("http://", "https://")):
+        link = guid
+    summary_html = next((fields[f] for f in _SUMMARY_FIELDS if fields.get(f)), "")
+    if image is None:
+        image = _first_image_in_html(summary_html) or _first_image_in_html(fields.get("encoded"))
+    return {
+        'title': html_to_text(fields.get("title", "")),
+        'url': link,
+        'image': image,
+        'summary': html_to_text(summary_html),
+        'date': next((normalize_date(fields[f]) for f in _DATE_FIELDS if fields.get(f)), None),
+    }
+
+
+def iter_feed_items(content, limit=None, stop_at=None, known_run=3):
+    """
+    RSS/Atom feed'ini lxml iterparse ile akış halinde ayrıştırır ve normalize
+    öğeleri (title, url, image, summary, date) sırayla üretir.
+
+    Ağaç kurulmaz: işlenen her öğe ve önceki kardeşleri temizlenir, bellek feed
+    boyutundan bağımsız kalır. limit kadar öğe üretildiğinde ayrıştırma durur.
+    stop_at(url) True dönen (zaten kayıtlı) öğeler üretilmez; feed'ler yeniden
+    eskiye sıralı olduğundan art arda known_run bilinen öğeden sonra feed'in
+    geri kalanı okunmaz (tek bir güncellenip öne taşınmış haber durdurmaz).
+    content bayt veya metin olabilir; bozuk XML mümkün olduğunca kurtarılır.
+    """
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    produced = 0
+    known = 0
+    context = etree.iterparse(
+        io.BytesIO(content), events=("end",), tag=ITEM_TAGS,
+        recover=True, resolve_entities=False, no_network=True
+    )
+    for _, item in context:
+        entry = _parse_item(item)
+        # Öğe ve daha önce işlenmiş kardeşleri bırakılır
+        item.clear(keep_tail=False)
+        parent = item.getparent()
+        if parent is not None:
+            while item.getprevious() is not None:
+                del parent[0]
+        if not entry['url'] or not entry['title']:
+            continue
+        if stop_at is not None and stop_at(entry['url']):
+            known += 1
+            if known >= known_run:
+                return
+            continue
+        known = 0
+        yield entry
+        produced += 1
+        if limit is not None and produced >= limit:
+            return
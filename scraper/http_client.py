@@ -0,0 +1,153 @@
+import os
+import random
+import threading
+import time
+from urllib.parse import urlsplit
+
+import metrics
+from page_cache import PageCache
+
+
+# Tüm isteklerde kullanılan ortak başlıklar (tarayıcı gibi görünmek için)
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9,tr;q=0.8',
+    'Accept-Encoding': 'gzip, deflate',
+    'DNT': '1',
+    'Upgrade-Insecure-Requests': '1',
+    'Referer': 'https://www.google.com/'
+}
+
+DEFAULT_TIMEOUT = 15
+POOL_CONNECTIONS = 32   # Önbellekte tutulan host havuzu sayısı
+POOL_MAXSIZE = 16       # Host başına açık tutulan bağlantı sayısı
+MAX_RETRIES = 2
+
+_session = None
+_session_lock = threading.Lock()
+
+# Makale sayfaları için disk önbelleği (configure ile açılır)
+page_cache = None
+
+# url -> zaman aşımı (veya None) döndüren fonksiyon; kaynağa özel timeout için
+timeout_resolver = None
+
+
+def configure(config):
+    """
+    scraper_config.json'daki http_* ayarlarını uygular.
+    Oturum zaten oluşturulmuşsa yeni ayarlarla yeniden kurulur.
+    """
+    global DEFAULT_TIMEOUT, POOL_MAXSIZE, MAX_RETRIES, _session, page_cache
+    DEFAULT_TIMEOUT = config.get('http_timeout', DEFAULT_TIMEOUT)
+    POOL_MAXSIZE = config.get('http_pool_size', POOL_MAXSIZE)
+    MAX_RETRIES = config.get('http_retries', MAX_RETRIES)
+    if config.get('page_cache_enabled', True):
+        cache_dir = config.get('page_cache_dir') or os.path.join(os.path.dirname(os.path.abspath(__file__)), "page_cache")
+        page_cache = PageCache(
+            cache_dir,
+            ttl=config.get('page_cache_ttl', 6 * 3600),
+            max_bytes=config.get('page_cache_max_mb', 200) * 1024 * 1024
+        )
+    else:
+        page_cache = None
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
+
+
+def _build_session():
+    # requests ilk oturumda yüklenir; scraper'ı içe aktarmak ağ katmanını yüklemez
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    retry = Retry(
+        total=MAX_RETRIES,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET", "HEAD"],
+        respect_retry_after_header=True,
+        # Denemeler bitince hata fırlatma, son yanıtı çağırana bırak
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE, max_retries=retry)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers.update(DEFAULT_HEADERS)
+    return session
+
+
+def get_session():
+    """Süreç genelinde paylaşılan, bağlantı havuzlu requests.Session döner."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _build_session()
+    return _session
+
+
+def http_get(url, headers=None, timeout=None, **kwargs):
+    """
+    Ortak oturum üzerinden GET isteği yapar.
+    headers verilirse varsayılan başlıkların üzerine yazılır. timeout verilmezse
+    kaynağa özel zaman aşımı, o da yoksa DEFAULT_TIMEOUT kullanılır.
+    """
+    if timeout is None and timeout_resolver is not None:
+        timeout = timeout_resolver(url)
+    if timeout is None:
+        timeout = DEFAULT_TIMEOUT
+    host = urlsplit(url).netloc.lower()
+    start = time.perf_counter()
+    try:
+        response = get_session().get(url, headers=headers, timeout=timeout, **kwargs)
+    except Exception as e:
+        metrics.inc("scraper_http_requests_total", host=host, status=type(e).__name__)
+        raise
+    metrics.observe("scraper_http_seconds", time.perf_counter() - start, host=host)
+    metrics.inc("scraper_http_requests_total", host=host, status=response.status_code)
+    if not kwargs.get('stream'):
+        metrics.inc("scraper_http_bytes_total", len(response.content), host=host)
+    return response
+
+
+def _cached_response(url, meta, body):
+    import requests
+    from requests.structures import CaseInsensitiveDict
+
+    response = requests.Response()
+    response.status_code = meta.get('status', 200)
+    response.url = meta.get('url', url)
+    response.encoding = meta.get('encoding')
+    response.headers = CaseInsensitiveDict(meta.get('headers', {}))
+    response._content = body
+    return response
+
+
+def fetch_page(url, headers=None, timeout=None, delay=None):
+    """
+    Makale sayfasını önce disk önbelleğinden, yoksa ağdan getirir.
+    Yalnızca 200 yanıtları önbelleğe yazılır; dönüş her durumda requests.Response'tur.
+    delay (min, max) saniye verilirse nezaket beklemesi yalnızca ağa gidilirken yapılır.
+    """
+    if page_cache is not None:
+        cached = page_cache.get(url)
+        if cached is not None:
+            metrics.inc("scraper_page_cache_hits_total", host=urlsplit(url).netloc.lower())
+            return _cached_response(url, *cached)
+    if delay:
+        time.sleep(random.uniform(*delay))
+    response = http_get(url, headers=headers, timeout=timeout)
+    if page_cache is not None and response.status_code == 200:
+        meta = {
+            'url': response.url,
+            'status': response.status_code,
+            'encoding': response.encoding,
+            'headers': {'Content-Type': response.headers.get('Content-Type', '')}
+        }
+        page_cache.put(url, meta, response.content)
+    return response
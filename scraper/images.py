@@ -0,0 +1,302 @@
+import hashlib
+import io
+import json
+import logging
+import os
+import struct
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import urlsplit
+
+import metrics
+from http_client import http_get
+from storage import write_json_atomic
+
+# Boyut okumak için indirilen en fazla başlık baytı; JPEG'lerde SOF işaretçisi
+# EXIF/ICC bloklarından sonra geldiği için birkaç KB yetmeyebilir
+PROBE_BYTES = 64 * 1024
+CHUNK_SIZE = 16 * 1024
+
+EXTENSIONS = {'webp': '.webp', 'jpeg': '.jpg'}
+
+# Pillow eksikliği süreç başına bir kez uyarılır (daemon her döngüde yeniden yapılandırır)
+_pillow_warned = False
+
+
+def probe_image_size(data):
+    """
+    Görselin biçimini ve boyutunu dosyanın ilk baytlarından okur (Pillow gerekmez).
+    Dönüş: (biçim, genişlik, yükseklik) veya tanınmıyor / veri yetmiyorsa None
+    """
+    if data.startswith(b'\x89PNG\r\n\x1a\n') and len(data) >= 24:
+        width, height = struct.unpack('>II', data[16:24])
+        return 'png', width, height
+    if data[:6] in (b'GIF87a', b'GIF89a') and len(data) >= 10:
+        width, height = struct.unpack('<HH', data[6:10])
+        return 'gif', width, height
+    if data[:4] == b'RIFF' and data[8:12] == b'WEBP' and len(data) >= 30:
+        chunk = data[12:16]
+        if chunk == b'VP8 ':
+            width, height = struct.unpack('<HH', data[26:30])
+            return 'webp', width & 0x3fff, height & 0x3fff
+        if chunk == b'VP8L':
+            bits = int.from_bytes(data[21:25], 'little')
+            return 'webp', (bits & 0x3fff) + 1, ((bits >> 14) & 0x3fff) + 1
+        if chunk == b'VP8X':
+            return 'webp', int.from_bytes(data[24:27], 'little') + 1, int.from_bytes(data[27:30], 'little') + 1
+        return None
+    if data[:2] == b'\xff\xd8':
+        return _probe_jpeg(data)
+    return None
+
+
+def _probe_jpeg(data):
+    # Segmentler üzerinde SOFn işaretçisine kadar ilerle (DHT, DAC ve JPG hariç)
+    pos = 2
+    while pos + 9 <= len(data):
+        if data[pos] != 0xff:
+            return None
+        marker = data[pos + 1]
+        if marker == 0xff:
+            pos += 1
+            continue
+        if marker in (0xd8, 0x01) or 0xd0 <= marker <= 0xd7:
+            pos += 2
+            continue
+        length = struct.unpack('>H', data[pos + 2:pos + 4])[0]
+        if 0xc0 <= marker <= 0xcf and marker not in (0xc4, 0xc8, 0xcc):
+            height, width = struct.unpack('>HH', data[pos + 5:pos + 9])
+            return 'jpeg', width, height
+        pos += 2 + length
+    return None
+
+
+class ImageCache:
+    """
+    Haber görsellerinin yerel, içerik adresli türev önbelleği.
+
+    Görsel akış halinde indirilir; boyut ilk baytlardan okunur ve çok küçük
+    (izleme pikseli, ikon), çok büyük veya görsel olmayan yanıtlar gövde
+    indirilmeden bırakılır. Kabul edilen görsel Pillow ile max_width x max_height
+    sınırına küçültülüp WebP (veya JPEG) olarak root_dir altına içeriğin
+    özetiyle adlandırılarak yazılır; aynı görsel farklı URL'lerden gelse de bir
+    kez saklanır. Kaynak URL -> yerel yol eşlemesi diske kaydedilir, bilinen
+    URL'ler ağa gidilmeden çözülür.
+
+    Pillow kurulu değilse hiçbir görsel indirilmez, orijinal URL'ler kullanılır.
+    Reddedilen veya indirilemeyen URL'ler süreç boyunca hatırlanır, her döngüde
+    yeniden indirilmez.
+    """
+
+    def __init__(self, root_dir, url_prefix, max_width=1200, max_height=1200, image_format='webp',
+                 quality=80, min_width=200, max_pixels=40_000_000, max_download_bytes=15 * 1024 * 1024,
+                 max_index_entries=20000):
+        self.root_dir = root_dir
+        self.url_prefix = url_prefix.rstrip('/') + '/'
+        self.max_width = max_width
+        self.max_height = max_height
+        self.image_format = image_format if image_format in EXTENSIONS else 'webp'
+        self.quality = quality
+        self.min_width = min_width
+        self.max_pixels = max_pixels
+        self.max_download_bytes = max_download_bytes
+        self.max_index_entries = max_index_entries
+        self.index_path = os.path.join(root_dir, "index.json")
+        self._index = None            # kaynak URL -> yerel URL, eskiden yeniye
+        self._negative = OrderedDict()  # reddedilen (None) / başarısız (orijinal URL) sonuçlar
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._pillow = None
+        self._stats = {'cached': 0, 'created': 0, 'rejected': 0, 'failed': 0}
+
+    def _load_index(self):
+        if self._index is not None:
+            return
+        self._index = OrderedDict()
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                self._index.update(json.load(f))
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logging.info(f"Görsel indeksi okunamadı, sıfırdan başlanıyor: {e}")
+
+    def _lookup(self, url):
+        with self._lock:
+            self._load_index()
+            local_url = self._index.get(url)
+        if local_url is not None and os.path.exists(self._path_for(local_url)):
+            return local_url
+        return None
+
+    def _remember(self, url, local_url):
+        with self._lock:
+            self._index[url] = local_url
+            self._index.move_to_end(url)
+            while len(self._index) > self.max_index_entries:
+                self._index.popitem(last=False)
+            self._dirty = True
+
+    def save(self):
+        with self._lock:
+            if not self._dirty or self._index is None:
+                return
+            try:
+                os.makedirs(self.root_dir, exist_ok=True)
+                write_json_atomic(self.index_path, self._index, indent=None)
+                self._dirty = False
+            except OSError as e:
+                logging.error(f"Görsel indeksi yazılamadı: {e}")
+
+    def stats(self):
+        with self._lock:
+            return dict(self._stats, entries=len(self._index or {}))
+
+    def _path_for(self, local_url):
+        return os.path.join(self.root_dir, *local_url[len(self.url_prefix):].split('/'))
+
+    def _remember_negative(self, url, result):
+        with self._lock:
+            self._negative[url] = result
+            while len(self._negative) > self.max_index_entries:
+                self._negative.popitem(last=False)
+
+    def _count(self, result, host):
+        with self._lock:
+            self._stats[result] += 1
+        metrics.inc("scraper_images_total", result=result, host=host)
+
+    def available(self):
+        """Pillow kurulu mu; değilse ilk çağrıda bir kez uyarı loglanır."""
+        return bool(self._image_module())
+
+    def _image_module(self):
+        """Pillow'u ilk kullanımda yükler; kurulu değilse False döner."""
+        if self._pillow is None:
+            try:
+                from PIL import Image, ImageOps
+                Image.MAX_IMAGE_PIXELS = self.max_pixels
+                self._pillow = (Image, ImageOps)
+            except ImportError:
+                global _pillow_warned
+                if not _pillow_warned:
+                    logging.warning("Pillow kurulu değil, görsel önbelleği devre dışı (pip install Pillow)")
+                    _pillow_warned = True
+                self._pillow = False
+        return self._pillow
+
+    def download(self, url):
+        """
+        Görseli akış halinde indirir, boyutu ilk baytlardan doğrular.
+        Dönüş: (gövde, (biçim, genişlik, yükseklik)) veya reddedilirse None
+        """
+        host = urlsplit(url).netloc.lower()
+        response = http_get(url, stream=True)
+        try:
+            if response.status_code != 200:
+                logging.info(f"Görsel alınamadı ({response.status_code}): {url}")
+                return None
+            chunks = response.iter_content(CHUNK_SIZE)
+            head = bytearray()
+            info = None
+            for chunk in chunks:
+                head += chunk
+                info = probe_image_size(bytes(head[:PROBE_BYTES]))
+                if info is not None or len(head) >= PROBE_BYTES:
+                    break
+            if info is None:
+                logging.info(f"Görsel biçimi tanınmadı: {url}")
+                return None
+            _, width, height = info
+            if width < self.min_width or width * height > self.max_pixels:
+                logging.info(f"Görsel boyutu uygun değil ({width}x{height}): {url}")
+                return None
+            body = head
+            for chunk in chunks:
+                body += chunk
+                if len(body) > self.max_download_bytes:
+                    logging.info(f"Görsel çok büyük (>{self.max_download_bytes // (1024 * 1024)} MB): {url}")
+                    return None
+            metrics.inc("scraper_http_bytes_total", len(body), host=host)
+            return bytes(body), info
+        finally:
+            response.close()
+
+    def _render(self, body):
+        Image, ImageOps = self._pillow
+        with Image.open(io.BytesIO(body)) as img:
+            img = ImageOps.exif_transpose(img)
+            img.thumbnail((self.max_width, self.max_height), Image.LANCZOS)
+            out = io.BytesIO()
+            if self.image_format == 'jpeg':
+                if img.mode != 'RGB':
+                    # Saydam alanlar beyaz zemine oturtulur
+                    rgba = img.convert('RGBA')
+                    background = Image.new('RGB', rgba.size, (255, 255, 255))
+                    background.paste(rgba, mask=rgba.getchannel('A'))
+                    img = background
+                img.save(out, 'JPEG', quality=self.quality, optimize=True, progressive=True)
+            else:
+                if img.mode not in ('RGB', 'RGBA'):
+                    img = img.convert('RGBA' if 'A' in img.getbands() or 'transparency' in img.info else 'RGB')
+                img.save(out, 'WEBP', quality=self.quality, method=4)
+        return out.getvalue()
+
+    def localize(self, url):
+        """
+        Görsel URL'sini yerel türevin URL'sine çevirir.
+        Dönüş: yerel URL; görsel reddedildiyse None; türev üretilemiyorsa
+        (Pillow yok, indirme hatası, çözülemeyen görsel) orijinal URL
+        """
+        if not url or not url.startswith(('http://', 'https://')):
+            return url
+        # Türev üretilemeyecekse görsel hiç indirilmez
+        if not self._image_module():
+            return url
+        host = urlsplit(url).netloc.lower()
+        local_url = self._lookup(url)
+        if local_url is not None:
+            self._count('cached', host)
+            return local_url
+        with self._lock:
+            if url in self._negative:
+                return self._negative[url]
+
+        start = time.perf_counter()
+        try:
+            downloaded = self.download(url)
+        except Exception as e:
+            logging.info(f"Görsel indirilemedi: {url} ({e})")
+            self._count('failed', host)
+            self._remember_negative(url, url)
+            return url
+        if downloaded is None:
+            self._count('rejected', host)
+            self._remember_negative(url, None)
+            return None
+
+        body, _ = downloaded
+        # Anahtar işleme ayarlarını da içerir; ayar değişince yeni türev üretilir
+        params = f"{self.max_width}x{self.max_height}:{self.image_format}:{self.quality}"
+        digest = hashlib.sha256(body + params.encode()).hexdigest()
+        local_url = f"{self.url_prefix}{digest[:2]}/{digest}{EXTENSIONS[self.image_format]}"
+        path = self._path_for(local_url)
+        if not os.path.exists(path):
+            try:
+                data = self._render(body)
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                tmp_path = f"{path}.tmp.{os.getpid()}.{threading.get_ident()}"
+                with open(tmp_path, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, path)
+            except Exception as e:
+                logging.info(f"Görsel türevi üretilemedi: {url} ({e})")
+                self._count('failed', host)
+                self._remember_negative(url, url)
+                return url
+            logging.info(f"Görsel türevi: {len(body) // 1024} KB -> {len(data) // 1024} KB ({url})")
+        self._remember(url, local_url)
+        self._count('created', host)
+        metrics.observe("scraper_image_seconds", time.perf_counter() - start, host=host)
+        return local_url
@@ -0,0 +1,32 @@
+import importlib
+import threading
+
+
+class LazyModule:
+    """
+    Modülü ilk öznitelik erişiminde içe aktaran vekil.
+
+    Ağır bağımlılıklar (genai, bs4, feedparser, lxml, requests) böylece yalnızca
+    onları kullanan kod yolunda yüklenir; WSGI sağlık kontrolü veya --compact gibi
+    kısa çalıştırmalar bu maliyeti ödemez. İlk yükleme kilitlidir, pipeline
+    thread'leri aynı anda erişse de modül bir kez içe aktarılır.
+    """
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+        self._lock = threading.Lock()
+
+    def _load(self):
+        with self._lock:
+            if self._module is None:
+                self._module = importlib.import_module(self._name)
+        return self._module
+
+    def __getattr__(self, attr):
+        # Yalnızca örnekte bulunmayan adlar için çağrılır
+        return getattr(self._module or self._load(), attr)
+
+    def __repr__(self):
+        state = "yüklendi" if self._module is not None else "yüklenmedi"
+        return f"<LazyModule {self._name} ({state})>"
@@ -0,0 +1,194 @@
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+from storage import write_json_atomic
+
+# Saniye cinsinden gecikme histogramı sınırları
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+
+# Dışa aktarılan metrikler ve açıklamaları (Prometheus HELP satırları)
+HELP = {
+    'scraper_stage_seconds': "Pipeline aşaması başına iş süresi",
+    'scraper_stage_items_total': "Pipeline aşamasına giren öğe sayısı",
+    'scraper_stage_errors_total': "Pipeline aşamasında fırlatılan hata sayısı",
+    'scraper_source_seconds': "Kaynak listesi/feed'i tarama süresi (çekme + ayrıştırma)",
+    'scraper_source_items_total': "Kaynakta bulunan haber sayısı",
+    'scraper_article_seconds': "Makale sayfası çekme + çıkarım süresi",
+    'scraper_http_requests_total': "HTTP istek sayısı (host ve durum koduna göre)",
+    'scraper_http_bytes_total': "İndirilen yanıt gövdesi baytı",
+    'scraper_http_seconds': "HTTP istek süresi",
+    'scraper_page_cache_hits_total': "Ağa gitmeden sayfa önbelleğinden okunan sayfalar",
+    'scraper_parse_seconds': "Makale HTML'i ayrıştırma süresi",
+    'scraper_llm_seconds': "Model isteği süresi (kota beklemesi hariç)",
+    'scraper_llm_requests_total': "Model istek sayısı (sonuca göre)",
+    'scraper_llm_tokens_total': "Model token kullanımı (prompt / çıktı)",
+    'scraper_save_seconds': "Haber kaydetme süresi",
+    'scraper_saved_total': "Kaydedilen haber sayısı",
+    'scraper_duplicates_total': "Atlanan tekrar haberler (url / yakın kopya)",
+    'scraper_cycle_seconds': "Tarama döngüsü süresi",
+    'scraper_images_total': "İşlenen haber görselleri (önbellekten / üretildi / reddedildi / hata)",
+    'scraper_image_seconds': "Görsel indirme + türev üretme süresi",
+}
+
+
+class _Histogram:
+    __slots__ = ('buckets', 'counts', 'sum', 'count')
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.sum += value
+        self.count += 1
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+
+
+class MetricsRegistry:
+    """
+    Süreç içi sayaç ve histogram kaydı. Etiketler anahtar kelime argümanı olarak verilir:
+    inc("scraper_http_requests_total", host="wired.com", status="200").
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self._counters = {}
+        self._histograms = {}
+        self._lock = threading.Lock()
+        self._exporter = None
+        self._stop = threading.Event()
+
+    @staticmethod
+    def _key(name, labels):
+        return name, tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+    def inc(self, name, value=1, **labels):
+        key = self._key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name, value, **labels):
+        key = self._key(name, labels)
+        with self._lock:
+            hist = self._histograms.get(key)
+            if hist is None:
+                hist = self._histograms[key] = _Histogram(self.buckets)
+            hist.observe(value)
+
+    @contextmanager
+    def timer(self, name, **labels):
+        """Blok süresini name histogramına ekler."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def snapshot(self):
+        """JSON'a yazılabilir anlık görüntü."""
+        with self._lock:
+            counters = [
+                {'name': name, 'labels': dict(labels), 'value': value}
+                for (name, labels), value in sorted(self._counters.items())
+            ]
+            histograms = [
+                {
+                    'name': name, 'labels': dict(labels), 'count': h.count, 'sum': h.sum,
+                    'buckets': {str(b): c for b, c in zip(h.buckets, _cumulative(h.counts))}
+                }
+                for (name, labels), h in sorted(self._histograms.items())
+            ]
+        return {'generated_at': time.time(), 'counters': counters, 'histograms': histograms}
+
+    def render_prometheus(self):
+        """Prometheus text exposition formatı."""
+        snap = self.snapshot()
+        lines = []
+        declared = set()
+
+        def declare(name, kind):
+            if name not in declared:
+                declared.add(name)
+                if name in HELP:
+                    lines.append(f"# HELP {name} {HELP[name]}")
+                lines.append(f"# TYPE {name} {kind}")
+
+        for c in snap['counters']:
+            declare(c['name'], "counter")
+            lines.append(f"{c['name']}{_labels(c['labels'])} {_number(c['value'])}")
+        for h in snap['histograms']:
+            declare(h['name'], "histogram")
+            for bound, count in h['buckets'].items():
+                lines.append(f"{h['name']}_bucket{_labels(h['labels'], le=bound)} {count}")
+            lines.append(f"{h['name']}_bucket{_labels(h['labels'], le='+Inf')} {h['count']}")
+            lines.append(f"{h['name']}_sum{_labels(h['labels'])} {_number(h['sum'])}")
+            lines.append(f"{h['name']}_count{_labels(h['labels'])} {h['count']}")
+        return "\n".join(lines) + "\n"
+
+    def export(self, json_path=None, prom_path=None):
+        """Metrikleri dosyalara atomik olarak yazar."""
+        try:
+            if json_path:
+                write_json_atomic(json_path, self.snapshot(), indent=2)
+            if prom_path:
+                tmp_path = f"{prom_path}.tmp.{os.getpid()}"
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    f.write(self.render_prometheus())
+                os.replace(tmp_path, prom_path)
+        except OSError as e:
+            logging.error(f"Metrikler yazılamadı: {e}")
+
+    def _export_loop(self, json_path, prom_path, interval):
+        while not self._stop.wait(interval):
+            self.export(json_path, prom_path)
+
+    def start_exporter(self, json_path=None, prom_path=None, interval=15):
+        """Metrik dosyalarını interval saniyede bir yeniden yazan arka plan thread'ini başlatır."""
+        if self._exporter is not None:
+            return
+        self._stop.clear()
+        self._exporter = threading.Thread(target=self._export_loop, args=(json_path, prom_path, interval), daemon=True)
+        self._exporter.start()
+
+    def stop_exporter(self):
+        if self._exporter is not None:
+            self._stop.set()
+            self._exporter.join()
+            self._exporter = None
+
+
+def _cumulative(counts):
+    total = 0
+    for c in counts:
+        total += c
+        yield total
+
+
+def _escape(value):
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(labels, **extra):
+    items = list(labels.items()) + list(extra.items())
+    if not items:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(str(v))}"' for k, v in items) + "}"
+
+
+def _number(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+# Süreç genelinde paylaşılan kayıt; modüller doğrudan metrics.inc/observe/timer kullanır
+registry = MetricsRegistry()
+inc = registry.inc
+observe = registry.observe
+timer = registry.timer
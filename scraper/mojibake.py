@@ -0,0 +1,47 @@
+# UTF-8 metnin Windows-1252 olarak okunmasından kalan yaygın bozulmalar
+REPLACEMENTS = {
+    "â€¢": "•",
+    "â€“": "–",
+    "â€”": "—",
+    "â€™": "'",
+    "â€œ": '"',
+    "â€?": '"',
+    "Â": "",
+    "â€¦": "...",
+    "Ä±": "ı",
+    "ÄŸ": "ğ",
+    "Ã¼": "ü",
+    "ÅŸ": "ş",
+    "Ã¶": "ö",
+    "Ã§": "ç"
+}
+
+# Bozuk dizilerin ilk karakteri -> ilk iki karakterleri. Önce tek karakter aranır
+# (hızlı), varsa "zekâ" gibi düzgün metinler yanlış alarm vermesin diye iki karakter.
+_MARKERS = {}
+for _key in REPLACEMENTS:
+    _MARKERS.setdefault(_key[0], set()).add(_key[:2])
+
+
+def needs_fix(text):
+    """Metinde düzeltilecek bir dizi olabilir mi (hızlı ön kontrol)."""
+    if not text or not isinstance(text, str) or text.isascii():
+        return False
+    return any(
+        lead in text and any(marker in text for marker in markers)
+        for lead, markers in _MARKERS.items()
+    )
+
+
+def fix_encoding(text):
+    """
+    Bozuk karakter dizilerini düzeltir. Düzeltilecek bir şey yoksa (çoğu metin)
+    hızlı ön kontrolden sonra metin kopyalanmadan aynen döner; bozuk metinde
+    ardışık str.replace, derlenmiş tek geçişli desenden daha hızlıdır
+    (bkz. benchmarks/bench_fix_encoding.py).
+    """
+    if not needs_fix(text):
+        return text
+    for old, new in REPLACEMENTS.items():
+        text = text.replace(old, new)
+    return text
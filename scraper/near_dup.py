@@ -0,0 +1,177 @@
+import hashlib
+import json
+import logging
+import os
+import random
+import re
+import threading
+import time
+from collections import deque
+
+from storage import write_json_atomic
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_TOKEN_RE = re.compile(r"\w{3,}")
+
+
+def _token_hash(token):
+    return int.from_bytes(hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+class NearDuplicateIndex:
+    """
+    Başlık ve giriş paragraflarının MinHash imzalarıyla yakın kopya haber tespiti.
+
+    Farklı kaynaklardaki aynı duyuru, tahmini Jaccard benzerliği threshold'u
+    geçerse kopya sayılır. Aday arama LSH bantlarıyla yapılır (bands x rows =
+    num_perm); yalnızca window saniyeden yeni kayıtlar tutulur. İmzalar diske
+    kaydedilir, böylece döngüler ve yeniden başlatmalar arasında korunur.
+
+    check() kopya olmayan haberi yalnızca işlemde olarak ayırır; indekse
+    kayıt başarılı olduktan sonra add() ile girer. Kaydedilemeyen haberin
+    kopyaları sonraki döngülerde yeniden değerlendirilir.
+    """
+
+    def __init__(self, path, threshold=0.6, window=48 * 3600, num_perm=64, bands=16, lead_chars=600):
+        if num_perm % bands:
+            raise ValueError("num_perm, bands'in katı olmalı")
+        self.path = path
+        self.threshold = threshold
+        self.window = window
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.lead_chars = lead_chars
+        rng = random.Random(1)
+        self._perms = [(rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME)) for _ in range(num_perm)]
+        self._entries = None          # url -> {'title', 'ts', 'sig'}
+        self._order = deque()         # (ts, url), eskiden yeniye
+        self._buckets = {}            # (bant, satırlar) -> {url}
+        self._pending = {}            # url -> {'title', 'sig'}, check() geçti, kaydı bekleniyor
+        self._lock = threading.Lock()
+        self._dirty = False
+        self.duplicates = 0
+
+    def tokens(self, title, text):
+        lead = (text or "")[:self.lead_chars]
+        return set(_TOKEN_RE.findall(f"{title or ''} {lead}".lower()))
+
+    def signature(self, title, text):
+        """Başlık + giriş metninin MinHash imzası; metin boşsa None."""
+        hashes = [_token_hash(t) for t in self.tokens(title, text)]
+        if not hashes:
+            return None
+        return [min((a * h + b) % _MERSENNE_PRIME for h in hashes) for a, b in self._perms]
+
+    def _band_keys(self, sig):
+        return [(i, tuple(sig[i * self.rows:(i + 1) * self.rows])) for i in range(self.bands)]
+
+    @staticmethod
+    def similarity(sig_a, sig_b):
+        return sum(1 for x, y in zip(sig_a, sig_b) if x == y) / len(sig_a)
+
+    def _load(self):
+        if self._entries is not None:
+            return
+        self._entries = {}
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                records = json.load(f)
+        except (OSError, ValueError) as e:
+            logging.info(f"Yakın kopya indeksi okunamadı, sıfırdan başlanıyor: {e}")
+            return
+        for record in sorted(records, key=lambda r: r['ts']):
+            if len(record.get('sig', [])) == self.num_perm:
+                self._insert(record['url'], record.get('title', ''), record['ts'], record['sig'])
+
+    def _insert(self, url, title, ts, sig):
+        self._entries[url] = {'title': title, 'ts': ts, 'sig': sig}
+        self._order.append((ts, url))
+        for key in self._band_keys(sig):
+            self._buckets.setdefault(key, set()).add(url)
+
+    def _expire(self, now):
+        while self._order and self._order[0][0] < now - self.window:
+            ts, url = self._order.popleft()
+            entry = self._entries.get(url)
+            if entry is None or entry['ts'] != ts:
+                continue
+            del self._entries[url]
+            for key in self._band_keys(entry['sig']):
+                bucket = self._buckets.get(key)
+                if bucket is not None:
+                    bucket.discard(url)
+                    if not bucket:
+                        del self._buckets[key]
+            self._dirty = True
+
+    def check(self, url, title, text, now=None):
+        """
+        Haberi zaman penceresindeki kayıtlarla ve işlemdeki haberlerle karşılaştırır.
+        Kopyaysa (benzer_url, benzer_başlık, benzerlik) döner. Kopya değilse
+        haberi işlemde olarak ayırır (aynı döngüdeki kopyaları da elenir) ve
+        None döner; indekse eklemek için kayıttan sonra add() çağrılmalı.
+        """
+        sig = self.signature(title, text)
+        if sig is None:
+            return None
+        now = time.time() if now is None else now
+        with self._lock:
+            self._load()
+            self._expire(now)
+            candidates = set()
+            for key in self._band_keys(sig):
+                candidates |= self._buckets.get(key, set())
+            best = None
+            for other in candidates:
+                if other == url:
+                    continue
+                score = self.similarity(sig, self._entries[other]['sig'])
+                if score >= self.threshold and (best is None or score > best[2]):
+                    best = (other, self._entries[other]['title'], score)
+            for other, entry in self._pending.items():
+                if other == url:
+                    continue
+                score = self.similarity(sig, entry['sig'])
+                if score >= self.threshold and (best is None or score > best[2]):
+                    best = (other, entry['title'], score)
+            if best is not None:
+                self.duplicates += 1
+                return best
+            if url not in self._entries:
+                self._pending[url] = {'title': title, 'sig': sig}
+        return None
+
+    def add(self, url, now=None):
+        """check()'ten geçmiş haberi kaydı başarılı olduktan sonra indekse ekler."""
+        now = time.time() if now is None else now
+        with self._lock:
+            entry = self._pending.pop(url, None)
+            if entry is None:
+                return
+            self._load()
+            if url not in self._entries:
+                self._insert(url, entry['title'], now, entry['sig'])
+                self._dirty = True
+
+    def release_pending(self):
+        """Kaydedilemeyen haberlerin ayrımlarını bırakır (döngü sonunda)."""
+        with self._lock:
+            self._pending.clear()
+
+    def save(self):
+        with self._lock:
+            if not self._dirty or self._entries is None:
+                return
+            records = [{'url': url, 'title': e['title'], 'ts': e['ts'], 'sig': e['sig']} for url, e in self._entries.items()]
+            try:
+                write_json_atomic(self.path, records, indent=None)
+                self._dirty = False
+            except OSError as e:
+                logging.error(f"Yakın kopya indeksi yazılamadı: {e}")
+
+    def stats(self):
+        with self._lock:
+            return {"entries": len(self._entries or {}), "duplicates": self.duplicates}
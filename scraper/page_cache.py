@@ -0,0 +1,98 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+import zlib
+
+from storage import evict_cache_dir
+
+
+class PageCache:
+    """
+    Makale sayfaları için sıkıştırılmış, URL anahtarlı disk önbelleği.
+
+    Her sayfa cache_dir altında <sha256(url)>.z dosyası olarak zlib ile
+    sıkıştırılmış tutulur. ttl saniyeden eski kayıtlar kullanılmaz; toplam
+    boyut max_bytes'ı aşınca en uzun süredir erişilmeyen (LRU) kayıtlar silinir.
+    """
+
+    EVICT_EVERY = 50  # Her put'ta dizini taramamak için temizlik aralığı
+
+    def __init__(self, cache_dir, ttl=6 * 3600, max_bytes=200 * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.bytes_saved = 0
+        self._puts = 0
+        self._lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _path(self, url):
+        return os.path.join(self.cache_dir, hashlib.sha256(url.encode("utf-8")).hexdigest() + ".z")
+
+    def get(self, url):
+        """
+        Önbellekteki sayfayı döner.
+        Dönüş: (meta, body) veya bulunamazsa/süresi dolmuşsa None
+        """
+        path = self._path(url)
+        try:
+            stat = os.stat(path)
+            if time.time() - stat.st_mtime > self.ttl:
+                os.remove(path)
+                with self._lock:
+                    self.expired += 1
+                    self.misses += 1
+                return None
+            with open(path, "rb") as f:
+                raw = zlib.decompress(f.read())
+            header, body = raw.split(b"\n", 1)
+            meta = json.loads(header)
+            # LRU için erişim zamanını güncelle, mtime (TTL) korunur
+            os.utime(path, (time.time(), stat.st_mtime))
+        except (OSError, ValueError, zlib.error):
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+            self.bytes_saved += len(body)
+        return meta, body
+
+    def put(self, url, meta, body):
+        path = self._path(url)
+        tmp_path = f"{path}.tmp.{threading.get_ident()}"
+        header = json.dumps(meta, ensure_ascii=False).encode("utf-8")
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(zlib.compress(header + b"\n" + body, 6))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logging.error(f"Sayfa önbelleğine yazılamadı: {e}")
+            return
+        with self._lock:
+            self._puts += 1
+            should_evict = self._puts % self.EVICT_EVERY == 0
+        if should_evict:
+            self.evict()
+
+    def evict(self):
+        """Süresi dolmuş kayıtları ve boyut sınırını aşan en eski erişilen kayıtları siler."""
+        with self._lock:
+            evict_cache_dir(self.cache_dir, ".z", self.ttl, self.max_bytes)
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "expired": self.expired,
+                "hit_rate": round(self.hits / total, 3) if total else 0.0,
+                "bytes_saved": self.bytes_saved
+            }
@@ -0,0 +1,135 @@
+import logging
+import queue
+import threading
+import time
+
+import metrics
+
+_STOP = object()
+
+
+class Stage:
+    """
+    Pipeline aşaması: sınırlı bir giriş kuyruğu ve workers adet iş parçacığı.
+
+    func her öğe için çağrılır ve çıktı öğelerinin bir iterable'ını döner
+    (hiç, bir veya birden fazla öğe). batch_size verilirse func en fazla
+    batch_size öğelik listelerle çağrılır; kuyrukta bekleyen öğeler
+    batch_timeout saniye içinde toplanır.
+    """
+
+    def __init__(self, name, func, workers=1, queue_size=32, batch_size=None, batch_timeout=2.0):
+        self.name = name
+        self.func = func
+        self.workers = max(1, workers)
+        self.batched = batch_size is not None
+        self.batch_size = max(1, batch_size or 1)
+        self.batch_timeout = batch_timeout
+        self.queue = queue.Queue(maxsize=max(1, queue_size))
+        self.processed = 0
+        self.emitted = 0
+        self.errors = 0
+        self._lock = threading.Lock()
+
+    def _next_batch(self):
+        """Kuyruktan en fazla batch_size öğe alır; STOP gelirse (batch, True) döner."""
+        item = self.queue.get()
+        if item is _STOP:
+            return [], True
+        batch = [item]
+        deadline = time.monotonic() + self.batch_timeout
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = self.queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is _STOP:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def _work(self, emit):
+        while True:
+            if self.batched:
+                batch, stopped = self._next_batch()
+                units = [batch] if batch else []
+            else:
+                item = self.queue.get()
+                stopped = item is _STOP
+                units = [] if stopped else [item]
+            for unit in units:
+                start = time.perf_counter()
+                try:
+                    outputs = list(self.func(unit) or [])
+                except Exception as e:
+                    with self._lock:
+                        self.errors += 1
+                    metrics.inc("scraper_stage_errors_total", stage=self.name)
+                    logging.error(f"Pipeline aşaması '{self.name}' hatası: {e}")
+                    outputs = []
+                metrics.observe("scraper_stage_seconds", time.perf_counter() - start, stage=self.name)
+                metrics.inc("scraper_stage_items_total", len(unit) if self.batched else 1, stage=self.name)
+                with self._lock:
+                    self.processed += len(unit) if self.batched else 1
+                    self.emitted += len(outputs)
+                for output in outputs:
+                    emit(output)
+            if stopped:
+                return
+
+    def stats(self):
+        with self._lock:
+            return {"processed": self.processed, "emitted": self.emitted, "errors": self.errors}
+
+
+class Pipeline:
+    """
+    Aşamaları sınırlı kuyruklarla birbirine bağlayan akış hattı.
+
+    Her aşama kendi iş parçacıklarında çalışır; kuyruk dolduğunda bir önceki
+    aşama bekler (backpressure), böylece ağ G/Ç'si model gecikmesiyle
+    örtüşürken bellek kullanımı sınırlı kalır.
+
+    wrap verilirse her aşama fonksiyonu wrap(func) ile sarılır (ör. profilleme).
+    """
+
+    def __init__(self, wrap=None):
+        self.stages = []
+        self.wrap = wrap
+
+    def add_stage(self, name, func, **kwargs):
+        if self.wrap is not None:
+            func = self.wrap(func)
+        self.stages.append(Stage(name, func, **kwargs))
+        return self
+
+    def run(self, inputs):
+        """inputs öğelerini ilk aşamaya besler ve tüm aşamalar bitene kadar bekler."""
+        threads = []
+        for index, stage in enumerate(self.stages):
+            if index + 1 < len(self.stages):
+                emit = self.stages[index + 1].queue.put
+            else:
+                emit = lambda output: None
+            stage_threads = [
+                threading.Thread(target=stage._work, args=(emit,), name=f"{stage.name}-{i}", daemon=True)
+                for i in range(stage.workers)
+            ]
+            for t in stage_threads:
+                t.start()
+            threads.append(stage_threads)
+
+        first = self.stages[0]
+        for item in inputs:
+            first.queue.put(item)
+        # Her aşama bitince bir sonrakine worker sayısı kadar STOP gönderilir
+        for index, stage in enumerate(self.stages):
+            for _ in range(stage.workers):
+                stage.queue.put(_STOP)
+            for t in threads[index]:
+                t.join()
+
+        return {stage.name: stage.stats() for stage in self.stages}
@@ -0,0 +1,105 @@
+import cProfile
+import functools
+import io
+import logging
+import os
+import pstats
+import threading
+import time
+from contextlib import contextmanager
+
+
+class Profiler:
+    """
+    İsteğe bağlı cProfile sarmalayıcısı.
+
+    cProfile yalnızca etkinleştirildiği thread'i ölçtüğü için her thread kendi
+    Profile nesnesini kullanır; dump() hepsini tek bir pstats raporunda
+    birleştirir. section() iç içe çağrılarda yalnızca en dıştaki bloğu ölçer.
+    """
+
+    def __init__(self, output_dir, top_n=30, sort="cumulative"):
+        self.output_dir = output_dir
+        self.top_n = top_n
+        self.sort = sort
+        self._profiles = []
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def _thread_profile(self):
+        prof = getattr(self._local, 'profile', None)
+        if prof is None:
+            prof = self._local.profile = cProfile.Profile()
+            self._local.depth = 0
+            with self._lock:
+                self._profiles.append(prof)
+        return prof
+
+    @contextmanager
+    def section(self):
+        """Bloğu çağıran thread'in profiline ekler."""
+        prof = self._thread_profile()
+        self._local.depth += 1
+        if self._local.depth == 1:
+            prof.enable()
+        try:
+            yield
+        finally:
+            self._local.depth -= 1
+            if self._local.depth == 0:
+                prof.disable()
+
+    def wrap(self, func):
+        """func'ın her çağrısını profiller."""
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with self.section():
+                return func(*args, **kwargs)
+        wrapper.__wrapped_profiler__ = self
+        return wrapper
+
+    def dump(self, label):
+        """
+        Toplanan profilleri zaman damgalı .prof dosyasına ve ilk top_n
+        satırlık özet metnine yazar. Dönüş: (prof_yolu, özet_yolu) veya veri yoksa None
+        """
+        with self._lock:
+            profiles = [p for p in self._profiles if p.getstats()]
+        if not profiles:
+            return None
+        os.makedirs(self.output_dir, exist_ok=True)
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        base = os.path.join(self.output_dir, f"{label}-{stamp}-{os.getpid()}")
+
+        stats = pstats.Stats(profiles[0])
+        for prof in profiles[1:]:
+            stats.add(prof)
+        stats.dump_stats(base + ".prof")
+
+        out = io.StringIO()
+        pstats.Stats(base + ".prof", stream=out).strip_dirs().sort_stats(self.sort).print_stats(self.top_n)
+        with open(base + ".txt", "w", encoding="utf-8") as f:
+            f.write(out.getvalue())
+        logging.info(f"Profil yazıldı: {base}.prof ({len(profiles)} thread), özet: {base}.txt")
+        return base + ".prof", base + ".txt"
+
+
+@contextmanager
+def profile_functions(namespace, names, profiler):
+    """
+    namespace (modül globals()'ı) içindeki adlandırılmış fonksiyonları blok
+    süresince profilleyen sarmalayıcılarla değiştirir, sonra geri yükler.
+    Fonksiyonlar çağrı anında global isimden çözüldüğü için tüm çağıranlar etkilenir.
+    """
+    originals = {}
+    try:
+        for name in names:
+            func = namespace.get(name)
+            if not callable(func):
+                logging.info(f"Profillenecek fonksiyon bulunamadı: {name}")
+                continue
+            originals[name] = func
+            namespace[name] = profiler.wrap(func)
+        yield
+    finally:
+        namespace.update(originals)
@@ -0,0 +1,115 @@
+import logging
+import re
+import threading
+import time
+
+
+def estimate_tokens(text):
+    """Kaba token tahmini (~4 karakter = 1 token)."""
+    return max(1, len(text or "") // 4)
+
+
+def is_quota_error(error):
+    """Model hatasının kota/rate limit kaynaklı olup olmadığını döner."""
+    msg = str(error)
+    if "403" in msg and "unregistered callers" in msg:
+        return True
+    return (
+        "429" in msg
+        or "quota" in msg.lower()
+        or "rate limit" in msg.lower()
+        or "ResourceExhausted" in type(error).__name__
+    )
+
+
+def parse_retry_after(error):
+    """Hata mesajındaki 'retry in 12.5s' / 'retry_delay { seconds: 12 }' bilgisini saniye olarak döner."""
+    msg = str(error)
+    match = re.search(r'retry in ([\d.]+)\s*s', msg, re.IGNORECASE) or \
+        re.search(r'retry_delay\s*\{\s*seconds:\s*(\d+)', msg)
+    return float(match.group(1)) if match else None
+
+
+class QuotaGovernor:
+    """
+    Dakikalık istek (RPM) ve token (TPM) limitleri için token-bucket kota yöneticisi.
+
+    acquire() kota varsa hemen döner, yoksa yalnızca gereken süre kadar bekler.
+    Gerçek token kullanımı record_usage() ile bildirilir; kota hatalarında
+    report_quota_error() üstel geri çekilme (backoff) uygular.
+    """
+
+    def __init__(self, rpm=30, tpm=15000, max_backoff=600):
+        self.rpm = rpm
+        self.tpm = tpm
+        self.max_backoff = max_backoff
+        self._requests = float(rpm)
+        self._tokens = float(tpm)
+        self._last_refill = time.monotonic()
+        self._blocked_until = 0.0
+        self._backoff = 0.0
+        self._cond = threading.Condition()
+        self.total_requests = 0
+        self.total_tokens = 0
+        self.quota_errors = 0
+
+    def configure(self, rpm=None, tpm=None):
+        with self._cond:
+            if rpm:
+                self.rpm = rpm
+                self._requests = min(self._requests, float(rpm))
+            if tpm:
+                self.tpm = tpm
+                self._tokens = min(self._tokens, float(tpm))
+            self._cond.notify_all()
+
+    def _refill(self, now):
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        self._requests = min(float(self.rpm), self._requests + elapsed * self.rpm / 60.0)
+        self._tokens = min(float(self.tpm), self._tokens + elapsed * self.tpm / 60.0)
+
+    def _wait_time(self, tokens, now):
+        if now < self._blocked_until:
+            return self._blocked_until - now
+        wait = 0.0
+        if self._requests < 1:
+            wait = max(wait, (1 - self._requests) * 60.0 / self.rpm)
+        if self._tokens < tokens:
+            wait = max(wait, (tokens - self._tokens) * 60.0 / self.tpm)
+        return wait
+
+    def acquire(self, tokens):
+        """Bir istek ve tahmini token miktarı için kota ayırır, gerekirse bekler."""
+        tokens = min(tokens, self.tpm)
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                wait = self._wait_time(tokens, now)
+                if wait <= 0:
+                    self._requests -= 1
+                    self._tokens -= tokens
+                    self.total_requests += 1
+                    return
+                logging.info(f"Kota bekleniyor: {wait:.1f} sn")
+                self._cond.wait(wait)
+
+    def record_usage(self, actual_tokens, estimated_tokens):
+        """Gerçek token kullanımını bildirir; tahminle arasındaki fark kovaya yansıtılır."""
+        with self._cond:
+            self.total_tokens += actual_tokens
+            self._tokens -= (actual_tokens - min(estimated_tokens, self.tpm))
+            self._backoff = 0.0
+            self._cond.notify_all()
+
+    def report_quota_error(self, retry_after=None):
+        """Kota hatası sonrası tüm istekleri backoff süresi kadar durdurur."""
+        with self._cond:
+            self.quota_errors += 1
+            self._backoff = min(self.max_backoff, max(5.0, self._backoff * 2))
+            delay = retry_after if retry_after is not None else self._backoff
+            self._blocked_until = max(self._blocked_until, time.monotonic() + delay)
+            # Kovayı boşalt: kotanın sunucu tarafında dolduğu biliniyor
+            self._requests = min(self._requests, 0.0)
+            return delay
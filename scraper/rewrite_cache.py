@@ -0,0 +1,88 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+
+from storage import evict_cache_dir
+
+
+def make_cache_key(prompt_version, title, content, categories):
+    """(prompt sürümü, başlık, temizlenmiş içerik, kategori listesi) için sha256 anahtarı üretir."""
+    payload = json.dumps([prompt_version, title or "", content or "", list(categories)], ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class RewriteCache:
+    """
+    Model yeniden yazım sonuçları için içerik adresli, kalıcı önbellek.
+
+    Her sonuç cache_dir altında <sha256>.json dosyası olarak tutulur.
+    max_age saniyeden eski kayıtlar geçersiz sayılır; toplam boyut
+    max_bytes'ı aşınca en eski erişilen kayıtlar silinir.
+    """
+
+    EVICT_EVERY = 50  # Her put'ta dizini taramamak için temizlik aralığı
+
+    def __init__(self, cache_dir, max_bytes=50 * 1024 * 1024, max_age=30 * 24 * 3600):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.hits = 0
+        self.misses = 0
+        self._puts = 0
+        self._lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, key + ".json")
+
+    def get(self, key):
+        path = self._path(key)
+        try:
+            stat = os.stat(path)
+            if time.time() - stat.st_mtime > self.max_age:
+                os.remove(path)
+                raise FileNotFoundError(path)
+            with open(path, "r", encoding="utf-8") as f:
+                result = json.load(f)
+            # Erişim zamanını güncelle (LRU için), mtime yaşı korur
+            os.utime(path, (time.time(), stat.st_mtime))
+        except (OSError, ValueError):
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return result
+
+    def put(self, key, result):
+        path = self._path(key)
+        tmp_path = f"{path}.tmp.{threading.get_ident()}"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(result, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logging.error(f"Yeniden yazım önbelleğine yazılamadı: {e}")
+            return
+        with self._lock:
+            self._puts += 1
+            should_evict = self._puts % self.EVICT_EVERY == 0
+        if should_evict:
+            self.evict()
+
+    def evict(self):
+        """Süresi dolmuş kayıtları ve boyut sınırını aşan en eski erişilen kayıtları siler."""
+        with self._lock:
+            evict_cache_dir(self.cache_dir, ".json", self.max_age, self.max_bytes)
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / total, 3) if total else 0.0
+            }
@@ -0,0 +1,60 @@
+import time
+
+
+class SourceScheduler:
+    """
+    Kaynak başına uyarlanabilir tarama aralığı tutan zamanlayıcı.
+
+    Her kaynak için gözlenen yeni haber hızı (haber/saniye) üstel hareketli
+    ortalama ile izlenir ve aralık, bir taramada yaklaşık target_new_items yeni
+    haber düşecek şekilde ayarlanır. Yeni haber gelmeyen kaynakların aralığı
+    backoff katsayısıyla uzar; aralık her zaman [min_interval, max_interval] içinde kalır.
+    """
+
+    ALPHA = 0.3
+
+    def __init__(self, urls, min_interval=300, max_interval=7200, initial_interval=900,
+                 target_new_items=3, backoff=1.5):
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.target_new_items = target_new_items
+        self.backoff = backoff
+        now = time.time()
+        self.sources = {
+            url: {'interval': initial_interval, 'next_due': now, 'last_poll': None, 'rate': None}
+            for url in urls
+        }
+
+    def _clamp(self, value):
+        return max(self.min_interval, min(self.max_interval, value))
+
+    def due_sources(self, now=None):
+        """Tarama zamanı gelmiş kaynakları döner."""
+        now = time.time() if now is None else now
+        return [url for url, state in self.sources.items() if state['next_due'] <= now]
+
+    def seconds_until_next(self, now=None):
+        now = time.time() if now is None else now
+        if not self.sources:
+            return self.max_interval
+        return max(0.0, min(state['next_due'] for state in self.sources.values()) - now)
+
+    def record(self, url, new_items, now=None):
+        """Tarama sonucunu bildirir ve kaynağın bir sonraki tarama zamanını hesaplar."""
+        now = time.time() if now is None else now
+        state = self.sources[url]
+        elapsed = now - state['last_poll'] if state['last_poll'] else state['interval']
+        observed = new_items / max(elapsed, 1.0)
+        if state['rate'] is None:
+            state['rate'] = observed
+        else:
+            state['rate'] = self.ALPHA * observed + (1 - self.ALPHA) * state['rate']
+
+        if new_items == 0:
+            interval = state['interval'] * self.backoff
+        else:
+            interval = self.target_new_items / state['rate'] if state['rate'] > 0 else state['interval']
+        state['interval'] = self._clamp(interval)
+        state['last_poll'] = now
+        state['next_due'] = now + state['interval']
+        return state['interval']
@@ -1,27 +1,65 @@
 import json
-import mysql.connector
-import requests
-from bs4 import BeautifulSoup
-import google.generativeai as genai
 import time
 import os
 import sys
-from cryptography.fernet import Fernet
-import json
 from urllib.parse import urljoin
-import feedparser
-import xml.etree.ElementTree as ET
 import re
 import logging
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
-from lxml import etree, html
+import threading
 
 
 
 
 sys.path.insert(0, os.path.dirname(__file__))
 
+from lazy_import import LazyModule
+
+# Ağır bağımlılıklar ilk kullanımda yüklenir (bkz. benchmarks/bench_import.py)
+requests = LazyModule("requests")
+bs4 = LazyModule("bs4")
+genai = LazyModule("google.generativeai")
+feedparser = LazyModule("feedparser")
+etree = LazyModule("lxml.etree")
+extract = LazyModule("extract")
+feeds = LazyModule("feeds")
+
+import http_client
+from http_client import http_get, fetch_page
+from url_index import SeenUrlIndex, canonicalize_url
+from storage import JournalStore, ShardedArchive, SqliteStore, archive_lock, write_json_atomic
+from quota import QuotaGovernor, estimate_tokens, is_quota_error, parse_retry_after
+from rewrite_cache import RewriteCache, make_cache_key
+from feed_cache import FeedCache, FeedProgress
+from strategy_cache import ExtractionStrategyCache
+from scheduler import SourceScheduler
+from pipeline import Pipeline
+from sources import load_source_registry
+from mojibake import fix_encoding
+from near_dup import NearDuplicateIndex
+from images import ImageCache
+import metrics
+
+HABERLER_PATH = "/home/webhosting/public_html/data/haberler.json"
+SEEN_URLS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "seen_urls.txt")
+
+# Daha önce kaydedilmiş haberlerin kanonik URL indeksi (süreç başına bir kez yüklenir)
+seen_urls = SeenUrlIndex(SEEN_URLS_PATH, HABERLER_PATH)
+
+# RSS/Atom feed'leri için ETag/Last-Modified önbelleği
+feed_cache = FeedCache(os.path.join(os.path.dirname(os.path.abspath(__file__)), "feed_cache.json"))
+
+# Alan adı başına öğrenilmiş URL varyantı / paragraf seçicisi
+strategy_cache = ExtractionStrategyCache(os.path.join(os.path.dirname(os.path.abspath(__file__)), "extraction_strategies.json"))
+
+# storage_mode "journal" ise configure_storage() tarafından oluşturulur
+journal_store = None
+
+# storage_mode "sqlite" ise configure_storage() tarafından oluşturulur
+sqlite_store = None
+
+# Sıcak haberler.json + aylık soğuk parçalar (archive_hot_days > 0 ise döndürülür)
+archive = ShardedArchive(HABERLER_PATH)
+
 
 def application(environ, start_response):
     start_response('200 OK', [('Content-Type', 'text/plain')])
@@ -30,15 +68,20 @@ def application(environ, start_response):
     response = '\n'.join([message, version])
     return [response.encode()]
     
-# Logging setup for both file and terminal
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.FileHandler(os.path.join(os.path.dirname(__file__), "scraper.log")),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+def configure_logging():
+    """
+    Logging setup for both file and terminal.
+    İçe aktarmada değil komut satırından çalıştırılınca kurulur; WSGI girişi ve
+    scraper'ı modül olarak kullanan araçlar scraper.log açmaz.
+    """
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(levelname)s - %(message)s",
+        handlers=[
+            logging.FileHandler(os.path.join(os.path.dirname(__file__), "scraper.log")),
+            logging.StreamHandler(sys.stdout)
+        ]
+    )
 
 def sleep_until_after_first_quarter():
     try:
@@ -97,21 +140,164 @@ def normalize_category(cat, site_categories):
     if mapped and mapped in site_categories:
         return mapped
     return "Gündem"
-def rewrite_with_gemini(api_key, english_title, english_content, categories):
-    genai.configure(api_key=api_key)
-    model = genai.GenerativeModel('gemma-3-27b-it')
-    
-    prompt = f"""
-    Aşağıdaki İngilizce haberi al ve Türk haber sitesi üslubuyla (TrHaber) yeniden yaz ve çevir.
-    Haber tamamen Türkçe olmalı ve telif haklarına uygun olması için yeniden yorumlanmalıdır.
-    Kategoriyi şu listeden seç: {', '.join(categories)}
-    
+# Prompt veya kurallar değiştiğinde artırılmalı; önbellekteki eski sonuçlar kullanılmaz
+PROMPT_VERSION = "1"
+
+REWRITE_RULES = """
     ÖNEMLİ KURALLAR:
     1. İçerik çok kısaysa (sadece başlık veya kısa özet varsa), ASLA yeni bilgi uydurma. 
     2. Sadece eldeki bilgiyi Türkçeleştir ve haberleştir. 
     3. Yanlış haber yapmaktansa, kısa ve öz haber yapmak daha iyidir.
     4. JSON içinde çift tırnak kullanırken mutlaka ters slaş ile kaçış yap (Örn: \\"Örnek\\").
-    
+"""
+
+_gemini_models = {}
+_gemini_lock = threading.Lock()
+
+# Model istekleri için RPM/TPM kota yöneticisi (configure_quota ile ayarlanır)
+quota_governor = QuotaGovernor()
+QUOTA_MAX_ATTEMPTS = 4
+OUTPUT_TOKENS_PER_ARTICLE = 1024
+
+def configure_quota(config):
+    quota_governor.configure(rpm=config.get('llm_rpm'), tpm=config.get('llm_tpm'))
+
+# Yeniden yazım sonuç önbelleği (configure_rewrite_cache ile oluşturulur)
+rewrite_cache = None
+
+def configure_rewrite_cache(config):
+    global rewrite_cache
+    if not config.get('rewrite_cache_enabled', True):
+        rewrite_cache = None
+        return
+    cache_dir = config.get('rewrite_cache_dir') or os.path.join(os.path.dirname(os.path.abspath(__file__)), "rewrite_cache")
+    rewrite_cache = RewriteCache(
+        cache_dir,
+        max_bytes=config.get('rewrite_cache_max_mb', 50) * 1024 * 1024,
+        max_age=config.get('rewrite_cache_max_age_days', 30) * 24 * 3600
+    )
+
+# Farklı kaynaklardaki aynı haberin yakın kopya indeksi (configure_near_dup ile oluşturulur)
+near_dup_index = None
+
+def configure_near_dup(config):
+    global near_dup_index
+    if not config.get('near_dup_enabled', True):
+        near_dup_index = None
+        return
+    threshold = config.get('near_dup_threshold', 0.6)
+    window = config.get('near_dup_window_hours', 48) * 3600
+    if near_dup_index is not None:
+        # Daemon modunda indeks korunur, sadece ayarlar güncellenir
+        near_dup_index.threshold = threshold
+        near_dup_index.window = window
+        return
+    near_dup_index = NearDuplicateIndex(
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), "near_dup_index.json"),
+        threshold=threshold,
+        window=window
+    )
+
+# image_cache_enabled ise configure_images() tarafından oluşturulur
+image_cache = None
+
+def configure_images(config):
+    global image_cache
+    if not config.get('image_cache_enabled', False):
+        image_cache = None
+        return
+    # server.js public/ dizinini kökten sunar: public/images/haberler -> /images/haberler/
+    root_dir = config.get('image_dir', "/home/webhosting/public_html/public/images/haberler")
+    if image_cache is not None and image_cache.root_dir == root_dir:
+        # Daemon modunda indeks korunur
+        return
+    image_cache = ImageCache(
+        root_dir,
+        config.get('image_url_prefix', "/images/haberler/"),
+        max_width=config.get('image_max_width', 1200),
+        max_height=config.get('image_max_height', 1200),
+        image_format=config.get('image_format', 'webp'),
+        quality=config.get('image_quality', 80),
+        min_width=config.get('image_min_width', 200)
+    )
+    if not image_cache.available():
+        # Uyarı bir kez loglandı; görseller orijinal URL'leriyle kaydedilir
+        image_cache = None
+
+def get_gemini_model(api_key):
+    """GenerativeModel'i API anahtarı başına bir kez oluşturur ve tekrar kullanır."""
+    model = _gemini_models.get(api_key)
+    if model is None:
+        with _gemini_lock:
+            model = _gemini_models.get(api_key)
+            if model is None:
+                genai.configure(api_key=api_key)
+                model = genai.GenerativeModel('gemma-3-27b-it')
+                _gemini_models[api_key] = model
+    return model
+
+def extract_json_text(text):
+    """Model çıktısındaki ```json bloklarını ve fazlalıkları temizleyip JSON metnini döner."""
+    if "```json" in text:
+        text = text.split("```json")[1].split("```")[0].strip()
+    elif "```" in text:
+        text = text.split("```")[1].split("```")[0].strip()
+    text = text.strip()
+    # Tekil nesne veya dizi: en dıştaki parantezleri al
+    open_char, close_char = ('[', ']') if text.startswith('[') else ('{', '}')
+    start = text.find(open_char)
+    end = text.rfind(close_char)
+    if start != -1 and end != -1:
+        text = text[start:end+1]
+    return text
+
+def generate_content(api_key, prompt, article_count=1):
+    """
+    Kota yöneticisi üzerinden model isteği yapar ve yanıt metnini döner.
+    Kota hatalarında (429/quota/403 unregistered callers) backoff uygulanıp tekrar denenir.
+    """
+    model = get_gemini_model(api_key)
+    estimated = estimate_tokens(prompt) + OUTPUT_TOKENS_PER_ARTICLE * article_count
+    for attempt in range(QUOTA_MAX_ATTEMPTS):
+        quota_governor.acquire(estimated)
+        start = time.perf_counter()
+        try:
+            response = model.generate_content(prompt)
+        except Exception as e:
+            quota_error = is_quota_error(e)
+            metrics.inc("scraper_llm_requests_total", result="quota_error" if quota_error else "error")
+            if quota_error and attempt < QUOTA_MAX_ATTEMPTS - 1:
+                delay = quota_governor.report_quota_error(parse_retry_after(e))
+                logging.info(f"Gemini kota hatası, {delay:.1f} sn sonra tekrar denenecek: {e}")
+                continue
+            raise
+        metrics.observe("scraper_llm_seconds", time.perf_counter() - start)
+        metrics.inc("scraper_llm_requests_total", result="ok")
+        usage = getattr(response, 'usage_metadata', None)
+        actual = getattr(usage, 'total_token_count', 0) or estimated
+        metrics.inc("scraper_llm_tokens_total", getattr(usage, 'prompt_token_count', 0) or 0, kind="prompt")
+        metrics.inc("scraper_llm_tokens_total", getattr(usage, 'candidates_token_count', 0) or 0, kind="output")
+        quota_governor.record_usage(actual, estimated)
+        return response.text
+
+def is_valid_rewrite(result):
+    """Yeniden yazım sonucunun kaydedilebilir olup olmadığını kontrol eder (baslik ve icerik zorunlu)."""
+    if not isinstance(result, dict):
+        return False
+    for key in ('baslik', 'icerik'):
+        if not isinstance(result.get(key), str) or not result.get(key).strip():
+            return False
+    for key in ('kisa_baslik', 'ozet', 'kategori'):
+        if result.get(key) is not None and not isinstance(result.get(key), str):
+            return False
+    return True
+
+def rewrite_with_gemini(api_key, english_title, english_content, categories):
+    prompt = f"""
+    Aşağıdaki İngilizce haberi al ve Türk haber sitesi üslubuyla (TrHaber) yeniden yaz ve çevir.
+    Haber tamamen Türkçe olmalı ve telif haklarına uygun olması için yeniden yorumlanmalıdır.
+    Kategoriyi şu listeden seç: {', '.join(categories)}
+    {REWRITE_RULES}
     Format Strictly JSON:
     {{
         "baslik": "Haber başlığı",
@@ -125,131 +311,149 @@ def rewrite_with_gemini(api_key, english_title, english_content, categories):
     İngilizce İçerik: {english_content}
     """
     
-    for attempt in range(2):
-        try:
-            response = model.generate_content(prompt)
-            text = response.text
-            if "```json" in text:
-                text = text.split("```json")[1].split("```")[0].strip()
-            elif "```" in text:
-                text = text.split("```")[1].split("```")[0].strip()
-            text = text.strip()
-            start = text.find('{')
-            end = text.rfind('}')
-            if start != -1 and end != -1:
-                text = text[start:end+1]
-            return json.loads(text)
-        except Exception as e:
-            msg = str(e)
-            if "403" in msg and "unregistered callers" in msg:
-                logging.error(f"Gemini output parsing error: {e}")
-                if attempt == 0:
-                    time.sleep(600)
-                    continue
-            logging.error(f"Gemini output parsing error: {e}")
-            return None
-
-def fix_encoding(text):
-    if not text: return text
-    # Fix common UTF-8 to Windows-1252 artifacts
-    replacements = {
-        "â€¢": "•",
-        "â€“": "–",
-        "â€”": "—",
-        "â€™": "'",
-        "â€œ": '"',
-        "â€?": '"',
-        "Â": "",
-        "â€¦": "...",
-        "Ä±": "ı",
-        "ÄŸ": "ğ",
-        "Ã¼": "ü",
-        "ÅŸ": "ş",
-        "Ã¶": "ö",
-        "Ã§": "ç"
-    }
-    for old, new in replacements.items():
-        text = text.replace(old, new)
-    return text
+    try:
+        text = generate_content(api_key, prompt)
+        return json.loads(extract_json_text(text))
+    except Exception as e:
+        logging.error(f"Gemini output parsing error: {e}")
+        return None
 
-def get_article_full_content(article_url):
+def rewrite_batch_with_gemini(api_key, articles, categories):
+    """
+    Birden fazla haberi tek bir model isteğinde yeniden yazar.
+    articles: [(english_title, english_content), ...]
+    Dönüş: articles ile aynı sırada sonuç listesi (dict veya None).
+    Önbellekte olan haberler için model çağrılmaz; toplu yanıtta eksik
+    ya da geçersiz olan haberler tek tek yeniden denenir.
+    """
+    if rewrite_cache is None:
+        return _rewrite_batch_uncached(api_key, articles, categories)
+
+    keys = [make_cache_key(PROMPT_VERSION, title, content, categories) for title, content in articles]
+    results = [rewrite_cache.get(key) for key in keys]
+    missing = [i for i, result in enumerate(results) if result is None]
+    if missing:
+        fresh = _rewrite_batch_uncached(api_key, [articles[i] for i in missing], categories)
+        for i, result in zip(missing, fresh):
+            results[i] = result
+            if is_valid_rewrite(result):
+                rewrite_cache.put(keys[i], result)
+    return results
+
+def _rewrite_batch_uncached(api_key, articles, categories):
+    if len(articles) == 1:
+        return [rewrite_with_gemini(api_key, articles[0][0], articles[0][1], categories)]
+
+    haberler_text = "\n".join(
+        f"""
+    --- HABER {i} ---
+    İngilizce Başlık: {title}
+    İngilizce İçerik: {content}"""
+        for i, (title, content) in enumerate(articles)
+    )
+    prompt = f"""
+    Aşağıdaki {len(articles)} İngilizce haberin HER BİRİNİ ayrı ayrı al ve Türk haber sitesi üslubuyla (TrHaber) yeniden yaz ve çevir.
+    Haberler tamamen Türkçe olmalı ve telif haklarına uygun olması için yeniden yorumlanmalıdır.
+    Haberleri birbirine karıştırma, her haberin bilgisi yalnızca kendi sonucunda yer almalı.
+    Kategoriyi şu listeden seç: {', '.join(categories)}
+    {REWRITE_RULES}
+    5. Her haber için "index" alanına haberin numarasını yaz.
+
+    Format Strictly JSON array ({len(articles)} eleman):
+    [
+        {{
+            "index": 0,
+            "baslik": "Haber başlığı",
+            "kisa_baslik": "Kısa başlık",
+            "ozet": "Haber özeti",
+            "icerik": "<p>Haber metni...</p>",
+            "kategori": "Kategori"
+        }}
+    ]
+    {haberler_text}
+    """
+
+    results = [None] * len(articles)
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.9,tr;q=0.8',
-            'Accept-Encoding': 'gzip, deflate',
-            'DNT': '1',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-            'Referer': 'https://www.google.com/'
-        }
-        import random
-        time.sleep(random.uniform(1, 3))
-        session = requests.Session()
-        retry = Retry(total=2, backoff_factor=0.5, status_forcelist=[403, 429, 500, 502, 503, 504], allowed_methods=["GET"])
-        adapter = HTTPAdapter(max_retries=retry)
-        session.mount('https://', adapter)
-        session.mount('http://', adapter)
-
-        def fetch_and_extract(url):
-            resp = session.get(url, headers=headers, timeout=15)
-            if resp.status_code == 403:
-                return None, None
-            resp.raise_for_status()
-            sp = BeautifulSoup(resp.content, 'html.parser')
-            og_img = sp.find('meta', property='og:image')
-            img_url = og_img['content'] if og_img and og_img.get('content') else None
-            paras = []
-            if "livemint.com" in url:
-                response = requests.get(url, headers={"User-Agent": "Mozilla/5.0"})
-                soup = BeautifulSoup(response.text, "html.parser")
-                p_tags = soup.find_all('p')
-                for p in p_tags:
-                    t = p.get_text().strip()
-                    if t:
-                        paras.append(t)
-            else:
-                selectors = [
-                    'article p', '.entry-content p', '.article-body p', '.post-content p', 'main p',
-                    '[itemprop="articleBody"] p', '#content p', '.c-article-content p', '.content p'
-                ]
-                for sel in selectors:
-                    found = sp.select(sel)
-                    if found:
-                        for p in found:
-                            t = p.get_text().strip()
-                            if len(t) > 40:
-                                paras.append(t)
-                        if len(paras) > 2:
-                            break
-            return img_url, "\n\n".join(paras)
-
-        image_url, full_text = fetch_and_extract(article_url)
-        
-        if not full_text and "livemint.com" in article_url:
-            full_text = scrape_article(article_url)
-            
-        if not full_text and "livemint.com" not in article_url:
-            amp_url = article_url.rstrip('/') + '/amp'
-            image_url, full_text = fetch_and_extract(amp_url)
+        text = generate_content(api_key, prompt, article_count=len(articles))
+        parsed = json.loads(extract_json_text(text))
+        if isinstance(parsed, list):
+            for pos, obj in enumerate(parsed):
+                if not isinstance(obj, dict):
+                    continue
+                idx = obj.get('index', pos)
+                if isinstance(idx, int) and 0 <= idx < len(articles) and results[idx] is None and is_valid_rewrite(obj):
+                    obj.pop('index', None)
+                    results[idx] = obj
+    except Exception as e:
+        logging.error(f"Gemini toplu çıktı hatası: {e}")
 
-        if not full_text and "livemint.com" not in article_url:
-            sep = '&' if '?' in article_url else '?'
-            amp2_url = f"{article_url}{sep}output=amp"
-            image_url, full_text = fetch_and_extract(amp2_url)
+    for i, (title, content) in enumerate(articles):
+        if results[i] is None:
+            logging.info(f"Toplu sonuçta geçersiz/eksik haber, tek başına yeniden deneniyor: {title[:50]}")
+            results[i] = rewrite_with_gemini(api_key, title, content, categories)
+    return results
 
+# Makale istekleri arasındaki nezaket beklemesi (saniye aralığı); None ise beklenmez.
+# Yalnızca ağa giden isteklerde uygulanır, sayfa önbelleğinden okunan sayfalar beklemez.
+ARTICLE_FETCH_DELAY = (1, 3)
+
+def _fetch_article(article_url):
+    """
+    Makaleyi kanonik URL, /amp ve ?output=amp varyantlarıyla dener; her sayfa bir kez çekilip bir kez ayrıştırılır.
+    Alan adı için öğrenilmiş bir strateji varsa kazanan varyant ve seçici önce denenir.
+    Dönüş: (ilk alınan sayfanın çıkarım sonucu, image_url, full_text)
+    """
+    variants = [('canonical', article_url)]
+    if "livemint.com" not in article_url:
+        sep = '&' if '?' in article_url else '?'
+        variants.append(('amp', article_url.rstrip('/') + '/amp'))
+        variants.append(('output_amp', f"{article_url}{sep}output=amp"))
+    variants, selectors, learned = strategy_cache.plan(article_url, variants, extract.PARAGRAPH_SELECTORS)
+
+    primary = None
+    image_url = None
+    full_text = ""
+    for index, (variant, variant_url) in enumerate(variants):
+        try:
+            result = extract.extract_article(variant_url, selectors, delay=ARTICLE_FETCH_DELAY)
+        except requests.exceptions.RequestException as e:
+            logging.info(f"Sayfa varyantı alınamadı {variant_url}: {e}")
+            result = None
+        if result is None:
+            if learned and index == 0:
+                strategy_cache.record_miss(article_url)
+            continue
+        if primary is None:
+            primary = result
+            image_url = result['image']
+        if result['paragraphs']:
+            image_url = result['image'] or image_url
+            full_text = "\n\n".join(result['paragraphs'])
+            strategy_cache.record(article_url, variant, result['selector'], learned_first_try=learned and index == 0)
+            break
+        if learned and index == 0:
+            strategy_cache.record_miss(article_url)
+
+    if not full_text and "livemint.com" in article_url:
+        full_text = scrape_article(article_url)
+
+    return primary, image_url, full_text
+
+def get_article_full_content(article_url):
+    try:
+        _, image_url, full_text = _fetch_article(article_url)
         return image_url, full_text
     except Exception as e:
         logging.error(f"Error fetching full content from {article_url}: {e}")
         return None, None
 def scrape_article(URL):
-    response = requests.get(URL, headers={"User-Agent": "Mozilla/5.0"})
+    response = fetch_page(URL, headers={"User-Agent": "Mozilla/5.0"})
     if response.status_code != 200:
         print(f"Request failed with status {response.status_code}")
         return
 
-    soup = BeautifulSoup(response.text, "html.parser")
+    soup = bs4.BeautifulSoup(response.text, "html.parser")
 
     # Başlık
     title = soup.find("h1")
@@ -276,60 +480,20 @@ def get_article_details(article_url):
     Bir haber URL'sinden öne çıkan görsel ve kısa açıklama döner.
     Dönüş: (image_url, description)
     """
-    # Önce kapsamlı içerik toplayan yardımcıyı deneyelim
-    img, full_text = get_article_full_content(article_url)
+    img = None
     description = None
     try:
+        # Sayfa tek sefer çekilip ayrıştırılır; görsel ve açıklama aynı sonuçtan gelir
+        primary, img, full_text = _fetch_article(article_url)
         if full_text:
             parts = [p.strip() for p in full_text.split("\n\n") if p.strip()]
-            if len(parts) >= 2:
-                description = (parts[0] + " " + parts[1]).strip()
-            else:
-                description = parts[0]
-            # Çok uzun olursa kısalt
-            if description and len(description) > 400:
-                description = description[:400].rsplit(' ', 1)[0] + "..."
-        # Eksikler için fallback: sayfayı tekrar hafifçe incele
-        if not img or not description:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.9,tr;q=0.8',
-                'Accept-Encoding': 'gzip, deflate',
-                'DNT': '1',
-                'Connection': 'keep-alive',
-                'Upgrade-Insecure-Requests': '1',
-                'Referer': 'https://www.google.com/'
-            }
-            resp = requests.get(article_url, headers=headers, timeout=15)
-            if resp.status_code != 403:
-                resp.raise_for_status()
-                soup = BeautifulSoup(resp.content, 'html.parser')
-                if not img:
-                    og_img = soup.find('meta', property='og:image')
-                    if og_img and og_img.get('content'):
-                        img = og_img['content']
-                if not description:
-                    if "livemint.com" in article_url:
-                        container = soup.select_one('div.taboola-readmore div.storyPage_storyContent__3xuFc') or soup.select_one('div.storyPage_storyContent__3xuFc')
-                        if container:
-                            p_tags = container.select('div.storyParagraph p')
-                            texts = [p.get_text().strip() for p in p_tags if p.get_text().strip()]
-                            if texts:
-                                description = " ".join(texts)
-                                if len(description) > 400:
-                                    description = description[:400].rsplit(' ', 1)[0] + "..."
-                    if not description:
-                        og_desc = soup.find('meta', property='og:description') or soup.find('meta', attrs={'name': 'description'})
-                        if og_desc and og_desc.get('content'):
-                            description = og_desc['content'].strip()
-                        else:
-                            p_tags = soup.select('article p, .entry-content p, .article-body p, .post-content p, main p')
-                            texts = [p.get_text().strip() for p in p_tags if p.get_text().strip()]
-                            if texts:
-                                description = " ".join(texts[:2])
-                                if len(description) > 400:
-                                    description = description[:400].rsplit(' ', 1)[0] + "..."
+            description = extract.shorten(" ".join(parts[:2]).strip())
+        # Eksikler için fallback: ilk sayfanın og:image / og:description / paragraf bilgileri
+        if primary is not None:
+            if not img:
+                img = primary['image']
+            if not description:
+                description = primary['description']
         return img, description
     except Exception as e:
         logging.info(f"get_article_details error for {article_url}: {e}")
@@ -337,80 +501,35 @@ def get_article_details(article_url):
 def scrape_theverge_articles(url):
     articles = []
     try:
-        session = requests.Session()
         headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0 Safari/537.36',
             'Accept': 'application/rss+xml, application/xml;q=0.9, */*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.9',
             'Cache-Control': 'no-cache',
             'Pragma': 'no-cache',
-            'Referer': 'https://www.theverge.com/',
-            'Connection': 'keep-alive'
+            'Referer': 'https://www.theverge.com/'
         }
-        response = None
-        for attempt in range(3):
-            try:
-                resp = session.get(url, headers=headers, timeout=20)
-                if resp.status_code == 200:
-                    response = resp
-                    break
-                if resp.status_code in (403, 420, 429):
-                    time.sleep(2 * (attempt + 1))
-                    continue
-                resp.raise_for_status()
-            except requests.exceptions.RequestException:
-                if attempt == 2:
-                    raise
-                time.sleep(2 * (attempt + 1))
+        # 429/5xx yanıtları ortak HTTP istemcisinin retry politikasıyla tekrar denenir
+        response = feed_cache.fetch(url, headers=headers, timeout=20)
         if response is None:
-            raise requests.exceptions.RequestException("Failed to fetch The Verge RSS after retries")
-        content = response.text
-
-        # Clean CDATA tags to prevent parsing errors
-        content = re.sub(r'<!\[CDATA\[(.*?)\]\]>', r'\1', content, flags=re.DOTALL)
-
-        feed = feedparser.parse(content)
-        if feed.bozo:
-            logging.info(f"Error parsing RSS feed for The Verge: {feed.bozo_exception}")
-            feed = feedparser.parse(response.content)
-            if feed.bozo:
-                logging.info(f"Still can't parse The Verge RSS feed even without CDATA cleaning: {feed.bozo_exception}")
-                # Fallback: let feedparser fetch directly from URL with its own client
-                feed = feedparser.parse(url)
-                if feed.bozo:
-                    logging.info(f"Feedparser URL fallback also failed for The Verge: {feed.bozo_exception}")
-                    return articles
-
-        for entry in feed.entries[:30]:
-            image_url, description = get_article_details(entry.link)
-            
-            if not description and hasattr(entry, 'summary'):
-                soup = BeautifulSoup(entry.summary, 'html.parser')
-                description = soup.get_text(separator=' ', strip=True)
-            elif not description and hasattr(entry, 'description'):
-                soup = BeautifulSoup(entry.description, 'html.parser')
-                description = soup.get_text(separator=' ', strip=True)
-            elif not description:
-                description = entry.title
+            logging.info(f"The Verge feed'i değişmemiş, atlanıyor: {url}")
+            return articles
+        response.raise_for_status()
 
+        # Zaten kayıtlı haberlerin sayfası çekilmez; art arda bilinen haberlerde feed'in kalanı okunmaz
+        for entry in feeds.iter_feed_items(response.content, limit=30, stop_at=check_if_exists):
+            image_url, description = get_article_details(entry['url'])
+            if not description:
+                description = entry['summary'] or entry['title']
             if image_url is None:
-                if hasattr(entry, 'media_content') and entry.media_content:
-                    images = [item for item in entry.media_content if item.get('medium') == 'image']
-                    if images and images[0].get('url'):
-                        image_url = images[0]['url']
-                elif hasattr(entry, 'links'):
-                    for e_link in entry.links:
-                        if e_link.get('type', '').startswith('image/') and e_link.get('href'):
-                            image_url = e_link.href
-                            break
-            
-            if entry.title and entry.link:
-                articles.append({
-                    'title': entry.title,
-                    'url': entry.link,
-                    'image_url': image_url,
-                    'content': description
-                })
+                image_url = entry['image']
+
+            articles.append({
+                'title': entry['title'],
+                'url': entry['url'],
+                'image_url': image_url,
+                'content': description
+            })
+        feed_cache.mark_parsed(url)
     except requests.exceptions.RequestException as e:
         logging.info(f"Error fetching The Verge RSS feed URL: {e}")
     except Exception as e:
@@ -418,9 +537,9 @@ def scrape_theverge_articles(url):
     return articles
 def get_sciencedaily_article_image(article_url):
     try:
-        response = requests.get(article_url)
+        response = fetch_page(article_url)
         response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = bs4.BeautifulSoup(response.content, 'html.parser')
         # Find the image element with class "img-responsive"
         img_element = soup.find('img', class_='img-responsive')
         if img_element:
@@ -437,84 +556,54 @@ def get_sciencedaily_article_image(article_url):
 def scrape_sciencedaily_articles(rss_url):
     articles = []
     try:
-        response = requests.get(rss_url)
+        response = feed_cache.fetch(rss_url)
+        if response is None:
+            logging.info(f"ScienceDaily feed'i değişmemiş, atlanıyor: {rss_url}")
+            return articles
         response.raise_for_status()
-        root = ET.fromstring(response.content)
-
-        for item in root.findall('.//item'):
-            if len(articles) >= 30:
-                break
-            title = item.find('title').text if item.find('title') is not None else ''
-            link = item.find('link').text if item.find('link') is not None else ''
-            description = item.find('description').text if item.find('description') is not None else ''
-
-            image_url = None
-            if link:
-                image_url = get_sciencedaily_article_image(link)
 
+        for entry in feeds.iter_feed_items(response.content, limit=30, stop_at=check_if_exists):
             articles.append({
-                'title': title,
-                'url': link,
-                'image_url': image_url,
-                'content': description # Using description as content for now
+                'title': entry['title'],
+                'url': entry['url'],
+                'image_url': get_sciencedaily_article_image(entry['url']),
+                'content': entry['summary'] # Using description as content for now
             })
+        feed_cache.mark_parsed(rss_url)
     except requests.exceptions.RequestException as e:
         logging.info(f"Error fetching RSS feed from {rss_url}: {e}")
-    except ET.ParseError as e:
+    except etree.XMLSyntaxError as e:
         logging.info(f"Error parsing RSS feed from {rss_url}: {e}")
     return articles
 
 def scrape_livemint_articles(url):
     articles = []
     try:
-        response = requests.get(url, timeout=15)
+        response = feed_cache.fetch(url)
+        if response is None:
+            logging.info(f"Livemint feed'i değişmemiş, atlanıyor: {url}")
+            return articles
         response.raise_for_status()
-        content = response.text
-
-        # Clean CDATA tags to prevent parsing errors
-        # The re.DOTALL flag ensures that '.' matches newlines as well
-        content = re.sub(r'<!\[CDATA\[(.*?)\]\]>', r'\1', content, flags=re.DOTALL)
-
-        feed = feedparser.parse(content)
-        if feed.bozo:
-            logging.info(f"Error parsing RSS feed for Livemint: {feed.bozo_exception}")
-            # Try parsing original content as a fallback, though less likely to work
-            feed = feedparser.parse(response.content)
-            if feed.bozo:
-                logging.info(f"Still can't parse Livemint RSS feed even without CDATA cleaning: {feed.bozo_exception}")
-                return articles
-
-        for entry in feed.entries[:30]:
+
+        for entry in feeds.iter_feed_items(response.content, limit=30, stop_at=check_if_exists):
             # The original code fetches image_url and description from the article link.
             # This is good as RSS feeds sometimes don't have rich image info directly.
-            image_url, description = get_article_details(entry.link)
-            
-            # If get_article_details fails or returns empty description, fall back to entry.summary/description
-            
+            image_url, description = get_article_details(entry['url'])
+
             if not description: # Fallback to title if no description
-                description = entry.title
+                description = entry['title']
 
-            # Ensure image_url is not None before appending
+            # Attempt to find image from feed entry itself if not found via get_article_details
             if image_url is None:
-                # Attempt to find image from feed entry itself if not found via get_article_details
-                if hasattr(entry, 'media_content') and entry.media_content:
-                    images = [item for item in entry.media_content if item.get('medium') == 'image']
-                    if images and images[0].get('url'):
-                        image_url = images[0]['url']
-                elif hasattr(entry, 'links'):
-                    for e_link in entry.links:
-                        if e_link.get('type', '').startswith('image/') and e_link.get('href'):
-                            image_url = e_link.href
-                            break
-            
-            # Only add article if it has a title and URL, and optionally an image or content
-            if entry.title and entry.link:
-                articles.append({
-                    'title': entry.title,
-                    'url': entry.link,
-                    'image_url': image_url, # image_url might still be None, handle on display
-                    'content': description
-                })
+                image_url = entry['image']
+
+            articles.append({
+                'title': entry['title'],
+                'url': entry['url'],
+                'image_url': image_url, # image_url might still be None, handle on display
+                'content': description
+            })
+        feed_cache.mark_parsed(url)
     except requests.exceptions.RequestException as e:
         logging.info(f"Error fetching Livemint RSS feed URL: {e}")
     except Exception as e:
@@ -523,7 +612,8 @@ def scrape_livemint_articles(url):
 
 def scrape_washingtonpost_articles(url):
     articles = []
-    feed = feedparser.parse(url)
+    response = http_get(url)
+    feed = feedparser.parse(response.content)
     if feed.bozo:
         logging.info(f"Error parsing RSS feed: {feed.bozo_exception}")
         return articles
@@ -541,40 +631,25 @@ def scrape_washingtonpost_articles(url):
 
 def scrape_nytimes_articles(url):
     articles = []
-    feed = feedparser.parse(url)
-    if feed.bozo:
-        logging.info(f"Error parsing RSS feed: {feed.bozo_exception}")
-        return articles
-
-    for entry in feed.entries[:30]:
-        description = None
-        if hasattr(entry, 'summary'):
-            description = BeautifulSoup(entry.summary, 'html.parser').get_text(separator=' ', strip=True)
-        elif hasattr(entry, 'description'):
-            description = BeautifulSoup(entry.description, 'html.parser').get_text(separator=' ', strip=True)
-        if not description:
-            description = entry.title
-        
-        image_url = 'No image found'
-        if hasattr(entry, 'media_content') and entry.media_content:
-            image_url = entry.media_content[0]['url']
-        elif hasattr(entry, 'media_thumbnail') and entry.media_thumbnail:
-            image_url = entry.media_thumbnail[0]['url']
-
-        if image_url != 'No image found': # Only add if image_url is found
-            articles.append({
-                'title': entry.title,
-                'url': entry.link,
-                'image_url': image_url,
-                'content': description
-            })
+    response = http_get(url)
+    try:
+        for entry in feeds.iter_feed_items(response.content, limit=30, stop_at=check_if_exists):
+            if entry['image']: # Only add if image_url is found
+                articles.append({
+                    'title': entry['title'],
+                    'url': entry['url'],
+                    'image_url': entry['image'],
+                    'content': entry['summary'] or entry['title']
+                })
+    except etree.XMLSyntaxError as e:
+        logging.info(f"Error parsing RSS feed: {e}")
     return articles
 
 def scrape_arstechnica_articles(url):
     try:
-        response = requests.get(url)
+        response = http_get(url)
         response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = bs4.BeautifulSoup(response.content, 'html.parser')
         articles = []
         for item in soup.select('article.card-list-square'):
             if len(articles) >= 30:
@@ -597,9 +672,9 @@ def scrape_arstechnica_articles(url):
 
 def scrape_cnet_articles(url):
     try:
-        response = requests.get(url)
+        response = http_get(url)
         response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = bs4.BeautifulSoup(response.content, 'html.parser')
         articles = []
         for item in soup.select('a.c-storiesNeonLatest_story'):
             if len(articles) >= 30:
@@ -629,9 +704,9 @@ def scrape_cnet_articles(url):
 
 def scrape_techcrunch_articles(url):
     try:
-        response = requests.get(url)
+        response = http_get(url)
         response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = bs4.BeautifulSoup(response.content, 'html.parser')
         articles = []
         for item in soup.select('li.wp-block-post'):
             if len(articles) >= 30:
@@ -651,9 +726,9 @@ def scrape_techcrunch_articles(url):
 
 def scrape_wired_articles(url):
     try:
-        response = requests.get(url)
+        response = http_get(url)
         response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = bs4.BeautifulSoup(response.content, 'html.parser')
         articles = []
         for item in soup.select('div.SummaryItemWrapper-ircKXK'):
             if len(articles) >= 30:
@@ -686,9 +761,9 @@ def scrape_wired_articles(url):
 
 def scrape_bbc_articles(url):
     try:
-        response = requests.get(url)
+        response = http_get(url)
         response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = bs4.BeautifulSoup(response.content, 'html.parser')
         articles = []
         for item in soup.select('div.ixgXiW div.fKTSfm'):
             if len(articles) >= 30:
@@ -707,9 +782,9 @@ def scrape_bbc_articles(url):
 
 def scrape_cnbc_articles(url):
     try:
-        response = requests.get(url)
+        response = http_get(url)
         response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = bs4.BeautifulSoup(response.content, 'html.parser')
         articles = []
         for item in soup.select('div.Card-card'):
             if len(articles) >= 30:
@@ -729,54 +804,40 @@ def scrape_cnbc_articles(url):
     
 def scrape_gamespot_feed(url="https://www.gamespot.com/feeds/news/"):
     try:
-        response = requests.get(url)
+        response = feed_cache.fetch(url)
+        if response is None:
+            logging.info(f"GameSpot feed'i değişmemiş, atlanıyor: {url}")
+            return []
         response.raise_for_status()
 
-        # XML parse
-        root = etree.fromstring(response.content)
-
+        # Description içindeki HTML düz metne, media:content görsele çevrilir
         articles = []
-        for item in root.findall(".//item")[:30]:
-            title = item.findtext("title")
-            link = item.findtext("link")
-            pub_date = item.findtext("pubDate")
-            guid = item.findtext("guid")
-            creator = item.findtext("{http://purl.org/dc/elements/1.1/}creator")
-
-            # Description içindeki CDATA HTML'i temizle
-            raw_description = item.findtext("description")
-            content = None
-            if raw_description:
-                # HTML parse edip sadece text alıyoruz
-                content = html.fromstring(raw_description).text_content().strip()
-
-            # media:content alanı namespaceli
-            image_url = None
-            media_content = item.find("{http://search.yahoo.com/mrss/}content")
-            if media_content is not None and "url" in media_content.attrib:
-                image_url = media_content.attrib["url"]
-
+        for entry in feeds.iter_feed_items(response.content, limit=30, stop_at=check_if_exists):
             articles.append({
-                "title": title,
-                "url": link,
-                "content": content,
-                "image_url": image_url
+                "title": entry['title'],
+                "url": entry['url'],
+                "content": entry['summary'] or None,
+                "image_url": entry['image']
             })
 
+        feed_cache.mark_parsed(url)
         return articles
 
     except requests.exceptions.RequestException as e:
         logging.info(f"Error fetching GameSpot feed: {e}")
         return []
+    except etree.XMLSyntaxError as e:
+        logging.info(f"Error parsing GameSpot feed: {e}")
+        return []
 
 
 
 
 def scrape_gamespot_articles(url):
     try:
-        response = requests.get(url)
+        response = http_get(url)
         response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = bs4.BeautifulSoup(response.content, 'html.parser')
         articles = []
         # The main container for the latest stories is #river, then section.filter-results
         # Each article item is div.card-item
@@ -823,13 +884,13 @@ def get_gizmodo_featured_image(article_url, timeout=10, headers=None):
         }
 
     try:
-        resp = requests.get(article_url, timeout=timeout, headers=headers)
+        resp = fetch_page(article_url, timeout=timeout, headers=headers)
         resp.raise_for_status()
     except requests.RequestException as e:
         logging.info(f"Error fetching article URL: {e}")
         return None
 
-    soup = BeautifulSoup(resp.content, "html.parser")
+    soup = bs4.BeautifulSoup(resp.content, "html.parser")
 
     # Öncelikli hedef: <figure id="attachment_featured"> içindeki <img>
     fig = soup.select_one('figure#attachment_featured')
@@ -882,9 +943,9 @@ def scrape_gizmodo_articles(url):
         headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/117.0 Safari/537.36"
         }
-        resp = requests.get(url, headers=headers, timeout=10)
+        resp = http_get(url, headers=headers, timeout=10)
         resp.raise_for_status()
-        soup = BeautifulSoup(resp.content, 'html.parser')
+        soup = bs4.BeautifulSoup(resp.content, 'html.parser')
         articles = []
 
         # Başlık seçicisi: listede <a><h3> yapısını hedefliyoruz
@@ -933,9 +994,9 @@ def scrape_gizmodo_articles(url):
 
 def scrape_mashable_articles(url):
     try:
-        response = requests.get(url)
+        response = http_get(url)
         response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = bs4.BeautifulSoup(response.content, 'html.parser')
         articles = []
 
         # Find all <a> tags and filter for article links
@@ -966,9 +1027,9 @@ def scrape_mashable_articles(url):
 
 def get_cnet_article_content(article_url):
     try:
-        response = requests.get(article_url)
+        response = fetch_page(article_url)
         response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = bs4.BeautifulSoup(response.content, 'html.parser')
         content_element = soup.select_one('p.u-speakableText-dek.c-contentHeader_description')
         if content_element:
             return content_element.get_text(strip=True)
@@ -978,9 +1039,9 @@ def get_cnet_article_content(article_url):
 
 def get_techcrunch_article_content(article_url):
     try:
-        response = requests.get(article_url)
+        response = fetch_page(article_url)
         response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = bs4.BeautifulSoup(response.content, 'html.parser')
         content_element = soup.select_one('p#speakable-summary.wp-block-paragraph')
         if content_element:
             return content_element.get_text(strip=True)
@@ -990,9 +1051,9 @@ def get_techcrunch_article_content(article_url):
 
 def get_mashable_article_content(article_url):
     try:
-        response = requests.get(article_url)
+        response = fetch_page(article_url)
         response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = bs4.BeautifulSoup(response.content, 'html.parser')
         content_element = soup.select_one('div.mt-2.leading-tight.md\\:leading-normal.text-xl.max-w-4xl')
         if content_element:
             return content_element.get_text(strip=True)
@@ -1002,9 +1063,9 @@ def get_mashable_article_content(article_url):
 
 def scrape_pcgamer_articles(url):
     try:
-        response = requests.get(url)
+        response = http_get(url)
         response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = bs4.BeautifulSoup(response.content, 'html.parser')
         articles = []
         for item in soup.select('div.listingResult'):
             if len(articles) >= 30:
@@ -1033,41 +1094,434 @@ def scrape_pcgamer_articles(url):
     return []
 
 def check_if_exists(url):
-    file_path = "/home/webhosting/public_html/data/haberler.json"
-    if not os.path.exists(file_path):
-        return False
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            haberler = json.load(f)
-            return any(h.get('kaynak', {}).get('link') == url for h in haberler)
-    except:
+        # SQLite deposu başka süreçlerin kaydettiği haberleri de görür (indeksli arama)
+        return url in seen_urls or (sqlite_store is not None and sqlite_store.exists(url))
+    except Exception as e:
+        logging.error(f"URL indeksi okunamadı: {e}")
         return False
 
+def configure_storage(config):
+    """
+    storage_mode ayarına göre kayıt yöntemini seçer.
+    "json" (varsayılan): her haberde haberler.json baştan yazılır.
+    "journal": haberler günlüğe eklenir, arka planda haberler.json'a sıkıştırılır.
+    "sqlite": haberler WAL modundaki SQLite veritabanına eklenir (id'yi veritabanı
+    verir), arka planda haberler.json'a aktarılır.
+    archive_hot_days > 0 ise daha eski haberler döngü sonunda aylık arşiv parçalarına taşınır.
+    """
+    global journal_store, sqlite_store
+    archive.hot_days = config.get('archive_hot_days', 0)
+    archive.rotate_interval = config.get('archive_rotate_hours', 24) * 3600
+    mode = config.get('storage_mode', 'json')
+    if mode == 'journal':
+        if journal_store is None:
+            journal_store = JournalStore(HABERLER_PATH)
+        journal_store.start_background_compaction(config.get('journal_compact_interval', 60))
+    elif mode == 'sqlite':
+        if sqlite_store is None:
+            sqlite_store = open_sqlite_store(config)
+        sqlite_store.start_background_compaction(config.get('journal_compact_interval', 60))
+
+def open_sqlite_store(config):
+    return SqliteStore(
+        config.get('sqlite_path') or os.path.join(os.path.dirname(os.path.abspath(__file__)), "haberler.db"),
+        HABERLER_PATH,
+        key_func=canonicalize_url
+    )
+
+def rotate_archive(force=False):
+    """Sıcak dosyadaki eski haberleri soğuk parçalara taşır; hata döngüyü durdurmaz."""
+    try:
+        return archive.rotate(force=force)
+    except Exception as e:
+        logging.error(f"Arşiv döndürülemedi: {e}")
+        return 0
+
+def close_storage():
+    if journal_store is not None:
+        journal_store.stop_background_compaction()
+    if sqlite_store is not None:
+        sqlite_store.stop_background_compaction()
+
+def storage_mode():
+    if sqlite_store is not None:
+        return "sqlite"
+    return "journal" if journal_store is not None else "json"
+
 def save_to_json(news_data):
-    file_path = "/home/webhosting/public_html/data/haberler.json"
+    """Haberi kaydeder; yeni kayıt eklendiyse True döner."""
+    with metrics.timer("scraper_save_seconds", mode=storage_mode()):
+        return _save_to_json(news_data)
+
+def _save_to_json(news_data):
+    file_path = HABERLER_PATH
     try:
-        if os.path.exists(file_path):
-            with open(file_path, "r", encoding="utf-8") as f:
-                haberler = json.load(f)
-        else:
-            haberler = []
-        
-        # Check if already exists by original URL or title
-        if any(h.get('kaynak', {}).get('link') == news_data['kaynak']['link'] for h in haberler):
+        # Check if already exists by original URL
+        if check_if_exists(news_data['kaynak']['link']):
             logging.info(f"Haber zaten var: {news_data['baslik']}")
-            return
+            return False
+
+        if sqlite_store is not None:
+            if sqlite_store.append(news_data) is None:
+                # Aynı haberi başka bir işçi/süreç az önce kaydetti
+                seen_urls.add(news_data['kaynak']['link'])
+                logging.info(f"Haber zaten var: {news_data['baslik']}")
+                return False
+            seen_urls.add(news_data['kaynak']['link'])
+            metrics.inc("scraper_saved_total", mode="sqlite")
+            logging.info(f"Haber veritabanına başarıyla eklendi: {news_data['baslik']}")
+            return True
+
+        if journal_store is not None:
+            journal_store.append(news_data)
+            seen_urls.add(news_data['kaynak']['link'])
+            metrics.inc("scraper_saved_total", mode="journal")
+            logging.info(f"Haber günlüğe başarıyla eklendi: {news_data['baslik']}")
+            return True
+
+        # Okuma, id atama ve yazma; döndürme / toplu temizlik / sıkıştırma ile aynı kilit altında
+        with archive_lock(file_path):
+            if os.path.exists(file_path):
+                with open(file_path, "r", encoding="utf-8") as f:
+                    haberler = json.load(f)
+            else:
+                haberler = []
 
-        # New ID
-        max_id = max([h['id'] for h in haberler], default=0)
-        news_data['id'] = max_id + 1
-        
-        haberler.insert(0, news_data) # Add to top
-        
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(haberler, f, ensure_ascii=False, indent=4)
+            # New ID (soğuk parçalara taşınmış id'ler dahil)
+            max_id = max([h['id'] for h in haberler] + [archive.max_id()])
+            news_data['id'] = max_id + 1
+
+            haberler.insert(0, news_data) # Add to top
+
+            write_json_atomic(file_path, haberler)
+        seen_urls.add(news_data['kaynak']['link'])
+        metrics.inc("scraper_saved_total", mode="json")
         logging.info(f"Haber JSON'a başarıyla eklendi: {news_data['baslik']}")
+        return True
     except Exception as e:
         logging.error(f"Error saving to JSON: {e}")
+        return False
+
+# Kaynak tanımları sources.json'da; scrape fonksiyonları ilk kullanımda bu modülden çözülür
+source_registry = load_source_registry(resource_path("sources.json"), globals())
+
+def get_source_info(url):
+    """
+    Kaynak URL'sine göre görünen isim ve logo döner.
+    Dönüş: (source_name, source_logo)
+    """
+    return source_registry.source_info(url)
+
+def get_scraper(url):
+    """URL için uygun scrape fonksiyonunu döner, tanınmayan kaynaklarda None."""
+    return source_registry.scraper_for(url)
+
+def source_key(url):
+    """Metrik etiketi olarak kullanılan kaynak anahtarı (sources.json 'key')."""
+    source = source_registry.match(url)
+    return source.key if source is not None else "other"
+
+def discover_source(url):
+    """Tek bir liste/feed URL'sini tarar ve bulunan haberleri döner."""
+    logging.info(f"Scraping {url}")
+    scraper_func = get_scraper(url)
+    if scraper_func is None:
+        return []
+    try:
+        with metrics.timer("scraper_source_seconds", source=source_key(url)):
+            articles = scraper_func(url) or []
+    except Exception as e:
+        logging.error(f"Scrape error for {url}: {e}")
+        return []
+    metrics.inc("scraper_source_items_total", len(articles), source=source_key(url))
+    logging.info(f"Found {len(articles)} items in {url}")
+    return articles
+
+def clean_scrape_urls(scrape_urls):
+    """Config'deki URL'leri temizler, geçersiz olanları atlar."""
+    urls = []
+    for url in scrape_urls:
+        url = (url or "").strip().replace("`", "").strip()
+        if not re.match(r'^https?://', url):
+            logging.info(f"Geçersiz URL atlandı: {url}")
+            continue
+        urls.append(url)
+    return urls
+
+def discover_stage(url):
+    """Pipeline: kaynak URL'sini tarar, bulunan haberleri kaynak bilgisiyle işaretleyip döner."""
+    source_name, source_logo = get_source_info(url)
+    items = []
+    for item in discover_source(url):
+        if not item.get('url') or not item.get('title'):
+            continue
+        item['source_name'] = source_name
+        item['source_logo'] = source_logo
+        item['source_url'] = url
+        items.append(item)
+    return items
+
+def make_dedup_stage(new_counts, progress):
+    """
+    Pipeline: döngü içinde (kanonik URL'ye göre) ve arşivde tekrar eden haberleri eler.
+    Geçen haberler new_counts'ta kaynak URL'sine göre sayılır ve progress'e eklenir.
+    """
+    seen_keys = set()
+    lock = threading.Lock()
+
+    def dedup_stage(item):
+        key = canonicalize_url(item['url'])
+        with lock:
+            if key in seen_keys:
+                metrics.inc("scraper_duplicates_total", kind="cycle", source=source_key(item['source_url']))
+                return []
+            seen_keys.add(key)
+        # PRE-CHECK: Duplicate URL check before processing anywhere
+        if check_if_exists(item['url']):
+            metrics.inc("scraper_duplicates_total", kind="url", source=source_key(item['source_url']))
+            logging.info(f"Atlanıyor (Zaten var): {item['title'][:50]}")
+            return []
+        with lock:
+            new_counts[item['source_url']] = new_counts.get(item['source_url'], 0) + 1
+        progress.add(item['source_url'], item['url'])
+        return [item]
+
+    return dedup_stage
+
+def fetch_stage(item):
+    """Pipeline: haberin tam içeriğini ve görselini çeker."""
+    # Feed özeti yeterli olan kaynaklarda (full_content: false) sayfa çekilmez
+    if source_registry.wants_full_content(item['source_url']):
+        with source_registry.slot(item['source_url']), \
+                metrics.timer("scraper_article_seconds", source=source_key(item['source_url'])):
+            img, full_text = get_article_full_content(item['url'])
+        if not full_text:
+            full_text = item.get('content') or item['title']
+            logging.info(f"Tam içerik alınamadı, kısa özet kullanılıyor: {item['url']}")
+    else:
+        full_text = item.get('content') or item['title']
+        img = item.get('image_url')
+
+    item['full_text'] = full_text
+    item['final_img'] = img if img else item.get('image_url')
+    return [item]
+
+def clean_stage(item):
+    """Pipeline: model isteğinden önce encoding hatalarını temizler."""
+    # Clean the content before sending to Gemini
+    item['full_text'] = fix_encoding(item['full_text'])
+    item['title'] = fix_encoding(item['title'])
+    return [item]
+
+def near_dup_stage(item, progress):
+    """
+    Pipeline: zaman penceresinde başka bir kaynaktan zaten kaydedilmiş (veya
+    bu döngüde işlemde olan) aynı haberi model çağrısından önce eler. Elenen URL
+    seen_urls'e yazılmaz: ilk kopya kaydedilemezse sonraki döngüde yeniden denenir.
+    """
+    if near_dup_index is None:
+        return [item]
+    match = near_dup_index.check(item['url'], item['title'], item['full_text'])
+    if match is None:
+        return [item]
+    other_url, other_title, score = match
+    metrics.inc("scraper_duplicates_total", kind="near_dup", source=source_key(item['source_url']))
+    logging.info(f"Atlanıyor (yakın kopya, benzerlik {score:.2f}): {item['title'][:50]} ~ {other_title[:50]} ({other_url})")
+    progress.settle(item['source_url'], item['url'])
+    return []
+
+def rewrite_stage(batch, api_key, site_categories):
+    """Pipeline: hazırlanmış haberleri tek istekte yeniden yazar; (haber, sonuç) çiftleri döner."""
+    # GenAI Rewrite
+    for item in batch:
+        logging.info(f"Yapay zeka ile yeniden yazılıyor: {item['url']}{item['title'][:50]}...")
+    results = rewrite_batch_with_gemini(api_key, [(item['title'], item['full_text']) for item in batch], site_categories)
+    return list(zip(batch, results))
+
+def image_stage(pair):
+    """
+    Pipeline: kaydedilecek haberin görselini yerel, boyutu sınırlı bir türeve
+    çevirir. Bozuk / uygun olmayan görselde liste sayfasındaki görsel denenir;
+    hiçbiri yerelleştirilemezse orijinal uzak URL korunur.
+    """
+    item, result = pair
+    if image_cache is None or not result:
+        return [pair]
+    candidates = [item.get('final_img'), item.get('image_url')]
+    resolved = None
+    for url in dict.fromkeys(c for c in candidates if c):
+        with source_registry.slot(item['source_url']):
+            resolved = image_cache.localize(url)
+        if resolved:
+            break
+    if resolved:
+        item['final_img'] = resolved
+    elif not item.get('final_img'):
+        item['final_img'] = item.get('image_url')
+    return [pair]
+
+def build_news_item(item, result, site_categories):
+    """Model sonucunu haberler.json kayıt formatına çevirir; eksik alan varsa None döner."""
+    baslik = result.get('baslik')
+    icerik_out = result.get('icerik')
+    if not baslik or not icerik_out:
+        logging.info("Eksik alan (baslik/icerik) nedeniyle haber atlandı.")
+        return None
+    kisa_baslik = result.get('kisa_baslik') or baslik
+    ozet = result.get('ozet') or "boş"
+    kategori_out = normalize_category(result.get('kategori') or "Gündem", site_categories)
+    logging.info(f"Başarıyla Türkçe'ye çevrildi/yazıldı: {baslik[:50]}...")
+    return {
+        "baslik": fix_encoding(baslik),
+        "kisa_baslik": fix_encoding(kisa_baslik),
+        "ozet": fix_encoding(ozet),
+        "icerik": fix_encoding(icerik_out),
+        "resim_url": item['final_img'],
+        "kategori": kategori_out,
+        "kaynak": {
+            "isim": item['source_name'],
+            "logo": item['source_logo'],
+            "link": item['url']
+        },
+        "adult_only": False,
+        "tarih": time.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "goruntulenme": 0,
+        "begeni_sayisi": 0
+    }
+
+def persist_stage(pair, site_categories):
+    """Pipeline: model sonucunu kayıt formatına çevirip kaydeder."""
+    item, result = pair
+    if result and isinstance(result, dict):
+        news_item = build_news_item(item, result, site_categories)
+        if news_item is not None:
+            # Yakın kopya indeksine yalnızca kaydedilen haber girer
+            if save_to_json(news_item) and near_dup_index is not None:
+                near_dup_index.add(item['url'])
+            return [news_item]
+    else:
+        logging.warning(f"Gemini haberi işleyemedi: {item['title'][:50]}")
+    return []
+
+def configure_runtime(config):
+    """scraper_config.json ayarlarını tüm alt sistemlere uygular."""
+    http_client.configure(config)
+    http_client.timeout_resolver = source_registry.timeout_for
+    configure_storage(config)
+    configure_quota(config)
+    configure_rewrite_cache(config)
+    configure_near_dup(config)
+    configure_images(config)
+    configure_metrics(config)
+    feed_cache.enabled = config.get('feed_cache_enabled', True)
+    strategy_cache.revalidate_every = config.get('strategy_revalidate_every', 50)
+
+# Metrik dosyaları (configure_metrics ile ayarlanır)
+METRICS_JSON_PATH = None
+METRICS_PROM_PATH = None
+
+def configure_metrics(config):
+    """Metrikleri metrics.json / metrics.prom dosyalarına periyodik olarak yazar."""
+    global METRICS_JSON_PATH, METRICS_PROM_PATH
+    if not config.get('metrics_enabled', True):
+        METRICS_JSON_PATH = METRICS_PROM_PATH = None
+        return
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    METRICS_JSON_PATH = config.get('metrics_json_path') or os.path.join(base_dir, "metrics.json")
+    METRICS_PROM_PATH = config.get('metrics_prom_path') or os.path.join(base_dir, "metrics.prom")
+    metrics.registry.start_exporter(METRICS_JSON_PATH, METRICS_PROM_PATH, config.get('metrics_interval', 15))
+
+def export_metrics():
+    if METRICS_JSON_PATH or METRICS_PROM_PATH:
+        metrics.registry.export(METRICS_JSON_PATH, METRICS_PROM_PATH)
+
+def log_cache_stats():
+    if rewrite_cache is not None:
+        logging.info(f"Yeniden yazım önbelleği: {rewrite_cache.stats()}")
+    logging.info(f"Feed önbelleği: {feed_cache.stats()}")
+    logging.info(f"Çıkarım stratejileri: {strategy_cache.stats()}")
+    if http_client.page_cache is not None:
+        logging.info(f"Sayfa önbelleği: {http_client.page_cache.stats()}")
+    if near_dup_index is not None:
+        logging.info(f"Yakın kopya indeksi: {near_dup_index.stats()}")
+    if image_cache is not None:
+        logging.info(f"Görsel önbelleği: {image_cache.stats()}")
+
+# --profile ile ayarlanır: None kapalı, [] tüm döngü, [isimler] yalnızca bu fonksiyonlar
+PROFILE_TARGETS = None
+
+def run_cycle(config, site_categories, scrape_urls):
+    """
+    Tek tarama döngüsü çalıştırır; profilleme açıksa döngüyü veya seçilen
+    fonksiyonları cProfile ile ölçüp profiles/ altına rapor yazar.
+    Dönüş: {kaynak_url: yeni_haber_sayısı}
+    """
+    if PROFILE_TARGETS is None:
+        return _run_cycle(config, site_categories, scrape_urls)
+    from profiling import Profiler, profile_functions
+
+    profiler = Profiler(
+        config.get('profile_dir') or os.path.join(os.path.dirname(os.path.abspath(__file__)), "profiles"),
+        top_n=config.get('profile_top_n', 30)
+    )
+    try:
+        if PROFILE_TARGETS:
+            with profile_functions(globals(), PROFILE_TARGETS, profiler):
+                return _run_cycle(config, site_categories, scrape_urls)
+        with profiler.section():
+            return _run_cycle(config, site_categories, scrape_urls, stage_wrapper=profiler.wrap)
+    finally:
+        profiler.dump("functions" if PROFILE_TARGETS else "cycle")
+
+def _run_cycle(config, site_categories, scrape_urls, stage_wrapper=None):
+    """
+    Verilen kaynaklar için tek tarama döngüsü çalıştırır.
+    discover → dedup → fetch → clean → near_dup → rewrite → image → persist aşamaları sınırlı
+    kuyruklarla eşzamanlı çalışır; ağ istekleri model gecikmesiyle örtüşür.
+    Dönüş: {kaynak_url: yeni_haber_sayısı}
+    """
+    cycle_start = time.perf_counter()
+    urls = clean_scrape_urls(scrape_urls)
+    new_counts = {url: 0 for url in urls}
+    progress = FeedProgress()
+    queue_size = config.get('pipeline_queue_size', 32)
+    api_key = config['gemini_api_key']
+
+    pipeline = Pipeline(wrap=stage_wrapper)
+    pipeline.add_stage("discover", discover_stage, workers=config.get('discovery_workers', 8), queue_size=queue_size)
+    pipeline.add_stage("dedup", make_dedup_stage(new_counts, progress), queue_size=queue_size)
+    pipeline.add_stage("fetch", fetch_stage, workers=config.get('fetch_workers', 4), queue_size=queue_size)
+    pipeline.add_stage("clean", clean_stage, queue_size=queue_size)
+    pipeline.add_stage("near_dup", lambda item: near_dup_stage(item, progress), queue_size=queue_size)
+    # Kota beklemesi generate_content() içinde, kota yöneticisi tarafından yapılır
+    pipeline.add_stage(
+        "rewrite", lambda batch: rewrite_stage(batch, api_key, site_categories),
+        workers=config.get('rewrite_workers', 1), queue_size=queue_size,
+        batch_size=max(1, config.get('rewrite_batch_size', 1))
+    )
+    pipeline.add_stage("image", image_stage, workers=config.get('image_workers', 4), queue_size=queue_size)
+    pipeline.add_stage("persist", lambda pair: persist_stage(pair, site_categories), queue_size=queue_size)
+    stats = pipeline.run(urls)
+    # Feed doğrulayıcıları yalnızca haberlerinin hepsi kaydedilmiş/atlanmış feed'ler için kaydedilir
+    unfinished = progress.unfinished(check_if_exists)
+    if unfinished:
+        logging.info(f"Haberleri tamamlanamayan feed'ler sonraki döngüde yeniden işlenecek: {sorted(unfinished)}")
+    feed_cache.commit_parsed(skip=unfinished)
+    if near_dup_index is not None:
+        near_dup_index.release_pending()
+        near_dup_index.save()
+    if image_cache is not None:
+        image_cache.save()
+    rotate_archive()
+
+    metrics.observe("scraper_cycle_seconds", time.perf_counter() - cycle_start)
+
+    logging.info("Tüm siteler tarandı.")
+    logging.info(f"Pipeline: {stats}")
+    log_cache_stats()
+    export_metrics()
+    return new_counts
 
 def main():
     # Target categories from TrHaber
@@ -1079,147 +1533,88 @@ def main():
     try:
         sleep_until_after_first_quarter()
         config = load_config()
+        configure_runtime(config)
         logging.info("Yeni tarama döngüsü başlıyor...")
-        
-        for url in config['scrape_urls']:
-            logging.info(f"Scraping {url}")
-            articles = []
-            url = (url or "").strip().replace("`", "").strip()
-            if not re.match(r'^https?://', url):
-                logging.info(f"Geçersiz URL atlandı: {url}")
-                continue
-            url_lower = url.lower()
-            source_name = "Haber Merkezi"
-            source_logo = "https://cdn-icons-png.flaticon.com/512/2991/2991148.png" # Default
-            
-            if "nytimes.com" in url_lower: 
-                source_name = "The New York Times"
-                source_logo = "https://www.nytimes.com/favicon.ico"
-            elif "theverge.com" in url_lower: 
-                source_name = "The Verge"
-                source_logo = "https://www.theverge.com/favicon.ico"
-            elif "techcrunch.com" in url_lower: 
-                source_name = "TechCrunch"
-                source_logo = "https://techcrunch.com/wp-content/uploads/2015/02/tc-logo-200x200.png"
-            elif "wired.com" in url_lower: 
-                source_name = "Wired"
-                source_logo = "https://www.wired.com/favicon.ico"
-            elif "gizmodo.com" in url_lower: 
-                source_name = "Gizmodo"
-                source_logo = "https://gizmodo.com/favicon.ico"
-            elif "arstechnica.com" in url_lower: 
-                source_name = "Ars Technica"
-                source_logo = "https://arstechnica.com/favicon.ico"
-            elif "pcgamer.com" in url_lower: 
-                source_name = "PC Gamer"
-                source_logo = "https://www.pcgamer.com/favicon.ico"
-            elif "gamespot.com" in url_lower: 
-                source_name = "GameSpot"
-                source_logo = "https://www.gamespot.com/favicon.ico"
-            elif "cnet.com" in url_lower: 
-                source_name = "CNET"
-                source_logo = "https://www.cnet.com/favicon.ico"
-            elif "sciencedaily.com" in url_lower:
-                source_name = "ScienceDaily"
-                source_logo = "https://www.sciencedaily.com/favicon.ico"
-            elif "livemint.com" in url_lower:
-                source_name = "Livemint"
-                source_logo = "https://www.livemint.com/favicon.ico"
-            
-            try:
-                if "nytimes.com" in url: articles = scrape_nytimes_articles(url)
-                elif "theverge.com" in url: articles = scrape_theverge_articles(url)
-                elif "sciencedaily.com" in url: articles = scrape_sciencedaily_articles(url)
-                elif "livemint.com" in url: articles = scrape_livemint_articles(url)
-                elif "pcgamer.com" in url: articles = scrape_pcgamer_articles(url)
-                elif "gamespot.com" in url: articles = scrape_gamespot_feed(url)
-                elif "gizmodo.com" in url: articles = scrape_gizmodo_articles(url)
-                elif "arstechnica.com" in url: articles = scrape_arstechnica_articles(url)
-                elif "techcrunch.com" in url: articles = scrape_techcrunch_articles(url)
-                elif "wired.com" in url: articles = scrape_wired_articles(url)
-                elif "cnet.com" in url: articles = scrape_cnet_articles(url)
-            except Exception as e:
-                logging.error(f"Scrape error for {url}: {e}")
-                continue
-
-            logging.info(f"Found {len(articles)} items. Processing titles...")
-            
-            for item in articles:
-                # PRE-CHECK: Duplicate URL check before processing anywhere
-                if check_if_exists(item['url']):
-                    logging.info(f"Atlanıyor (Zaten var): {item['title'][:50]}")
-                    continue
-                
-                if not ("gamespot.com" in item['url']):
-                    
-                    if ("nytimes.com" in item['url']):
-                        img = item.get('image_url')
-                        full_text = item.get('content') or item['title']
-                    else:
-                        img, full_text = get_article_full_content(item['url'])
-                        if not full_text:
-                            full_text = item.get('content') or item['title']
-                            logging.info(f"Tam içerik alınamadı, kısa özet kullanılıyor: {item['url']}")
-                else:
-                    full_text = item.get('content')
-                    img = item.get('image_url')
-                    
-                # Clean the content before sending to Gemini
-                full_text = fix_encoding(full_text)
-                item['title'] = fix_encoding(item['title'])
-                
-                final_img = img if img else item.get('image_url')
-
-                # GenAI Rewrite
-                logging.info(f"Yapay zeka ile yeniden yazılıyor: {item['url']}{item['title'][:50]}...")
-                
-                result = rewrite_with_gemini(config['gemini_api_key'], item['title'], full_text, site_categories)
-                
-
-
-                #result = rewrite_with_gemini(config['gemini_api_key'], item['title'], full_text, site_categories)
-                
-                if result and isinstance(result, dict):
-                    baslik = result.get('baslik')
-                    icerik_out = result.get('icerik')
-                    if not baslik or not icerik_out:
-                        logging.info("Eksik alan (baslik/icerik) nedeniyle haber atlandı.")
-                        continue
-                    kisa_baslik = result.get('kisa_baslik') or baslik
-                    ozet = result.get('ozet') or "boş"
-                    kategori_out = normalize_category(result.get('kategori') or "Gündem", site_categories)
-                    logging.info(f"Başarıyla Türkçe'ye çevrildi/yazıldı: {baslik[:50]}...")
-                    news_item = {
-                        "baslik": fix_encoding(baslik),
-                        "kisa_baslik": fix_encoding(kisa_baslik),
-                        "ozet": fix_encoding(ozet),
-                        "icerik": fix_encoding(icerik_out),
-                        "resim_url": final_img,
-                        "kategori": kategori_out,
-                        "kaynak": {
-                            "isim": source_name,
-                            "logo": source_logo,
-                            "link": item['url']
-                        },
-                        "adult_only": False,
-                        "tarih": time.strftime("%Y-%m-%dT%H:%M:%SZ"),
-                        "goruntulenme": 0,
-                        "begeni_sayisi": 0
-                    }
-                    save_to_json(news_item)
-                    
-                    # Kotayı korumak için 60 saniye bekle (dakikada 1 haber)
-                    logging.info("Kotayı korumak için 60 saniye bekleniyor...")
-                    time.sleep(60)
-                else:
-                    logging.warning(f"Gemini haberi işleyemedi: {item['title'][:50]}")
-
-        logging.info("Tüm siteler tarandı.")
+        run_cycle(config, site_categories, config['scrape_urls'])
         
         
     except Exception as e:
         logging.error(f"Kritik hata: {e}")
         time.sleep(60) # Hata sonrası biraz bekle
+    finally:
+        close_storage()
+
+def run_daemon():
+    """
+    Sürekli çalışan mod: süreç ve önbellek durumu döngüler arasında bellekte kalır,
+    her kaynak kendi uyarlanabilir aralığıyla taranır.
+    """
+    site_categories = load_site_categories()
+    config = load_config()
+    configure_runtime(config)
+    scheduler = SourceScheduler(
+        clean_scrape_urls(config['scrape_urls']),
+        min_interval=config.get('daemon_min_interval', 300),
+        max_interval=config.get('daemon_max_interval', 7200),
+        initial_interval=config.get('daemon_initial_interval', 900),
+        target_new_items=config.get('daemon_target_new_items', 3)
+    )
+    logging.info(f"Daemon modu başlatıldı: {len(scheduler.sources)} kaynak")
+    try:
+        while True:
+            due = scheduler.due_sources()
+            if due:
+                logging.info(f"Yeni tarama döngüsü başlıyor: {len(due)} kaynak")
+                try:
+                    new_counts = run_cycle(config, site_categories, due)
+                except Exception as e:
+                    logging.error(f"Kritik hata: {e}")
+                    new_counts = {}
+                now = time.time()
+                for url in due:
+                    interval = scheduler.record(url, new_counts.get(url, 0), now)
+                    logging.info(f"{url}: {new_counts.get(url, 0)} yeni haber, sonraki tarama {interval / 60:.0f} dk sonra")
+            time.sleep(max(1, min(scheduler.seconds_until_next(), 60)))
+    except KeyboardInterrupt:
+        logging.info("Daemon modu durduruluyor...")
+    finally:
+        close_storage()
 
 if __name__ == "__main__":
-    main()
+    import argparse
+    parser = argparse.ArgumentParser(description="TrHaber haber scraper")
+    parser.add_argument("--daemon", action="store_true", help="Kaynakları uyarlanabilir aralıklarla sürekli tarar")
+    parser.add_argument("--rebuild-index", action="store_true", help="Görülen URL indeksini haberler.json'dan yeniden oluşturur ve çıkar")
+    parser.add_argument("--compact", action="store_true", help="Haber günlüğünü haberler.json'a sıkıştırır ve çıkar")
+    parser.add_argument(
+        "--export-snapshot", nargs="?", const=HABERLER_PATH, metavar="YOL",
+        help="storage_mode sqlite: veritabanını YOL'a yazar ve çıkar (archive_hot_days varsa yalnızca sıcak günler). YOL mevcut haberler.json ise site değişiklikleri korunur, yalnızca yeni haberler eklenir"
+    )
+    parser.add_argument(
+        "--migrate-archive", nargs="?", type=int, const=-1, metavar="GUN",
+        help="haberler.json'u sıcak dosya (son GUN gün, varsayılan archive_hot_days) + aylık soğuk parçalara böler ve çıkar"
+    )
+    parser.add_argument(
+        "--profile", nargs="*", metavar="FONKSIYON",
+        help="Döngüyü cProfile ile ölçer; fonksiyon adı verilirse (ör. get_article_full_content save_to_json) yalnızca onları"
+    )
+    args = parser.parse_args()
+    configure_logging()
+    PROFILE_TARGETS = args.profile
+    if args.rebuild_index:
+        seen_urls.rebuild()
+    elif args.compact:
+        JournalStore(HABERLER_PATH).compact()
+    elif args.export_snapshot:
+        config = load_config()
+        open_sqlite_store(config).export_snapshot(args.export_snapshot, since_days=config.get('archive_hot_days') or None)
+    elif args.migrate_archive is not None:
+        archive.hot_days = args.migrate_archive if args.migrate_archive > 0 else load_config().get('archive_hot_days') or 30
+        # Bekleyen günlük kayıtları önce haberler.json'a alınır
+        JournalStore(HABERLER_PATH).compact()
+        moved = archive.rotate(force=True)
+        logging.info(f"Arşiv taşıma tamamlandı: {moved} haber taşındı, {len(archive.read_manifest()['shards'])} aylık parça ({archive.cold_dir})")
+    elif args.daemon:
+        run_daemon()
+    else:
+        main()
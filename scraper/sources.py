@@ -0,0 +1,116 @@
+import importlib
+import json
+import threading
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
+
+DEFAULT_NAME = "Haber Merkezi"
+DEFAULT_LOGO = "https://cdn-icons-png.flaticon.com/512/2991/2991148.png"
+
+
+def host_of(url):
+    return urlsplit(url or "").netloc.lower().split(":")[0]
+
+
+class Source:
+    """
+    sources.json'daki tek bir kaynak tanımı.
+
+    hosts: eşleşen alan adları (alt alan adları dahil), scraper: scrape
+    fonksiyonunun adı ya da "modül:fonksiyon", full_content: makale sayfası
+    çekilip tam metin çıkarılsın mı, concurrency: kaynak başına eşzamanlı
+    sayfa isteği sınırı, timeout: kaynak başına HTTP zaman aşımı (saniye).
+    """
+
+    def __init__(self, entry):
+        self.key = entry['key']
+        self.hosts = [h.lower() for h in entry.get('hosts', [])]
+        self.name = entry.get('name', DEFAULT_NAME)
+        self.logo = entry.get('logo', DEFAULT_LOGO)
+        self.scraper = entry.get('scraper')
+        self.full_content = entry.get('full_content', True)
+        self.concurrency = entry.get('concurrency')
+        self.timeout = entry.get('timeout')
+        self._semaphore = threading.BoundedSemaphore(self.concurrency) if self.concurrency else None
+
+    def matches(self, host):
+        return any(host == h or host.endswith("." + h) for h in self.hosts)
+
+
+class SourceRegistry:
+    """
+    Kaynak URL'sinden isim, logo, scrape fonksiyonu ve kaynak ayarlarına
+    giden bildirimsel kayıt. Host eşleşmeleri önbelleğe alınır; scrape
+    fonksiyonları ilk kullanımda çözülür.
+
+    namespace: "modül:" öneki olmayan scraper adlarının aranacağı sözlük
+    (scraper.py kendi globals()'ını verir).
+    """
+
+    def __init__(self, entries, namespace=None):
+        self.sources = [Source(entry) for entry in entries]
+        self.namespace = namespace or {}
+        self._by_host = {}
+        self._scrapers = {}
+        self._lock = threading.Lock()
+
+    def match(self, url):
+        """URL'nin ait olduğu kaynağı döner, tanınmayan URL'lerde None."""
+        host = host_of(url)
+        try:
+            return self._by_host[host]
+        except KeyError:
+            pass
+        source = next((s for s in self.sources if s.matches(host)), None)
+        self._by_host[host] = source
+        return source
+
+    def source_info(self, url):
+        """Dönüş: (source_name, source_logo)"""
+        source = self.match(url)
+        if source is None:
+            return DEFAULT_NAME, DEFAULT_LOGO
+        return source.name, source.logo
+
+    def _resolve(self, name):
+        if ":" in name:
+            module_name, attr = name.split(":", 1)
+            return getattr(importlib.import_module(module_name), attr)
+        return self.namespace[name]
+
+    def scraper_for(self, url):
+        """URL için scrape fonksiyonunu döner, tanınmayan kaynaklarda None."""
+        source = self.match(url)
+        if source is None or not source.scraper:
+            return None
+        with self._lock:
+            func = self._scrapers.get(source.key)
+            if func is None:
+                func = self._scrapers[source.key] = self._resolve(source.scraper)
+        return func
+
+    def wants_full_content(self, url):
+        source = self.match(url)
+        return source is None or source.full_content
+
+    def timeout_for(self, url):
+        """Kaynağa özel zaman aşımı, tanımlı değilse None."""
+        source = self.match(url)
+        return source.timeout if source is not None else None
+
+    @contextmanager
+    def slot(self, url):
+        """Kaynağın concurrency sınırı kadar eşzamanlı isteğe izin verir."""
+        source = self.match(url)
+        semaphore = source._semaphore if source is not None else None
+        if semaphore is None:
+            yield
+            return
+        with semaphore:
+            yield
+
+
+def load_source_registry(path, namespace=None):
+    with open(path, "r", encoding="utf-8") as f:
+        return SourceRegistry(json.load(f).get('sources', []), namespace)
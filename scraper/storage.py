@@ -0,0 +1,776 @@
+import gzip
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+
+try:
+    import fcntl
+except ImportError:  # Windows: süreçler arası kilit yok, sadece thread kilidi
+    fcntl = None
+
+
+def write_json_atomic(path, data, indent=4):
+    """JSON'u geçici dosyaya yazıp atomik olarak yerine taşır; yarım yazılmış dosya okunmaz."""
+    tmp_path = f"{path}.tmp.{os.getpid()}"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=indent)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def evict_cache_dir(cache_dir, suffix, max_age, max_bytes):
+    """
+    Dosya başına kayıt tutan önbellek dizinini süpürür: max_age saniyeden eski
+    suffix uzantılı dosyaları, ardından toplam boyut max_bytes'ı aşıyorsa en
+    uzun süredir erişilmeyenleri (LRU) siler. Dönüş: silinen dosya sayısı
+    """
+    now = time.time()
+    entries = []
+    total = 0
+    removed = 0
+    for name in os.listdir(cache_dir):
+        if not name.endswith(suffix):
+            continue
+        path = os.path.join(cache_dir, name)
+        try:
+            stat = os.stat(path)
+            if now - stat.st_mtime > max_age:
+                os.remove(path)
+                removed += 1
+                continue
+        except OSError:
+            continue
+        entries.append((stat.st_atime, stat.st_size, path))
+        total += stat.st_size
+    if total <= max_bytes:
+        return removed
+    entries.sort()
+    for _, size, path in entries:
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+            total -= size
+            removed += 1
+        except OSError:
+            pass
+    return removed
+
+
+def iter_json_array(path, chunk_size=1 << 20, raw=False):
+    """
+    Bir JSON dizisinin öğelerini dosyanın tamamını belleğe almadan sırayla döner.
+    Dosya chunk_size karakterlik parçalar halinde okunur. raw=True ise her öğenin
+    ayrıştırılmış hali yerine ham JSON metni döner (başka süreçte işlemek için).
+    """
+    decoder = json.JSONDecoder()
+    with open(path, "r", encoding="utf-8") as f:
+        buf = f.read(chunk_size)
+        eof = not buf
+        pos = 0
+        started = False
+        while True:
+            while pos < len(buf) and (buf[pos].isspace() or (started and buf[pos] == ",")):
+                pos += 1
+            if pos >= len(buf):
+                if eof:
+                    raise ValueError(f"JSON dizisi beklenmedik şekilde bitti: {path}")
+                chunk = f.read(chunk_size)
+                eof = not chunk
+                buf, pos = buf[pos:] + chunk, 0
+                continue
+            if not started:
+                if buf[pos] != "[":
+                    raise ValueError(f"JSON dizisi değil: {path}")
+                started = True
+                pos += 1
+                continue
+            if buf[pos] == "]":
+                return
+            try:
+                item, end = decoder.raw_decode(buf, pos)
+            except ValueError:
+                end = None
+            # Parça sonunda kesilmiş öğe: devamını okuyup yeniden dene
+            if end is None or (end == len(buf) and not eof):
+                if eof:
+                    raise ValueError(f"Bozuk JSON dizisi: {path}")
+                chunk = f.read(chunk_size)
+                eof = not chunk
+                buf, pos = buf[pos:] + chunk, 0
+                continue
+            yield buf[pos:end] if raw else item
+            pos = end
+
+
+class JsonArrayWriter:
+    """
+    JSON dizisini öğe öğe geçici dosyaya yazar; commit() ile atomik olarak
+    yerine taşır, discard() ile hedefe dokunmadan siler. Çıktı
+    json.dump(liste, indent=indent) ile aynıdır.
+    """
+
+    def __init__(self, path, indent=4):
+        self.path = path
+        self.indent = indent
+        self.tmp_path = f"{path}.tmp.{os.getpid()}"
+        self.count = 0
+        self._f = open(self.tmp_path, "w", encoding="utf-8")
+
+    def write(self, item):
+        self.write_text(json.dumps(item, ensure_ascii=False, indent=self.indent))
+
+    def write_text(self, text):
+        """json.dumps(öğe, indent=indent) çıktısını diziye ekler."""
+        prefix = " " * self.indent
+        self._f.write(("[\n" if self.count == 0 else ",\n") + prefix + text.replace("\n", "\n" + prefix))
+        self.count += 1
+
+    def commit(self):
+        self._f.write("\n]" if self.count else "[]")
+        self._f.flush()
+        os.fsync(self._f.fileno())
+        self._f.close()
+        os.replace(self.tmp_path, self.path)
+
+    def discard(self):
+        self._f.close()
+        if os.path.exists(self.tmp_path):
+            os.remove(self.tmp_path)
+
+
+class FileLock:
+    """Aynı süreçteki thread'ler ve (destekleniyorsa) diğer süreçler için dosya kilidi."""
+
+    def __init__(self, path):
+        self.path = path
+        self._thread_lock = threading.RLock()
+        self._fh = None
+        self._depth = 0
+
+    def __enter__(self):
+        self._thread_lock.acquire()
+        if self._depth == 0 and fcntl is not None:
+            self._fh = open(self.path, "a")
+            fcntl.flock(self._fh, fcntl.LOCK_EX)
+        self._depth += 1
+        return self
+
+    def __exit__(self, *exc):
+        self._depth -= 1
+        if self._depth == 0 and self._fh is not None:
+            fcntl.flock(self._fh, fcntl.LOCK_UN)
+            self._fh.close()
+            self._fh = None
+        self._thread_lock.release()
+
+
+# Normalize kilit yolu -> FileLock; süreç içindeki herkes aynı thread kilidini paylaşır
+_archive_locks = {}
+_archive_locks_guard = threading.Lock()
+
+
+def archive_lock(archive_path):
+    """
+    haberler.json'u yeniden yazan her işlemin (günlük sıkıştırma, arşiv
+    döndürme, SQLite dışa aktarımı, toplu temizlik) paylaştığı dosya kilidi.
+    Aynı yol için her çağrı aynı FileLock nesnesini döner; fcntl olmayan
+    sistemlerde de süreç içi dışlama sağlanır.
+    """
+    path = os.path.normcase(os.path.abspath(os.path.splitext(archive_path)[0] + ".lock"))
+    with _archive_locks_guard:
+        lock = _archive_locks.get(path)
+        if lock is None:
+            lock = _archive_locks[path] = FileLock(path)
+        return lock
+
+
+class _BackgroundCompaction:
+    """compact() metodunu arka plan thread'inde periyodik çalıştıran ortak kısım."""
+
+    def _compaction_loop(self, interval):
+        while not self._stop.wait(interval):
+            try:
+                self.compact()
+            except Exception as e:
+                logging.error(f"Günlük sıkıştırma hatası: {e}")
+
+    def start_background_compaction(self, interval=60):
+        """Belirtilen aralıkla compact() çalıştıran arka plan thread'ini başlatır."""
+        if self._compactor is not None:
+            return
+        self._stop.clear()
+        self._compactor = threading.Thread(target=self._compaction_loop, args=(interval,), daemon=True)
+        self._compactor.start()
+
+    def stop_background_compaction(self):
+        """Arka plan thread'ini durdurur ve kalan kayıtları son bir kez birleştirir."""
+        if self._compactor is not None:
+            self._stop.set()
+            self._compactor.join()
+            self._compactor = None
+        self.compact()
+
+
+class JournalStore(_BackgroundCompaction):
+    """
+    haberler.json için yalnızca-ekleme (append-only) günlük deposu.
+
+    Her yeni haber haberler.journal.jsonl dosyasına tek satır olarak eklenir,
+    id sayacı haberler.id dosyasında tutulur; böylece kayıt maliyeti arşiv
+    boyutundan bağımsızdır. compact() günlükteki kayıtları haberler.json
+    anlık görüntüsüne birleştirir ve dosyayı atomik rename ile değiştirir.
+    """
+
+    def __init__(self, archive_path):
+        self.archive_path = archive_path
+        base = os.path.splitext(archive_path)[0]
+        self.journal_path = base + ".journal.jsonl"
+        self.pending_path = base + ".journal.compacting"
+        self.id_path = base + ".id"
+        self._lock = archive_lock(archive_path)
+        self._id_checked = False
+        self._compactor = None
+        self._stop = threading.Event()
+
+    def _initial_max_id(self):
+        # Soğuk parçalara taşınmış id'ler de yeniden verilmemeli
+        max_id = ShardedArchive(self.archive_path).max_id()
+        if os.path.exists(self.archive_path):
+            with open(self.archive_path, "r", encoding="utf-8") as f:
+                max_id = max([max_id] + [h.get('id', 0) for h in json.load(f)])
+        for record in self._read_journal(self.pending_path) + self._read_journal(self.journal_path):
+            max_id = max(max_id, record.get('id', 0))
+        return max_id
+
+    def next_id(self):
+        """
+        Sidecar dosyadaki sayacı bir artırır ve yeni id'yi döner. Depo açıldıktan
+        sonraki ilk çağrıda sayaç sıcak dosya, arşiv ve günlükteki en büyük id ile
+        karşılaştırılır; başka kayıt modunda ya da sitede eklenen haberlerden sonra
+        eskimiş bir sidecar mevcut id'leri yeniden vermez.
+        """
+        with self._lock:
+            current = 0
+            if os.path.exists(self.id_path):
+                with open(self.id_path, "r") as f:
+                    current = int(f.read().strip() or 0)
+            if not self._id_checked or not current:
+                current = max(current, self._initial_max_id())
+                self._id_checked = True
+            new_id = current + 1
+            tmp_path = self.id_path + ".tmp"
+            with open(tmp_path, "w") as f:
+                f.write(str(new_id))
+            os.replace(tmp_path, self.id_path)
+            return new_id
+
+    def append(self, news_data):
+        """Haberi id atayarak günlüğe ekler ve atanan id'yi döner."""
+        with self._lock:
+            news_data['id'] = self.next_id()
+            line = json.dumps(news_data, ensure_ascii=False)
+            with open(self.journal_path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+        return news_data['id']
+
+    @staticmethod
+    def _read_journal(path):
+        records = []
+        if not os.path.exists(path):
+            return records
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    # Çökme sırasında yarım kalmış son satır
+                    logging.info(f"Günlükte bozuk satır atlandı: {path}")
+        return records
+
+    def compact(self):
+        """
+        Günlükteki kayıtları haberler.json'un başına ekler (en yeni en üstte).
+        Dönüş: birleştirilen kayıt sayısı
+        """
+        with self._lock:
+            # Yarım kalmış bir önceki sıkıştırma yoksa günlüğü kenara al; yeni eklemeler boş günlüğe gider
+            if not os.path.exists(self.pending_path):
+                if not os.path.exists(self.journal_path) or os.path.getsize(self.journal_path) == 0:
+                    return 0
+                os.replace(self.journal_path, self.pending_path)
+            records = self._read_journal(self.pending_path)
+
+            if os.path.exists(self.archive_path):
+                with open(self.archive_path, "r", encoding="utf-8") as f:
+                    haberler = json.load(f)
+            else:
+                haberler = []
+            existing_ids = {h.get('id') for h in haberler}
+            new_records = [r for r in records if r.get('id') not in existing_ids]
+            new_records.reverse()
+            haberler = new_records + haberler
+
+            write_json_atomic(self.archive_path, haberler)
+            os.remove(self.pending_path)
+        if new_records:
+            logging.info(f"Günlük sıkıştırıldı: {len(new_records)} haber haberler.json'a eklendi")
+        return len(new_records)
+
+
+def record_time(record):
+    """Kaydın 'tarih' alanını Unix zamanına çevirir; yoksa / çözülemezse None."""
+    value = record.get('tarih')
+    if not isinstance(value, str) or not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.strip().replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def _record_key(record):
+    return record.get('id') if record.get('id') is not None else record.get('kaynak', {}).get('link')
+
+
+class ShardedArchive:
+    """
+    haberler.json için sıcak/soğuk katmanlı düzen.
+
+    haberler.json (sıcak dosya) yalnızca son hot_days günün haberlerini tutar;
+    scraper ve site her istekte yalnızca bunu okur. Daha eski haberler rotate()
+    ile arsiv/ altındaki aylık gzip'li parçalara (haberler-YYYY-MM.json.gz, en
+    yeni önce) taşınır. arsiv/manifest.json her parçanın kayıt sayısını, id
+    ve tarih aralığını ve arşivdeki en büyük id'yi tutar; id ile arama yalnızca
+    aralığı tutan parçayı açar. Parçalar yalnızca döndürme sırasında yazılır.
+    """
+
+    def __init__(self, archive_path, hot_days=0, rotate_interval=24 * 3600):
+        self.archive_path = archive_path
+        self.hot_days = hot_days
+        self.rotate_interval = rotate_interval
+        self.cold_dir = os.path.join(os.path.dirname(archive_path), "arsiv")
+        self.manifest_path = os.path.join(self.cold_dir, "manifest.json")
+        self._lock = archive_lock(archive_path)
+
+    def read_manifest(self):
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {'version': 1, 'max_id': 0, 'shards': []}
+
+    def shard_path(self, month):
+        return os.path.join(self.cold_dir, f"haberler-{month}.json.gz")
+
+    def read_shard(self, month):
+        try:
+            with gzip.open(self.shard_path(month), "rt", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return []
+
+    def max_id(self):
+        """Soğuk parçalardaki en büyük id; yeni id'ler bunun altına düşmemeli."""
+        return self.read_manifest().get('max_id', 0)
+
+    def iter_records(self):
+        """Önce sıcak dosyadaki, sonra soğuk parçalardaki kayıtlar (yeniden eskiye)."""
+        if os.path.exists(self.archive_path):
+            yield from iter_json_array(self.archive_path)
+        for shard in self.read_manifest()['shards']:
+            yield from self.read_shard(shard['month'])
+
+    def find(self, news_id):
+        """id ile kayıt arar; sıcak dosyada yoksa yalnızca id aralığı tutan parçalara bakar."""
+        if os.path.exists(self.archive_path):
+            for record in iter_json_array(self.archive_path):
+                if record.get('id') == news_id:
+                    return record
+        for shard in self.read_manifest()['shards']:
+            if shard.get('min_id') is not None and shard['min_id'] <= news_id <= shard['max_id']:
+                for record in self.read_shard(shard['month']):
+                    if record.get('id') == news_id:
+                        return record
+        return None
+
+    def _write_shard(self, month, records):
+        path = self.shard_path(month)
+        tmp_path = f"{path}.tmp.{os.getpid()}"
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+            json.dump(records, f, ensure_ascii=False, separators=(",", ":"))
+        with open(tmp_path, "rb") as f:
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+    def _merge_shard(self, month, spill_path):
+        """Taşınan kayıtları ayın parçasıyla birleştirir (aynı id'de yeni gelen kazanır)."""
+        merged = {_record_key(r): r for r in self.read_shard(month)}
+        with open(spill_path, "r", encoding="utf-8") as f:
+            for line in f:
+                record = json.loads(line)
+                merged[_record_key(record)] = record
+        records = sorted(merged.values(), key=lambda r: (str(r.get('tarih', '')), r.get('id') or 0), reverse=True)
+        self._write_shard(month, records)
+        ids = [r['id'] for r in records if isinstance(r.get('id'), int)]
+        dates = [r['tarih'] for r in records if r.get('tarih')]
+        return {
+            'month': month,
+            'file': os.path.basename(self.shard_path(month)),
+            'count': len(records),
+            'min_id': min(ids, default=None),
+            'max_id': max(ids, default=None),
+            'from': min(dates, default=None),
+            'to': max(dates, default=None),
+        }
+
+    def rotate(self, now=None, force=False):
+        """
+        hot_days günden eski kayıtları sıcak dosyadan aylık parçalara taşır.
+        Sıcak dosya akış halinde okunur, taşınan kayıtlar ay başına geçici
+        dosyalara dökülür; bellek kullanımı en büyük ayın boyutuyla sınırlıdır.
+        force değilse en fazla rotate_interval saniyede bir çalışır.
+        Dönüş: taşınan kayıt sayısı
+        """
+        if not self.hot_days or not os.path.exists(self.archive_path):
+            return 0
+        now = time.time() if now is None else now
+        with self._lock:
+            manifest = self.read_manifest()
+            if not force and now - manifest.get('rotated_at', 0) < self.rotate_interval:
+                return 0
+            cutoff = now - self.hot_days * 86400
+            os.makedirs(self.cold_dir, exist_ok=True)
+            state = os.stat(self.archive_path).st_mtime_ns
+            hot = JsonArrayWriter(self.archive_path, indent=4)
+            spills = {}
+            moved = 0
+            try:
+                for record in iter_json_array(self.archive_path):
+                    ts = record_time(record)
+                    # Tarihi okunamayan kayıtlar sıcak dosyada kalır
+                    if ts is None or ts >= cutoff:
+                        hot.write(record)
+                        continue
+                    month = time.strftime("%Y-%m", time.gmtime(ts))
+                    if month not in spills:
+                        spills[month] = open(os.path.join(self.cold_dir, f".spill-{month}.{os.getpid()}"), "w", encoding="utf-8")
+                    spills[month].write(json.dumps(record, ensure_ascii=False) + "\n")
+                    moved += 1
+                for f in spills.values():
+                    f.close()
+
+                manifest['rotated_at'] = now
+                if not moved:
+                    hot.discard()
+                    write_json_atomic(self.manifest_path, manifest, indent=2)
+                    return 0
+                if os.stat(self.archive_path).st_mtime_ns != state:
+                    hot.discard()
+                    logging.info("Arşiv döndürme sırasında haberler.json değişti, sonraki döngüde tekrar denenecek")
+                    return 0
+
+                shards = {s['month']: s for s in manifest['shards']}
+                for month, f in spills.items():
+                    shards[month] = self._merge_shard(month, f.name)
+                manifest['shards'] = sorted(shards.values(), key=lambda s: s['month'], reverse=True)
+                manifest['max_id'] = max([manifest.get('max_id', 0)] + [s['max_id'] for s in shards.values() if s['max_id'] is not None])
+                manifest['hot_days'] = self.hot_days
+                # Önce parçalar ve manifest, sonra sıcak dosya: arada çökme olursa
+                # kayıtlar iki yerde bulunur, sonraki döndürmede id ile birleşir
+                write_json_atomic(self.manifest_path, manifest, indent=2)
+                hot.commit()
+            except BaseException:
+                hot.discard()
+                raise
+            finally:
+                for f in spills.values():
+                    f.close()
+                    if os.path.exists(f.name):
+                        os.remove(f.name)
+        logging.info(f"Arşiv döndürüldü: {moved} haber {len(spills)} aylık parçaya taşındı, sıcak dosyada {hot.count} haber kaldı")
+        return moved
+
+
+class SqliteStore(_BackgroundCompaction):
+    """
+    Haberler için SQLite (WAL) deposu.
+
+    Her haber tek satırdır: tam kayıt JSON olarak data sütununda, kanonik kaynak
+    linki (benzersiz), normalize tarih ve kategori indeksli sütunlarda tutulur.
+    Ekleme BEGIN IMMEDIATE işleminde yapılır, id veritabanının AUTOINCREMENT
+    sayacından gelir; aynı linki aynı anda kaydetmeye çalışan iki işçi/süreçten
+    yalnızca biri başarılı olur. WAL modunda okuyucular yazarı beklemez.
+
+    Site haberler.json okumaya devam eder: compact() son dışa aktarımdan sonra
+    eklenen satırları haberler.json'un başına ekler (sitenin yaptığı beğeni,
+    görüntülenme, düzenleme ve silme değişiklikleri korunur). haberler.json
+    veritabanından baştan yalnızca dosya yoksa üretilir (export_snapshot()).
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS haberler (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            link TEXT,
+            tarih TEXT,
+            kategori TEXT,
+            data TEXT NOT NULL
+        );
+        CREATE UNIQUE INDEX IF NOT EXISTS haberler_link ON haberler (link);
+        CREATE INDEX IF NOT EXISTS haberler_tarih ON haberler (tarih);
+        CREATE INDEX IF NOT EXISTS haberler_kategori ON haberler (kategori, tarih);
+        CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+    """
+
+    def __init__(self, db_path, archive_path, key_func=None, busy_timeout=30):
+        self.db_path = db_path
+        self.archive_path = archive_path
+        self.key_func = key_func or (lambda url: url)
+        self.busy_timeout = busy_timeout
+        self._local = threading.local()
+        self._lock = archive_lock(archive_path)
+        self._init_lock = threading.Lock()
+        self._initialized = False
+        self._compactor = None
+        self._stop = threading.Event()
+
+    def _conn(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            # isolation_level=None: işlemler açıkça BEGIN/COMMIT ile yönetilir
+            conn = sqlite3.connect(self.db_path, timeout=self.busy_timeout, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        if not self._initialized:
+            self._initialize(conn)
+        return conn
+
+    def _initialize(self, conn):
+        with self._init_lock:
+            if self._initialized:
+                return
+            conn.executescript(self.SCHEMA)
+            if conn.execute("SELECT COUNT(*) FROM meta WHERE key = 'exported_id'").fetchone()[0] == 0:
+                self.import_json(conn)
+            else:
+                self._sync_sequence(conn)
+            self._initialized = True
+
+    def _file_max_id(self):
+        """haberler.json ve soğuk arşivdeki en büyük id."""
+        max_id = ShardedArchive(self.archive_path).max_id()
+        if os.path.exists(self.archive_path):
+            for record in iter_json_array(self.archive_path):
+                max_id = max(max_id, record.get('id') or 0)
+        return max_id
+
+    def _sync_sequence(self, conn):
+        """
+        Veritabanı dışında (json / journal modu, site) verilmiş id'ler varsa
+        AUTOINCREMENT sayacını bunların üstüne taşır; yeni satırlar mevcut
+        id'lerle çakışmaz.
+        """
+        file_max = self._file_max_id()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute("SELECT seq FROM sqlite_sequence WHERE name = 'haberler'").fetchone()
+            seq = row[0] if row else 0
+            if file_max > seq:
+                conn.execute("DELETE FROM sqlite_sequence WHERE name = 'haberler'")
+                conn.execute("INSERT INTO sqlite_sequence (name, seq) VALUES ('haberler', ?)", (file_max,))
+                logging.info(f"SQLite id sayacı {seq} -> {file_max} (haberler.json / arşiv ile eşitlendi)")
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    @staticmethod
+    def _tarih_key(record):
+        ts = record_time(record)
+        return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(ts)) if ts is not None else None
+
+    def _row(self, record):
+        link = record.get('kaynak', {}).get('link')
+        return self.key_func(link) if link else None, self._tarih_key(record), record.get('kategori')
+
+    def import_json(self, conn=None):
+        """
+        Veritabanı ilk oluşturulurken haberler.json ve soğuk arşiv parçalarındaki
+        kayıtları id'leriyle aktarır; sayaç bunların ve manifest'teki en büyük
+        id'nin üstünden devam eder. Dönüş: aktarılan kayıt sayısı
+        """
+        conn = conn or self._conn()
+        archive = ShardedArchive(self.archive_path)
+        imported = 0
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for record in archive.iter_records():
+                link, tarih, kategori = self._row(record)
+                cur = conn.execute(
+                    "INSERT OR IGNORE INTO haberler (id, link, tarih, kategori, data) VALUES (?, ?, ?, ?, ?)",
+                    (record.get('id'), link, tarih, kategori, json.dumps(record, ensure_ascii=False))
+                )
+                imported += cur.rowcount
+            max_id = max(conn.execute("SELECT COALESCE(MAX(id), 0) FROM haberler").fetchone()[0], archive.max_id())
+            conn.execute("DELETE FROM sqlite_sequence WHERE name = 'haberler'")
+            conn.execute("INSERT INTO sqlite_sequence (name, seq) VALUES ('haberler', ?)", (max_id,))
+            # Aktarılan kayıtlar haberler.json'da zaten var, dışa aktarım buradan başlar
+            conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('exported_id', ?)", (str(max_id),))
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        if imported:
+            logging.info(f"SQLite deposu haberler.json'dan oluşturuldu: {imported} kayıt")
+        return imported
+
+    def exists(self, url):
+        """Kanonik link indeksinde arama."""
+        key = self.key_func(url)
+        return self._conn().execute("SELECT 1 FROM haberler WHERE link = ?", (key,)).fetchone() is not None
+
+    def append(self, news_data):
+        """
+        Haberi tek işlemde ekler ve veritabanının verdiği id'yi atar.
+        Dönüş: yeni id; aynı link zaten kayıtlıysa None
+        """
+        conn = self._conn()
+        link, tarih, kategori = self._row(news_data)
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            cur = conn.execute(
+                "INSERT OR IGNORE INTO haberler (link, tarih, kategori, data) VALUES (?, ?, ?, '')",
+                (link, tarih, kategori)
+            )
+            if cur.rowcount == 0:
+                conn.execute("ROLLBACK")
+                return None
+            news_data['id'] = cur.lastrowid
+            conn.execute("UPDATE haberler SET data = ? WHERE id = ?", (json.dumps(news_data, ensure_ascii=False), news_data['id']))
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return news_data['id']
+
+    def _exported_id(self, conn):
+        row = conn.execute("SELECT value FROM meta WHERE key = 'exported_id'").fetchone()
+        return int(row[0]) if row else 0
+
+    def compact(self):
+        """
+        Son dışa aktarımdan sonra eklenen haberleri haberler.json'un başına ekler.
+        Dosyada aynı linkle zaten bulunan satırlar atlanır. id'si dosyada başka
+        bir habere ait satıra (ör. mod değişikliğinden sonra) yeni id verilir ve
+        veritabanında da güncellenir. Dönüş: eklenen kayıt sayısı
+        """
+        conn = self._conn()
+        with self._lock:
+            exported_id = self._exported_id(conn)
+            rows = conn.execute("SELECT id, link, data FROM haberler WHERE id > ? ORDER BY id", (exported_id,)).fetchall()
+            if not rows:
+                return 0
+            if os.path.exists(self.archive_path):
+                with open(self.archive_path, "r", encoding="utf-8") as f:
+                    haberler = json.load(f)
+            else:
+                haberler = []
+            existing_ids = {h.get('id') for h in haberler}
+            existing_links = {self._row(h)[0] for h in haberler} - {None}
+            new_records = []
+            next_id = None
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                for news_id, link, data in rows:
+                    if link is not None and link in existing_links:
+                        continue
+                    record = json.loads(data)
+                    if news_id in existing_ids:
+                        if next_id is None:
+                            seq = conn.execute("SELECT seq FROM sqlite_sequence WHERE name = 'haberler'").fetchone()
+                            next_id = max([seq[0] if seq else 0, ShardedArchive(self.archive_path).max_id()]
+                                          + [i for i in existing_ids if isinstance(i, int)])
+                        next_id += 1
+                        logging.warning(f"SQLite haber id'si {news_id} haberler.json'da başka habere ait, {next_id} olarak yeniden atandı: {record.get('baslik')}")
+                        record['id'] = next_id
+                        conn.execute("UPDATE haberler SET id = ?, data = ? WHERE id = ?",
+                                     (next_id, json.dumps(record, ensure_ascii=False), news_id))
+                    new_records.append(record)
+                if next_id is not None:
+                    conn.execute("DELETE FROM sqlite_sequence WHERE name = 'haberler'")
+                    conn.execute("INSERT INTO sqlite_sequence (name, seq) VALUES ('haberler', ?)", (next_id,))
+                conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('exported_id', ?)",
+                             (str(max(rows[-1][0], next_id or 0)),))
+                if new_records:
+                    new_records.sort(key=lambda r: r['id'], reverse=True)
+                    write_json_atomic(self.archive_path, new_records + haberler)
+                conn.execute("COMMIT")
+            except BaseException:
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+                raise
+        if new_records:
+            logging.info(f"SQLite deposundan {len(new_records)} haber haberler.json'a eklendi")
+        return len(new_records)
+
+    def export_snapshot(self, path=None, since_days=None):
+        """
+        Veritabanındaki haberleri path'e (varsayılan haberler.json) yazar, en
+        yeni en üstte. Mevcut haberler.json baştan yazılmaz: sitenin değiştirdiği
+        alanlar, sildiği ve eklediği haberler korunarak yalnızca dosyada olmayan
+        yeni satırlar compact() ile başa eklenir. Dosya yoksa ya da başka bir yola
+        (yedek) yazılıyorsa tamamı üretilir. since_days yalnızca başka bir yola
+        yazarken uygulanır; haberler.json'dan eski haberleri parçalara taşımak
+        rotate()'in işidir. Dönüş: yazılan / eklenen kayıt sayısı
+        """
+        path = path or self.archive_path
+        is_hot_file = os.path.abspath(path) == os.path.abspath(self.archive_path)
+        if is_hot_file and os.path.exists(path):
+            added = self.compact()
+            logging.info(f"haberler.json mevcut, yalnızca yeni haberler eklendi: {added} kayıt")
+            return added
+        conn = self._conn()
+        query = "SELECT id, data FROM haberler"
+        params = ()
+        if since_days and not is_hot_file:
+            query += " WHERE tarih >= ?"
+            params = (time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(time.time() - since_days * 86400)),)
+        query += " ORDER BY tarih DESC, id DESC"
+        with self._lock:
+            writer = JsonArrayWriter(path, indent=4)
+            try:
+                # Okuma tek işlemde: dışa aktarım sırasında eklenen satırlar bir sonraki compact()'e kalır
+                conn.execute("BEGIN")
+                exported_id = conn.execute("SELECT COALESCE(MAX(id), 0) FROM haberler").fetchone()[0]
+                for _, data in conn.execute(query, params):
+                    writer.write(json.loads(data))
+                conn.execute("COMMIT")
+                writer.commit()
+            except BaseException:
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+                writer.discard()
+                raise
+            if is_hot_file:
+                conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('exported_id', ?)", (str(exported_id),))
+        logging.info(f"haberler.json SQLite deposundan yeniden üretildi: {writer.count} kayıt ({path})")
+        return writer.count
+
+    def stats(self):
+        conn = self._conn()
+        count, max_id = conn.execute("SELECT COUNT(*), COALESCE(MAX(id), 0) FROM haberler").fetchone()
+        return {"records": count, "max_id": max_id, "exported_id": self._exported_id(conn)}
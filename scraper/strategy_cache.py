@@ -0,0 +1,105 @@
+import json
+import logging
+import os
+import threading
+import time
+from urllib.parse import urlsplit
+
+from storage import write_json_atomic
+
+
+def domain_of(url):
+    netloc = urlsplit(url).netloc.lower()
+    return netloc[4:] if netloc.startswith('www.') else netloc
+
+
+class ExtractionStrategyCache:
+    """
+    Alan adı başına hangi URL varyantının (canonical, /amp, ?output=amp) ve hangi
+    paragraf seçicisinin içerik ürettiğini öğrenir ve diske kaydeder.
+
+    Sonraki makalelerde kazanan varyant ve seçici önce denenir. Her
+    revalidate_every kullanımda bir veya max_age saniye geçince varsayılan
+    sıra ile tam deneme yapılarak kayıt yeniden doğrulanır.
+    """
+
+    def __init__(self, path, revalidate_every=50, max_age=24 * 3600):
+        self.path = path
+        self.revalidate_every = revalidate_every
+        self.max_age = max_age
+        self._entries = None
+        self._lock = threading.Lock()
+        self.first_try_hits = 0
+        self.fallbacks = 0
+
+    def _load(self):
+        if self._entries is not None:
+            return
+        self._entries = {}
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    self._entries = json.load(f)
+            except (OSError, ValueError) as e:
+                logging.info(f"Çıkarım stratejisi kaydı okunamadı, sıfırdan başlanıyor: {e}")
+
+    def _save(self):
+        try:
+            write_json_atomic(self.path, self._entries, indent=2)
+        except OSError as e:
+            logging.error(f"Çıkarım stratejisi kaydı yazılamadı: {e}")
+
+    def plan(self, url, variants, selectors):
+        """
+        Denenecek varyant ve seçici sırasını döner.
+        variants: [(isim, url), ...], selectors: [(isim, xpath), ...]
+        Dönüş: (variants, selectors, öğrenilmiş_sıra_kullanıldı_mı)
+        """
+        domain = domain_of(url)
+        with self._lock:
+            self._load()
+            entry = self._entries.get(domain)
+            if entry is None:
+                return variants, selectors, False
+            entry['uses'] = entry.get('uses', 0) + 1
+            stale = time.time() - entry.get('validated', 0) > self.max_age
+            if stale or entry['uses'] % self.revalidate_every == 0:
+                return variants, selectors, False
+        variants = sorted(variants, key=lambda v: v[0] != entry.get('variant'))
+        selectors = sorted(selectors, key=lambda s: s[0] != entry.get('selector'))
+        return variants, selectors, True
+
+    def record(self, url, variant, selector, learned_first_try=False):
+        """İçerik üreten varyant ve seçiciyi kaydeder."""
+        domain = domain_of(url)
+        with self._lock:
+            self._load()
+            entry = self._entries.get(domain, {})
+            if learned_first_try:
+                self.first_try_hits += 1
+            changed = entry.get('variant') != variant or entry.get('selector') != selector
+            entry.update({'variant': variant, 'selector': selector})
+            if not learned_first_try:
+                entry['validated'] = time.time()
+            self._entries[domain] = entry
+            if changed or not learned_first_try:
+                self._save()
+
+    def record_miss(self, url):
+        """Öğrenilmiş strateji içerik üretemediğinde bir sonraki denemede tam doğrulama yapılmasını sağlar."""
+        domain = domain_of(url)
+        with self._lock:
+            self._load()
+            entry = self._entries.get(domain)
+            self.fallbacks += 1
+            if entry is not None:
+                entry['validated'] = 0
+                self._save()
+
+    def stats(self):
+        with self._lock:
+            return {
+                "domains": len(self._entries or {}),
+                "first_try_hits": self.first_try_hits,
+                "fallbacks": self.fallbacks
+            }
@@ -0,0 +1,87 @@
+import json
+import os
+import sys
+import tempfile
+import time
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from storage import JournalStore, ShardedArchive, SqliteStore  # noqa: E402
+
+
+class RotatedArchiveIdTest(unittest.TestCase):
+    """Tüm haberler soğuk parçalara taşındıktan sonra id'ler yeniden başlamamalı."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.archive_path = os.path.join(self.tmp.name, "haberler.json")
+        old = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(time.time() - 90 * 86400))
+        records = [{'id': i, 'baslik': f"Haber {i}", 'tarih': old} for i in range(5, 0, -1)]
+        with open(self.archive_path, "w", encoding="utf-8") as f:
+            json.dump(records, f)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_ids_continue_after_full_rotation(self):
+        archive = ShardedArchive(self.archive_path, hot_days=30)
+        self.assertEqual(archive.rotate(force=True), 5)
+        with open(self.archive_path, "r", encoding="utf-8") as f:
+            self.assertEqual(json.load(f), [])
+        self.assertEqual(archive.max_id(), 5)
+
+        store = JournalStore(self.archive_path)
+        self.assertEqual(store.append({'baslik': "Yeni haber"}), 6)
+        store.compact()
+        with open(self.archive_path, "r", encoding="utf-8") as f:
+            self.assertEqual([h['id'] for h in json.load(f)], [6])
+        self.assertEqual(archive.find(3)['baslik'], "Haber 3")
+
+    def test_stale_id_sidecar_is_ignored(self):
+        # Sidecar başka bir kayıt modundan kalmış; sıcak dosyada id 5'e kadar haber var
+        with open(os.path.join(self.tmp.name, "haberler.id"), "w") as f:
+            f.write("2")
+        store = JournalStore(self.archive_path)
+        self.assertEqual(store.next_id(), 6)
+        self.assertEqual(store.next_id(), 7)
+
+
+
+class SqliteExportTest(unittest.TestCase):
+    """Mod değişikliğinden sonra SQLite satırları kaybolmamalı, site değişiklikleri korunmalı."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.archive_path = os.path.join(self.tmp.name, "haberler.json")
+        self.db_path = os.path.join(self.tmp.name, "haberler.db")
+        self._write([{'id': 1, 'baslik': "Eski", 'kaynak': {'link': "https://a/1"}}])
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _write(self, records):
+        with open(self.archive_path, "w", encoding="utf-8") as f:
+            json.dump(records, f)
+
+    def _read(self):
+        with open(self.archive_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def test_export_keeps_site_changes_and_new_ids_after_json_mode(self):
+        SqliteStore(self.db_path, self.archive_path).stats()
+        # json modunda id 2 eklendi, site id 1'i düzenledi
+        haberler = self._read()
+        haberler[0]['goruntulenme'] = 42
+        self._write([{'id': 2, 'baslik': "Json modu", 'kaynak': {'link': "https://a/2"}}] + haberler)
+
+        store = SqliteStore(self.db_path, self.archive_path)
+        self.assertEqual(store.append({'baslik': "Yeni", 'kaynak': {'link': "https://a/3"}}), 3)
+        self.assertEqual(store.export_snapshot(), 1)
+        haberler = self._read()
+        self.assertEqual([h['id'] for h in haberler], [3, 2, 1])
+        self.assertEqual(haberler[2]['goruntulenme'], 42)
+
+
+if __name__ == "__main__":
+    unittest.main()
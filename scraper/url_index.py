@@ -0,0 +1,101 @@
+import logging
+import os
+import threading
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+from storage import ShardedArchive
+
+
+# Haberin kimliğini değiştirmeyen, sadece izleme amaçlı query parametreleri
+TRACKING_PARAMS = {
+    'fbclid', 'gclid', 'dclid', 'msclkid', 'mc_cid', 'mc_eid', 'cmpid', 'ref', 'ref_src',
+    'src', 'guccounter', 'guce_referrer', 'guce_referrer_sig', 'taid', 'mbid',
+    'output', 'amp', 'comments', 'itm_source', 'itm_medium', 'itm_campaign', 'itm_content'
+}
+TRACKING_PREFIXES = ('utm_', '_ga', 'mkt_', 'pk_')
+
+
+def canonicalize_url(url):
+    """
+    Aynı haberin farklı URL varyantlarını tek bir anahtara indirger.
+    http/https, www., /amp ve ?output=amp sürümleri, izleme parametreleri,
+    fragment ve sondaki / farkları yok sayılır.
+    """
+    if not url:
+        return ""
+    parts = urlsplit(url.strip())
+    netloc = parts.netloc.lower()
+    if netloc.startswith('www.'):
+        netloc = netloc[4:]
+    path = parts.path or '/'
+    if path.endswith('/amp') or path.endswith('/amp/'):
+        path = path.rstrip('/')[:-len('/amp')]
+    path = path.rstrip('/') or '/'
+    query = [
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if k.lower() not in TRACKING_PARAMS and not k.lower().startswith(TRACKING_PREFIXES)
+    ]
+    query.sort()
+    return urlunsplit(('https', netloc, path, urlencode(query), ''))
+
+
+class SeenUrlIndex:
+    """
+    haberler.json'daki (ve soğuk arşiv parçalarındaki) kaynak linklerinin kalıcı, kanonik URL indeksi.
+    Süreç başına bir kez yüklenir; her kayıtta dosyaya tek satır eklenir.
+    İndeks dosyası yoksa haberler.json'dan yeniden oluşturulur.
+    """
+
+    def __init__(self, index_path, archive_path):
+        self.index_path = index_path
+        self.archive_path = archive_path
+        self._urls = None
+        self._lock = threading.Lock()
+
+    def _load(self):
+        if os.path.exists(self.index_path):
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                self._urls = {line.strip() for line in f if line.strip()}
+        else:
+            self.rebuild()
+
+    def rebuild(self):
+        """İndeksi haberler.json ve arşiv parçalarından sıfırdan oluşturur ve dosyaya yazar."""
+        urls = set()
+        try:
+            for h in ShardedArchive(self.archive_path).iter_records():
+                link = h.get('kaynak', {}).get('link')
+                if link:
+                    urls.add(canonicalize_url(link))
+        except Exception as e:
+            logging.error(f"URL indeksi için haberler.json okunamadı: {e}")
+        tmp_path = self.index_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for u in sorted(urls):
+                f.write(u + "\n")
+        os.replace(tmp_path, self.index_path)
+        self._urls = urls
+        logging.info(f"URL indeksi yeniden oluşturuldu: {len(urls)} kayıt")
+
+    def __contains__(self, url):
+        with self._lock:
+            if self._urls is None:
+                self._load()
+            return canonicalize_url(url) in self._urls
+
+    def add(self, url):
+        key = canonicalize_url(url)
+        with self._lock:
+            if self._urls is None:
+                self._load()
+            if key in self._urls:
+                return
+            self._urls.add(key)
+            with open(self.index_path, "a", encoding="utf-8") as f:
+                f.write(key + "\n")
+
+    def __len__(self):
+        with self._lock:
+            if self._urls is None:
+                self._load()
+            return len(self._urls)
@@ -2,6 +2,7 @@ const express = require('express');
 
 const path = require('path');
 const fs = require('fs');
+const zlib = require('zlib');
 const app = express();
 const PORT = 3000;
 const { generateSitemap } = require('./creator');
@@ -41,6 +42,73 @@ const writeData = (filename, data) => {
     }
 };
 
+// Helper: Cold news archive
+// The scraper keeps only the last N days in haberler.json; older news lives in
+// data/arsiv/haberler-YYYY-MM.json.gz shards (newest first) listed in manifest.json.
+// Shards are read-only here; likes/views/edits only apply to news in haberler.json.
+const ARCHIVE_DIR = path.join(__dirname, 'data', 'arsiv');
+const SHARD_CACHE_SIZE = 3;
+const shardCache = new Map();
+
+const readManifest = () => {
+    const filePath = path.join(ARCHIVE_DIR, 'manifest.json');
+    if (!fs.existsSync(filePath)) return { shards: [] };
+    try {
+        return JSON.parse(fs.readFileSync(filePath, 'utf8'));
+    } catch (err) {
+        console.error('Error reading archive manifest:', err);
+        return { shards: [] };
+    }
+};
+
+const readShard = (shard) => {
+    const filePath = path.join(ARCHIVE_DIR, shard.file);
+    try {
+        const mtime = fs.statSync(filePath).mtimeMs;
+        const cached = shardCache.get(shard.file);
+        if (cached && cached.mtime === mtime) return cached.records;
+        const records = JSON.parse(zlib.gunzipSync(fs.readFileSync(filePath)).toString('utf8'));
+        shardCache.delete(shard.file);
+        shardCache.set(shard.file, { mtime, records });
+        if (shardCache.size > SHARD_CACHE_SIZE) shardCache.delete(shardCache.keys().next().value);
+        return records;
+    } catch (err) {
+        console.error(`Error reading archive shard ${shard.file}:`, err);
+        return [];
+    }
+};
+
+// Looks up news by id in haberler.json first, then only in shards whose id range matches
+const findNewsByIds = (ids, haberler = readData('haberler.json')) => {
+    const wanted = new Set(ids);
+    const found = haberler.filter(h => wanted.has(h.id));
+    found.forEach(h => wanted.delete(h.id));
+    for (const shard of readManifest().shards || []) {
+        if (wanted.size === 0) break;
+        if (![...wanted].some(id => shard.min_id <= id && id <= shard.max_id)) continue;
+        for (const h of readShard(shard)) {
+            if (wanted.has(h.id)) {
+                found.push(h);
+                wanted.delete(h.id);
+            }
+        }
+    }
+    return found;
+};
+
+// Filtered news, newest first; cold shards are opened only until `needed` items are collected
+const readNewsUntil = (needed, predicate = () => true) => {
+    let items = readData('haberler.json').filter(predicate);
+    const shards = readManifest().shards || [];
+    let next = 0;
+    while (items.length < needed && next < shards.length) {
+        items = items.concat(readShard(shards[next]).filter(predicate));
+        next++;
+    }
+    const remaining = shards.slice(next).reduce((sum, s) => sum + (s.count || 0), 0);
+    return { items, exhausted: next >= shards.length, remaining };
+};
+
 // --- ROUTES ---
 
 app.get('/', (req, res) => {
@@ -205,8 +273,7 @@ app.get('/api/market-data', async (req, res) => {
 // Get News by ID
 app.get('/api/haberler/:id', (req, res) => {
     const newsId = parseInt(req.params.id);
-    const haberler = readData('haberler.json');
-    const newsItem = haberler.find(h => h.id === newsId);
+    const [newsItem] = findNewsByIds([newsId]);
 
     if (newsItem) {
         res.json({ data: newsItem });
@@ -251,7 +318,19 @@ app.get('/api/haberler', (req, res) => {
     const category = req.query.category;
     const followingStr = req.query.following; // Comma separated list of users to filter by
 
-    let haberler = readData('haberler.json');
+    // Don't apply category filter when viewing following feed
+    const followingList = followingStr ? followingStr.split(',') : null;
+    const matches = (h) => {
+        if (followingList) return !!(h.kaynak && followingList.includes(h.kaynak.isim));
+        return !category || h.kategori === category;
+    };
+
+    // Older pages are served from the cold archive shards
+    const endIndex = page * limit;
+    // One extra match tells whether a next page exists
+    const { items, remaining } = readNewsUntil(endIndex + 1, matches);
+    let haberler = items;
+
     const kaynaklar = readData('kaynaklar.json');
     const kaynakLogoMap = kaynaklar.reduce((map, kaynak) => {
         map[kaynak.isim] = kaynak.logo;
@@ -265,17 +344,6 @@ app.get('/api/haberler', (req, res) => {
         return haber;
     });
 
-
-    // Don't apply category filter when viewing following feed
-    if (category && !followingStr) {
-        haberler = haberler.filter(h => h.kategori === category);
-    }
-
-    if (followingStr) {
-        const followingList = followingStr.split(',');
-        haberler = haberler.filter(h => h.kaynak && followingList.includes(h.kaynak.isim));
-    }
-
     // Add reading time to each news item (avg 200 words per minute)
     haberler = haberler.map(h => {
         const wordCount = h.icerik ? h.icerik.split(/\s+/).length : 0;
@@ -284,14 +352,14 @@ app.get('/api/haberler', (req, res) => {
     });
 
     const startIndex = (page - 1) * limit;
-    const endIndex = page * limit;
     const results = haberler.slice(startIndex, endIndex);
 
     res.json({
         data: results,
-        total: haberler.length,
+        // Unfiltered counts of unopened shards come from the manifest; filtered ones are unknown
+        total: haberler.length + (category || followingList ? 0 : remaining),
         page: page,
-        hasMore: endIndex < haberler.length
+        hasMore: haberler.length > endIndex
     });
 });
 
@@ -365,14 +433,15 @@ app.get('/api/user/history/:username', (req, res) => {
     console.log(`[DEBUG] User "${username}" FOUND`);
 
     const haberler = readData('haberler.json');
-    const likedNews = haberler.filter(h => user.begendigi_haberler && user.begendigi_haberler.includes(h.id));
+    const likedNews = findNewsByIds(user.begendigi_haberler || [], haberler);
 
     // Comments
     const yorumlar = readData('yorumlar.json');
     const userComments = yorumlar.filter(c => c.kullanici_adi === username);
     // Enrich comments with news title
+    const commentedNews = findNewsByIds(userComments.map(c => c.haber_id), haberler);
     const enrichedComments = userComments.map(c => {
-        const news = haberler.find(h => h.id === c.haber_id);
+        const news = commentedNews.find(h => h.id === c.haber_id);
         return { ...c, haber_baslik: news ? news.baslik : 'Silinmiş Haber' };
     });
 
@@ -855,8 +924,7 @@ app.get('/api/user/saved/:username', (req, res) => {
 
     if (!user) return res.status(404).json({ success: false });
 
-    const haberler = readData('haberler.json');
-    const savedNews = haberler.filter(h => (user.saved_articles || []).includes(h.id));
+    const savedNews = findNewsByIds(user.saved_articles || []);
 
     res.json({ success: true, savedNews });
 });